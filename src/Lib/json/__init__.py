@@ -97,13 +97,23 @@ Using json.tool from the shell to validate and pretty-print::
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
+    'dump', 'dumps', 'dumpb', 'load', 'loads', 'iterparse', 'iter_items',
+    'dump_lines', 'load_lines', 'load_mmap', 'build_index', 'extract',
+    'validate', 'loads_columns',
     'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+import io
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+from .decoder import JSONDecoder, JSONDecodeError, DEFAULT_BUFSIZE
+from .decoder import detect_encoding
 from .encoder import JSONEncoder
 
 
@@ -122,9 +132,14 @@ _default_encoder = JSONEncoder(
 #
 def dump(obj, fp, skipkeys=False, ensure_ascii=True, check_circular=True,
         allow_nan=True, cls=None, indent=None, separators=None,
-        default=None, sort_keys=False, **kw):
+        default=None, sort_keys=False, bufsize=DEFAULT_BUFSIZE, **kw):
     """Serialize ``obj`` as a JSON formatted stream to ``fp`` (a
-    ``.write()``-supporting file-like object).
+    ``.write()``-supporting text or binary file-like object).
+
+    Encoded chunks are joined and written about ``bufsize`` characters at
+    a time, so an unbuffered file or a socket gets a few large writes
+    instead of one per token. Text is written to a binary file, i.e. an
+    ``io.RawIOBase`` or ``io.BufferedIOBase`` instance, as UTF-8.
 
     If ``skipkeys`` is true then ``dict`` keys that are not basic types
     (``str``, ``int``, ``float``, ``bool``, ``None``) will be skipped
@@ -164,37 +179,48 @@ def dump(obj, fp, skipkeys=False, ensure_ascii=True, check_circular=True,
     the ``cls`` kwarg; otherwise ``JSONEncoder`` is used.
 
     """
-    # If arguments given can use default encoder.
-    #
-    # cached encoder
-    if (not skipkeys and ensure_ascii and
-        check_circular and allow_nan and
-        cls is None and indent is None and separators is None and
-        default is None and not sort_keys and not kw):
+    # Get encoder with given arguments
+    encoder = _get_encoder(skipkeys, ensure_ascii, check_circular, allow_nan,
+                           cls, indent, separators, default, sort_keys, kw)
 
-        # Get iterable of encoded chunks
-        iterable = _default_encoder.iterencode(obj)
+    # Get iterable of encoded chunks
+    iterable = encoder.iterencode(obj)
 
-    # If arguments given can not use default encoder
-    else:
-        # If encoder is not given
-        if cls is None:
-            # Use default encoder
-            cls = JSONEncoder
+    # Get function writing text to file
+    write = _get_write(fp)
 
-        # Get iterable of encoded chunks
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
-            check_circular=check_circular, allow_nan=allow_nan, indent=indent,
-            separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
+    # A list of encoded chunks not written yet
+    chunks = []
 
-    # For each encoded chunk.
-    #
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
+    # Cache append function
+    chunks_append = chunks.append
+
+    # Number of characters not written yet
+    size = 0
+
+    # For each encoded chunk
     for chunk in iterable:
-        # Write the encoded chunk to file
-        fp.write(chunk)
+        # Add the chunk to chunks list
+        chunks_append(chunk)
+
+        # Increment number of characters not written yet
+        size += len(chunk)
+
+        # If number of characters not written reaches buffer size
+        if size >= bufsize:
+            # Write the chunks to file
+            write(''.join(chunks))
+
+            # Clear chunks list
+            del chunks[:]
+
+            # Reset number of characters not written yet
+            size = 0
+
+    # If have chunks not written
+    if chunks:
+        # Write the chunks to file
+        write(''.join(chunks))
 
 
 def dumps(obj, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -240,6 +266,146 @@ def dumps(obj, skipkeys=False, ensure_ascii=True, check_circular=True,
     the ``cls`` kwarg; otherwise ``JSONEncoder`` is used.
 
     """
+    # Get encoder with given arguments
+    encoder = _get_encoder(skipkeys, ensure_ascii, check_circular, allow_nan,
+                           cls, indent, separators, default, sort_keys, kw)
+
+    # Encode given object into JSON data.
+    # Return the JSON data.
+    return encoder.encode(obj)
+
+
+#
+def dumpb(obj, skipkeys=False, ensure_ascii=True, check_circular=True,
+        allow_nan=True, cls=None, indent=None, separators=None,
+        default=None, sort_keys=False, **kw):
+    """Serialize ``obj`` to JSON formatted UTF-8 ``bytes``, e.g. for an HTTP
+    response body.
+
+    The result equals ``dumps(obj).encode('utf-8')``, but a full copy of
+    the document is saved where possible, see ``JSONEncoder.encode_bytes``.
+
+    The arguments have the same meaning as in ``dump``.
+
+    """
+    # Get encoder with given arguments
+    encoder = _get_encoder(skipkeys, ensure_ascii, check_circular, allow_nan,
+                           cls, indent, separators, default, sort_keys, kw)
+
+    # Encode given object into JSON data bytes.
+    # Return the JSON data bytes.
+    return encoder.encode_bytes(obj)
+
+
+#
+def dump_lines(objs, fp, skipkeys=False, ensure_ascii=True,
+        check_circular=True, allow_nan=True, cls=None, separators=None,
+        default=None, sort_keys=False, bufsize=DEFAULT_BUFSIZE, **kw):
+    """Serialize each object of iterable ``objs`` as one line of JSON to
+    ``fp`` (a ``.write()``-supporting text or binary file-like object), i.e.
+    JSON Lines or NDJSON.
+
+    One encoder is used for all objects, and encoded lines are joined and
+    written about ``bufsize`` characters at a time.
+
+    The other arguments have the same meaning as in ``dump``. There is no
+    ``indent`` argument since a document must not span lines.
+
+    """
+    # Get encoder with given arguments
+    encoder = _get_encoder(skipkeys, ensure_ascii, check_circular, allow_nan,
+                           cls, None, separators, default, sort_keys, kw)
+
+    # Get encode function
+    encode = encoder.encode
+
+    # Get function writing text to file
+    write = _get_write(fp)
+
+    # A list of encoded lines not written yet
+    lines = []
+
+    # Cache append function
+    lines_append = lines.append
+
+    # Number of characters not written yet
+    size = 0
+
+    # For each object
+    for obj in objs:
+        # Encode the object into a line
+        line = encode(obj)
+
+        # Add the line to lines list
+        lines_append(line)
+
+        # Increment number of characters not written yet
+        size += len(line) + 1
+
+        # If number of characters not written reaches buffer size
+        if size >= bufsize:
+            # Add an empty line to end the last line with newline
+            lines_append('')
+
+            # Write the lines to file
+            write('\n'.join(lines))
+
+            # Clear lines list
+            del lines[:]
+
+            # Reset number of characters not written yet
+            size = 0
+
+    # If have lines not written
+    if lines:
+        # Add an empty line to end the last line with newline
+        lines_append('')
+
+        # Write the lines to file
+        write('\n'.join(lines))
+
+
+#
+def _get_write(fp):
+    # Get function writing text to given file.
+    #
+    # @param fp: A text or binary file-like object.
+    #
+    # @return: Function writing text to the file. For binary file, text is
+    # encoded as UTF-8.
+
+    # Get file's write function
+    write = fp.write
+
+    # If the file is binary file.
+    #
+    # The mode is not checked, as writers of "codecs.open" have binary mode
+    # but take text.
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        # Create function encoding text to write to binary file
+        def write_bytes(text):
+            # Encode the text as UTF-8.
+            # Lone surrogates, which only occur with "ensure_ascii" false,
+            # are encoded as is, same as the decoder reads them back.
+            # Write to file.
+            return write(text.encode('utf-8', 'surrogatepass'))
+
+        # Return the function
+        return write_bytes
+
+    # Return file's write function
+    return write
+
+
+#
+def _get_encoder(skipkeys, ensure_ascii, check_circular, allow_nan, cls,
+        indent, separators, default, sort_keys, kw):
+    # Get encoder for arguments given to "dump" or "dumps".
+    #
+    # @param kw: Keywords dict for encoder constructor.
+    #
+    # @return: Encoder object.
+
     # If arguments given can use default encoder.
     #
     # cached encoder
@@ -247,9 +413,8 @@ def dumps(obj, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        # Encode given object into JSON data.
-        # Return the JSON data.
-        return _default_encoder.encode(obj)
+        # Return default encoder
+        return _default_encoder
 
     # If arguments given can not use default encoder.
 
@@ -258,12 +423,13 @@ def dumps(obj, skipkeys=False, ensure_ascii=True, check_circular=True,
         # Use default encoder
         cls = JSONEncoder
 
-    # Encode given object into JSON data
+    # Create encoder.
+    # Return the encoder.
     return cls(
         skipkeys=skipkeys, ensure_ascii=ensure_ascii,
         check_circular=check_circular, allow_nan=allow_nan, indent=indent,
         separators=separators, default=default, sort_keys=sort_keys,
-        **kw).encode(obj)
+        **kw)
 
 
 # Create default decoder
@@ -272,9 +438,10 @@ _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
 #
 def load(fp, cls=None, object_hook=None, parse_float=None,
-        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
-    """Deserialize ``fp`` (a ``.read()``-supporting file-like object containing
-    a JSON document) to a Python object.
+        parse_int=None, parse_constant=None, object_pairs_hook=None,
+        bufsize=None, **kw):
+    """Deserialize ``fp`` (a ``.read()``-supporting text or binary file-like
+    object containing a JSON document) to a Python object.
 
     ``object_hook`` is an optional function that will be called with the
     result of any object literal decode (a ``dict``). The return value of
@@ -289,23 +456,299 @@ def load(fp, cls=None, object_hook=None, parse_float=None,
     collections.OrderedDict will remember the order of insertion). If
     ``object_hook`` is also defined, the ``object_pairs_hook`` takes priority.
 
+    ``bufsize``, if specified, makes ``fp`` be read ``bufsize`` characters
+    at a time with ``fp.read(size)`` and decoded incrementally by
+    ``JSONDecoder.decode_stream``, so the whole document text is never held
+    in memory. Bytes read from a binary file are decoded as UTF-8, UTF-16 or
+    UTF-32, detected from the first bytes. Otherwise the whole text is read
+    with ``fp.read()`` and decoded by ``loads``.
+
+    To use a custom ``JSONDecoder`` subclass, specify it with the ``cls``
+    kwarg; otherwise ``JSONDecoder`` is used.
+
+    """
+    # If the JSON data is not read chunk by chunk
+    if bufsize is None:
+        # Reads JSON data from given file.
+        # Call "loads" to decode the JSON data.
+        return loads(fp.read(),
+            cls=cls, object_hook=object_hook,
+            parse_float=parse_float, parse_int=parse_int,
+            parse_constant=parse_constant,
+            object_pairs_hook=object_pairs_hook, **kw)
+
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+
+    # Read JSON data from given file chunk by chunk.
+    # Decode the JSON data into Python object.
+    # Return the Python object.
+    return decoder.decode_stream(fp, bufsize)
+
+
+#
+def load_mmap(path, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None,
+        bufsize=DEFAULT_BUFSIZE, **kw):
+    """Deserialize the file at ``path`` (a file containing a JSON document
+    encoded as UTF-8, UTF-16 or UTF-32) to a Python object.
+
+    The file is memory-mapped and decoded ``bufsize`` bytes at a time, so
+    pages are read on demand, and processes decoding the same file share its
+    pages in the OS page cache instead of each holding a copy of its text.
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+
+    # With file context
+    with open(path, 'rb') as fp:
+        #
+        try:
+            # If memory mapping is not supported on this platform
+            if mmap is None:
+                # Let code below handle
+                raise ValueError('mmap is not available')
+
+            # Map the file into memory
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # If the file can not be mapped, e.g. it is empty
+        except ValueError:
+            # Decode JSON data read from the file.
+            # Return the Python object.
+            return decoder.decode_stream(fp, bufsize)
+
+        # With mapped file context.
+        #
+        # Mapped file's "read" returns copies of read bytes only, so no
+        # buffer export prevents it from being closed.
+        with mm:
+            # Decode JSON data read from the mapped file chunk by chunk.
+            # Return the Python object.
+            return decoder.decode_stream(mm, bufsize)
+
+
+#
+def load_lines(fp, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None,
+        bufsize=DEFAULT_BUFSIZE, **kw):
+    """Deserialize each line of ``fp`` (a ``.read()``-supporting file-like
+    object containing one JSON document per line, i.e. JSON Lines or
+    NDJSON), and yield the resulting Python objects. Blank lines are
+    skipped.
+
+    One decoder is used for all lines, and ``fp`` is read ``bufsize``
+    characters at a time. A ``JSONDecodeError`` reports the line number in
+    ``fp``.
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+
+    # Decode JSON data of each line.
+    # Return the iterator of Python objects.
+    return decoder.decode_lines(fp, bufsize)
+
+
+#
+def iterparse(s_or_fp, cls=None, parse_float=None, parse_int=None,
+        parse_constant=None, bufsize=DEFAULT_BUFSIZE, **kw):
+    """Parse ``s_or_fp`` (a ``str`` or bytes-like object, or a
+    ``.read()``-supporting file-like object containing a JSON document) and
+    yield an ``(event, value, position)`` tuple for each token.
+
+    ``event`` is one of ``'start_map'``, ``'map_key'``, ``'end_map'``,
+    ``'start_array'``, ``'end_array'``, ``'null'``, ``'boolean'``,
+    ``'number'`` and ``'string'``. No dicts or lists are built, so values of
+    interest can be picked out of a huge document in constant memory::
+
+        >>> import json
+        >>> list(json.iterparse('{"a": [1, true]}'))  # doctest: +NORMALIZE_WHITESPACE
+        [('start_map', None, 0), ('map_key', 'a', 1),
+         ('start_array', None, 6), ('number', 1, 7), ('boolean', True, 10),
+         ('end_array', None, 14), ('end_map', None, 15)]
+
+    ``parse_float``, ``parse_int`` and ``parse_constant`` have the same
+    meaning as in ``loads``.
+
     To use a custom ``JSONDecoder`` subclass, specify it with the ``cls``
     kwarg; otherwise ``JSONDecoder`` is used.
 
     """
-    # Reads JSON data from given file.
-    # Call "loads" to decode the JSON data.
-    return loads(fp.read(),
-        cls=cls, object_hook=object_hook,
-        parse_float=parse_float, parse_int=parse_int,
-        parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, None, parse_float, parse_int,
+                           parse_constant, None, kw)
+
+    # Parse JSON data to events.
+    # Return the iterator of events.
+    return decoder.iterparse(s_or_fp, bufsize)
+
+
+#
+def iter_items(s_or_fp, prefix, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None,
+        bufsize=DEFAULT_BUFSIZE, **kw):
+    """Deserialize each value found at path ``prefix`` in ``s_or_fp`` (a
+    ``str`` or bytes-like object, or a ``.read()``-supporting file-like object
+    containing a JSON document), and yield it as soon as it is decoded.
+
+    ``prefix`` is a ``str`` of property names joined by ``'.'``, where
+    ``'item'`` stands for any array element, or a sequence of such names::
+
+        >>> import json
+        >>> doc = '{"meta": {}, "data": [{"id": 1}, {"id": 2}]}'
+        >>> [r['id'] for r in json.iter_items(doc, 'data.item')]
+        [1, 2]
+
+    Only the selected values are built, so memory use does not grow with
+    the number of records in a huge array.
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+
+    # Decode values at given path.
+    # Return the iterator of values.
+    return decoder.iter_items(s_or_fp, prefix, bufsize)
+
+
+#
+def build_index(s, cls=None, parse_float=None, parse_int=None,
+        parse_constant=None, **kw):
+    """Build a structural index of ``s`` (a ``str`` instance containing a
+    JSON document), for repeated lookups into the same document.
+
+    The index records where each value lies, so a lookup by path jumps
+    straight to the value and decodes only its text::
+
+        >>> import json
+        >>> index = json.build_index('{"data": [{"id": 1}, {"id": 2}]}')
+        >>> index.get('data.1.id')
+        2
+        >>> index.get(['data', 0])
+        {'id': 1}
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, None, parse_float, parse_int,
+                           parse_constant, None, kw)
+
+    # Build the index.
+    # Return the index.
+    return decoder.build_index(s)
+
+
+#
+def extract(s, pointer, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Deserialize the value at RFC 6901 JSON pointer ``pointer`` in ``s`` (a
+    ``str`` instance containing a JSON document), or the list of values if
+    ``pointer`` is a sequence of pointers::
+
+        >>> import json
+        >>> doc = '{"a": {"b": [0, 1, 2, {"c": true}]}, "d": [5]}'
+        >>> json.extract(doc, '/a/b/3')
+        {'c': True}
+        >>> json.extract(doc, ['/d/0', '/a/b/1'])
+        [5, 1]
+
+    Values off the pointers' paths are skipped without being built, and the
+    text after the last value picked is not walked, so picking values near
+    the start of a large document is much cheaper than ``loads``. That text
+    is not checked either, so a document truncated after the values is not
+    rejected. See ``JSONDecoder.extract``.
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+
+    # Extract the values.
+    # Return the value, or list of values.
+    return decoder.extract(s, pointer)
+
+
+#
+def loads_columns(s, pointer='', cls=None, parse_float=None, parse_int=None,
+        parse_constant=None, use_numpy=None, **kw):
+    """Deserialize the array of objects at RFC 6901 JSON pointer
+    ``pointer`` in ``s`` (a ``str`` instance containing a JSON document)
+    into a dict that maps each property name to the column of its values,
+    and return it with the number of elements::
+
+        >>> import json
+        >>> doc = '{"rows": [{"id": 1, "x": 0.5}, {"id": 2, "x": 1}]}'
+        >>> json.loads_columns(doc, '/rows', use_numpy=False)
+        ({'id': array('q', [1, 2]), 'x': array('d', [0.5, 1.0])}, 2)
+
+    Columns of numbers are typed arrays, or NumPy arrays if ``use_numpy``
+    is true, or is None and NumPy can be imported. See
+    ``JSONDecoder.decode_columns``.
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, None, parse_float, parse_int,
+                           parse_constant, None, kw)
+
+    # Decode the array into columns.
+    # Return the columns, and number of elements.
+    return decoder.decode_columns(s, pointer, use_numpy)
+
+
+#
+def validate(s, cls=None, parse_constant=None, **kw):
+    """Check that ``s`` (a ``str``, ``bytes``, ``bytearray`` or
+    ``memoryview`` instance) is a valid JSON document, and raise
+    ``JSONDecodeError`` at the first error otherwise::
+
+        >>> import json
+        >>> json.validate('{"a": [1, 2.5, null]}')
+        >>> json.validate('{"a": [1 2]}')
+        Traceback (most recent call last):
+          ...
+        json.decoder.JSONDecodeError: Expecting ',' delimiter: line 1 column 10 (char 9)
+
+    No Python objects are built for the document, so this is much cheaper
+    than ``loads`` when only validity matters.
+
+    The other arguments have the same meaning as in ``load``.
+
+    """
+    # Get given JSON data as text
+    s = _get_text(s)
+
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, None, None, None, parse_constant, None, kw)
+
+    # Validate the JSON data
+    decoder.validate(s)
 
 
 #
 def loads(s, encoding=None, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
-    """Deserialize ``s`` (a ``str`` instance containing a JSON
-    document) to a Python object.
+    """Deserialize ``s`` (a ``str``, ``bytes``, ``bytearray`` or
+    ``memoryview`` instance containing a JSON document) to a Python object.
+
+    Binary data is decoded as UTF-8, UTF-16 or UTF-32, detected from the
+    first bytes, and a BOM is skipped.
 
     ``object_hook`` is an optional function that will be called with the
     result of any object literal decode (a ``dict``). The return value of
@@ -341,29 +784,68 @@ def loads(s, encoding=None, cls=None, object_hook=None, parse_float=None,
     The ``encoding`` argument is ignored and deprecated.
 
     """
-    # If given JSON data is not string
-    if not isinstance(s, str):
-        # Raise error
-        raise TypeError('the JSON object must be str, not {!r}'.format(
-                            s.__class__.__name__))
+    # Get given JSON data as text
+    s = _get_text(s)
+
+    # Get decoder with given arguments
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+
+    # Decode given JSON data into Python object.
+    # Return the Python object.
+    return decoder.decode(s)
+
+
+#
+def _get_text(s):
+    # Get JSON data given to "loads" or "validate" as text.
+    #
+    # @param s: JSON data, as str or bytes-like object.
+    #
+    # @return: JSON data as str.
 
-    # If given JSON data is string.
+    # If given JSON data is string
+    if isinstance(s, str):
+        # If given JSON data start with BOM
+        if s.startswith(u'\ufeff'):
+            # Raise error
+            raise JSONDecodeError(
+                "Unexpected UTF-8 BOM (decode using utf-8-sig)", s, 0)
 
-    # If given JSON data start with BOM
-    if s.startswith(u'\ufeff'):
-        # Raise error
-        raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)",
-                              s, 0)
+        # If given JSON data not start with BOM.
 
-    # If given JSON data not start with BOM.
+        # Return the JSON data
+        return s
+
+    # If given JSON data is bytes-like
+    if isinstance(s, (bytes, bytearray, memoryview)):
+        # Decode given JSON data into text at once.
+        # UTF-8 is decoded by a fast path in "str".
+        # Return the text.
+        return str(s, detect_encoding(s), 'surrogatepass')
+
+    # If given JSON data is neither string nor bytes-like.
+
+    # Raise error
+    raise TypeError('the JSON object must be str, bytes or bytearray, '
+                    'not {!r}'.format(s.__class__.__name__))
+
+
+#
+def _get_decoder(cls, object_hook, parse_float, parse_int, parse_constant,
+        object_pairs_hook, kw):
+    # Get decoder for arguments given to "load" or "loads".
+    #
+    # @param kw: Keywords dict for decoder constructor.
+    #
+    # @return: Decoder object.
 
     # If arguments can use default decoder
     if (cls is None and object_hook is None and
             parse_int is None and parse_float is None and
             parse_constant is None and object_pairs_hook is None and not kw):
-        # Decode given JSON data into Python object.
-        # Return the Python object.
-        return _default_decoder.decode(s)
+        # Return default decoder
+        return _default_decoder
 
     # If arguments can not use default decoder.
 
@@ -397,6 +879,6 @@ def loads(s, encoding=None, cls=None, object_hook=None, parse_float=None,
         # Add to keywords dict
         kw['parse_constant'] = parse_constant
 
-    # Decode given JSON data into Python object.
-    # Return the Python object.
-    return cls(**kw).decode(s)
+    # Create decoder.
+    # Return the decoder.
+    return cls(**kw)
@@ -1,6 +1,12 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from operator import itemgetter
 
 from json import scanner
 try:
@@ -8,7 +14,10 @@ try:
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = [
+    'JSONDecoder', 'JSONDecodeError', 'KeyMemo', 'LazyObject', 'LazyArray',
+    'StructuralIndex',
+]
 
 
 # Regular expression flags to match multiple lines and enable verbose mode
@@ -638,165 +647,4084 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
     return values, end
 
 
+# Regular expression object to match the rest of a JSON array after its
+# starting `[`, up to and including the ending `]`, if it has only characters
+# of numbers, `,` delimiters and white spaces.
+NUMBER_ARRAY_CHARS = re.compile(r'[-+0-9.eE, \t\n\r]*\]', FLAGS)
+
+
 #
-class JSONDecoder(object):
-    """Simple JSON <http://json.org> decoder
+def _pack_numbers(values, integers, numpy=None):
+    # Pack a non-empty list of plain numbers into array.
+    #
+    # @param values: A list of numbers.
+    #
+    # @param integers: Whether the numbers are all integers.
+    #
+    # @param numpy: NumPy module to convert the array into NumPy array, or
+    # None.
+    #
+    # @return: "array('q')" if the numbers are all integers fitting in 64
+    # bits, "array('d')" if they are not all integers, or the list if an
+    # integer does not fit.
 
-    Performs the following translations in decoding by default:
+    # If the numbers are all integers
+    if integers:
+        #
+        try:
+            # Convert to array of integers
+            values = array('q', values)
 
-    +---------------+-------------------+
-    | JSON          | Python            |
-    +===============+===================+
-    | object        | dict              |
-    +---------------+-------------------+
-    | array         | list              |
-    +---------------+-------------------+
-    | string        | str               |
-    +---------------+-------------------+
-    | number (int)  | int               |
-    +---------------+-------------------+
-    | number (real) | float             |
-    +---------------+-------------------+
-    | true          | True              |
-    +---------------+-------------------+
-    | false         | False             |
-    +---------------+-------------------+
-    | null          | None              |
-    +---------------+-------------------+
+        # If an integer does not fit in 64 bits
+        except OverflowError:
+            # Return the list
+            return values
+
+    # If some numbers are not integers
+    else:
+        # Convert to array of floats
+        values = array('d', values)
+
+    # If have NumPy
+    if numpy is not None:
+        # Convert to NumPy array sharing the array's memory
+        values = numpy.frombuffer(
+            values, numpy.int64 if values.typecode == 'q' else numpy.float64)
+
+    # Return the array
+    return values
+
+
+#
+def _make_number_array(context, numpy=None):
+    # Factory function of parse array function that decodes arrays of plain
+    # numbers in bulk.
+    #
+    # An array having only characters of numbers is decoded by the C scanner
+    # if available, which validates and converts the numbers without the
+    # Python scanner's per-number regular expression match and string
+    # concatenation. The list is then packed into "array('q')" if it has no
+    # `.`, `e` or `E`, and its integers fit in 64 bits, or into "array('d')"
+    # otherwise, and dropped. Other arrays are decoded by "JSONArray".
+    #
+    # @param context: Decoder object.
+    #
+    # @param numpy: NumPy module to convert the arrays into NumPy arrays, or
+    # None.
+    #
+    # @return: Parse array function.
+
+    # Create scan function of the C scanner, or the Python scanner
+    scan_numbers = scanner.make_scanner(context)
+
+    # Get number array characters match function
+    match_chars = NUMBER_ARRAY_CHARS.match
+
+    # Create parse array function
+    def parse_array(s_and_end, scan_once):
+        # Parse JSON array to Python list object, or to array if all its
+        # values are plain numbers.
+        #
+        # @param s_and_end: A tuple of (JSON data, parsing end position).
+        #
+        # @param scan_once: Scan function.
+        #
+        # @return: Python list or array object, and parsing end position.
+
+        # Get JSON data, and parsing end position
+        s, end = s_and_end
+
+        # Match the rest of the array as characters of numbers
+        match = match_chars(s, end)
+
+        # If the array has other characters
+        if match is None:
+            # Parse as list.
+            # Return the list, and parsing end position.
+            return JSONArray(s_and_end, scan_once)
+
+        #
+        try:
+            # Decode the array from its starting `[`, get parsing end
+            # position
+            values, end = scan_numbers(s, end - 1)
+
+        # If a value is missing
+        except StopIteration as err:
+            # Raise error
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+
+        # If the array is empty
+        if not values:
+            # Return the list, and parsing end position
+            return values, end
+
+        # Get the array's text
+        text = s[match.start():end]
+
+        # Pack the numbers, which are all integers if the text has no
+        # fraction or exponent part.
+        # Return the array, and parsing end position.
+        return _pack_numbers(
+            values, '.' not in text and 'e' not in text and 'E' not in text,
+            numpy), end
+
+    # Return the parse array function
+    return parse_array
+
+
+# Regular expression object to match the rest of a JSON string after its
+# starting `"`, without decoding it. It matches runs of characters other than
+# `"` and `\`, each run followed by an escape sequence, until the ending `"`.
+STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', FLAGS)
 
-    It also understands ``NaN``, ``Infinity``, and ``-Infinity`` as
-    their corresponding ``float`` values, which is outside the JSON spec.
+
+# Regular expression object to match characters up to the next `"`, `[`, `]`,
+# `{` or `}`.
+BRACKET_OR_QUOTE = re.compile(r'[^"\[\]{}]*(["\[\]{}])', FLAGS)
+
+
+# Regular expression object to match characters up to the next `[`, `]`, `{`
+# or `}` outside JSON strings. Strings are matched as a whole, so each bracket
+# costs one match. The loop is unrolled so that no text can be matched in two
+# ways, which keeps failed matches linear.
+BRACKET = re.compile(r"""
+    [^"\[\]{}]*
+    (?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*
+    ([\[\]{}])
+    """, FLAGS)
+
+
+# Map constant's starting character to the constant's text
+_CONSTANT_TEXTS = {
+    'n': 'null',
+    't': 'true',
+    'f': 'false',
+    'N': 'NaN',
+    'I': 'Infinity',
+}
+
+
+# Settings of the scanner that "skip_value" runs over containers. Values are
+# decoded with default functions and dropped, and control characters in
+# strings are allowed, since only the extent of skipped values is checked.
+class _SkipContext(object):
+    # Whether disallow literal control characters
+    strict = False
+
+    # Object hook function
+    object_hook = None
+
+    # Object pairs hook function
+    object_pairs_hook = None
+
+    # Parse float function
+    parse_float = float
+
+    # Parse int function
+    parse_int = int
+
+    # Parse constant function
+    parse_constant = _CONSTANTS.__getitem__
+
+    # Memo for interning decoded object keys
+    memo = {}
+
+
+# C scanner function that "skip_value" runs over containers, or None if the C
+# version is not available
+_skip_scan = (scanner.c_make_scanner(_SkipContext)
+              if scanner.c_make_scanner is not None else None)
+
+
+#
+def skip_value(s, idx, _string_rest=STRING_REST.match,
+        _number=scanner.NUMBER_RE.match, _scan=_skip_scan):
+    """Return the index in ``s`` after the JSON value starting at index
+    ``idx``, without returning the value.
+
+    Strings are matched without decoding escapes. Containers are scanned by
+    the C scanner and the result is dropped, which costs about as much as
+    ``loads`` on the container's text, and syntax errors in them are
+    raised. If the C scanner is not available, or the container is nested
+    too deep for it, brackets outside strings are matched instead, one
+    regular expression match per bracket, which checks only the value's
+    extent, not the grammar inside it.
 
     """
+    # Skip a value.
+    #
+    # @param s: JSON data.
+    #
+    # @param idx: Position of the value's first character.
+    #
+    # @return: Position after the value.
 
-    def __init__(self, object_hook=None, parse_float=None,
-            parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
-        """``object_hook``, if specified, will be called with the result
-        of every JSON object decoded and its return value will be used in
-        place of the given ``dict``.  This can be used to provide custom
-        deserializations (e.g. to support JSON-RPC class hinting).
+    # Get the value's first character
+    nextchar = s[idx:idx + 1]
 
-        ``object_pairs_hook``, if specified will be called with the result of
-        every JSON object decoded with an ordered list of pairs.  The return
-        value of ``object_pairs_hook`` will be used instead of the ``dict``.
-        This feature can be used to implement custom decoders that rely on the
-        order that the key and value pairs are decoded (for example,
-        collections.OrderedDict will remember the order of insertion). If
-        ``object_hook`` is also defined, the ``object_pairs_hook`` takes
-        priority.
+    # If the character is starting `"` of JSON string
+    if nextchar == '"':
+        # Match the rest of the string
+        m = _string_rest(s, idx + 1)
 
-        ``parse_float``, if specified, will be called with the string
-        of every JSON float to be decoded. By default this is equivalent to
-        float(num_str). This can be used to use another datatype or parser
-        for JSON floats (e.g. decimal.Decimal).
+        # If no match result
+        if m is None:
+            # Raise error
+            raise JSONDecodeError("Unterminated string starting at", s, idx)
 
-        ``parse_int``, if specified, will be called with the string
-        of every JSON int to be decoded. By default this is equivalent to
-        int(num_str). This can be used to use another datatype or parser
-        for JSON integers (e.g. float).
+        # Return the string's end position
+        return m.end()
+
+    # If the character is starting `{` or `[` of JSON container
+    if nextchar == '{' or nextchar == '[':
+        # If C scanner is available
+        if _scan is not None:
+            #
+            try:
+                # Scan the container, drop the result.
+                # Return the container's end position.
+                return _scan(s, idx)[1]
+
+            # If a value in the container is missing
+            except StopIteration as err:
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting value", s, err.value) from None
+
+            # If the container is invalid
+            except JSONDecodeError:
+                # Raise the error
+                raise
+
+            # If the container is nested too deep, or has an integer too
+            # long to convert
+            except (ValueError, RecursionError):
+                # Match brackets below
+                pass
+
+        # Match the container's brackets.
+        # Return the container's end position.
+        return _container_tables(s, idx)[1]
+
+    # Match a number
+    m = _number(s, idx)
+
+    # If have match result
+    if m is not None:
+        # Return the number's end position
+        return m.end()
+
+    # Get the text of the constant starting with the character
+    text = _CONSTANT_TEXTS.get(nextchar)
+
+    # If the character is "-"
+    if nextchar == '-':
+        # The constant can only be "-Infinity"
+        text = '-Infinity'
+
+    # If the text of a constant is found in JSON data
+    if text is not None and s.startswith(text, idx):
+        # Return the constant's end position
+        return idx + len(text)
+
+    # Raise error
+    raise JSONDecodeError("Expecting value", s, idx)
+
+
+#
+def _container_tables(s, idx, max_depth=None, _bracket=BRACKET.match):
+    # Match the brackets of a JSON container and of every container in it,
+    # skipping strings, and record the containers' text spans.
+    #
+    # Only the brackets and the strings' ends are checked, not the grammar
+    # between them.
+    #
+    # @param s: JSON data.
+    #
+    # @param idx: Position of the container's starting bracket.
+    #
+    # @param max_depth: Maximum nesting depth of containers. None means no
+    # limit.
+    #
+    # @return: A tuple of start, end and skip tables of the containers,
+    # numbered in document order as "StructuralIndex" entries are, and the
+    # container's end position.
+
+    # Containers' start positions
+    starts = array('q', [idx])
+
+    # Containers' end positions
+    ends = array('q', [-1])
+
+    # Numbers of the containers after containers' subtrees
+    skips = array('q', [-1])
+
+    # Stack of open containers' numbers
+    stack = [0]
+
+    # If the container itself is nested too deep
+    if max_depth is not None and max_depth < 1:
+        # Raise error
+        raise JSONDecodeError("Maximum nesting depth exceeded", s, idx)
+
+    # Skip the starting bracket
+    end = idx + 1
+
+    # Loop
+    while True:
+        # Match up to the next bracket, skipping strings
+        m = _bracket(s, end)
+
+        # If no match result
+        if m is None:
+            # Raise error
+            _raise_unterminated(s, idx, end)
+
+        # Get the bracket
+        char = m.group(1)
+
+        # Get parsing end position
+        end = m.end()
+
+        # If the character is starting `{` or `[` of JSON container
+        if char == '{' or char == '[':
+            # If the container is nested too deep
+            if max_depth is not None and len(stack) >= max_depth:
+                # Raise error
+                raise JSONDecodeError(
+                    "Maximum nesting depth exceeded", s, end - 1)
+
+            # Push the container
+            stack.append(len(starts))
+
+            # Add the container's entry
+            starts.append(end - 1)
+            ends.append(-1)
+            skips.append(-1)
+
+            # Continue with the next bracket
+            continue
+
+        # Pop the innermost container
+        top = stack.pop()
+
+        # If the character is not the container's ending bracket
+        if s[starts[top]] != ('{' if char == '}' else '['):
+            # Raise error
+            raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
+
+        # Record the container's end position
+        ends[top] = end
+
+        # Record the number of the container after the container's subtree
+        skips[top] = len(starts)
+
+        # If the starting container is ended
+        if not stack:
+            # Return the tables, and the container's end position
+            return (starts, ends, skips), end
+
+
+#
+def _raise_unterminated(s, idx, end, _string_rest=STRING_REST.match,
+        _bracket_or_quote=BRACKET_OR_QUOTE.match):
+    # Raise error for a JSON container whose brackets are not all matched.
+    #
+    # @param s: JSON data.
+    #
+    # @param idx: Position of the container's starting bracket.
+    #
+    # @param end: Position after the last matched bracket.
+    #
+    # @return: Never returns.
+
+    # Loop to find an unterminated string
+    while True:
+        # Match up to the next bracket or quote
+        m = _bracket_or_quote(s, end)
+
+        # If no match result
+        if m is None:
+            # Raise error
+            raise JSONDecodeError(
+                "Unterminated {} starting at".format(
+                    'object' if s[idx] == '{' else 'array'),
+                s, idx)
+
+        # Get parsing end position
+        end = m.end()
+
+        # If the character is starting `"` of JSON string
+        if m.group(1) == '"':
+            # Match the rest of the string
+            m = _string_rest(s, end)
+
+            # If no match result
+            if m is None:
+                # Raise error
+                raise JSONDecodeError(
+                    "Unterminated string starting at", s, end - 1)
+
+            # Get the string's end position
+            end = m.end()
+
+
+#
+class LazyObject(Mapping):
+    """Read-only mapping proxy for a JSON object, returned by
+    ``JSONDecoder(lazy=True)``.
+
+    Property names and the offsets of their values are recorded when the
+    proxy is created. A value is decoded when it is first accessed, and then
+    cached. Nested objects and arrays are decoded as proxies too, jumping
+    over their own nested containers by the offsets recorded for the whole
+    document.
+
+    """
+
+    __slots__ = ('_decoder', '_s', '_index', '_tables', '_cache')
+
+    def __init__(self, decoder, s, index, tables):
+        # @param decoder: Decoder object.
+        #
+        # @param s: JSON data.
+        #
+        # @param index: Dict that maps property name to the position of its
+        # value.
+        #
+        # @param tables: Start, end and skip tables of the document's
+        # containers.
+
+        # Decoder object
+        self._decoder = decoder
+
+        # JSON data
+        self._s = s
+
+        # Map property name to value position
+        self._index = index
+
+        # Tables of the document's containers
+        self._tables = tables
+
+        # Map property name to decoded value
+        self._cache = {}
+
+    def __getitem__(self, key):
+        # Get decoded property value.
+        #
+        # @param key: Property name.
+        #
+        # @return: Decoded property value.
+
+        #
+        try:
+            # Return cached value
+            return self._cache[key]
+
+        # If the value is not decoded yet
+        except KeyError:
+            # Decode it below
+            pass
+
+        # Decode the value at the property's value position.
+        #
+        # Unknown property name raises KeyError.
+        value = self._decoder._scan_lazy(
+            self._s, self._index[key], self._tables)[0]
+
+        # Cache the value
+        self._cache[key] = value
+
+        # Return the value
+        return value
+
+    def __iter__(self):
+        # Return iterator of property names, in document order
+        return iter(self._index)
+
+    def __len__(self):
+        # Return number of properties
+        return len(self._index)
+
+    def __contains__(self, key):
+        # Return whether have the property, without decoding its value
+        return key in self._index
+
+    def __repr__(self):
+        # Return repr of the object with all values decoded
+        return '{}({!r})'.format(self.__class__.__name__, dict(self))
+
+
+#
+class LazyArray(Sequence):
+    """Read-only sequence proxy for a JSON array, returned by
+    ``JSONDecoder(lazy=True)``.
+
+    The offsets of elements are recorded when the proxy is created. An
+    element is decoded when it is first accessed, and then cached. Nested
+    objects and arrays are decoded as proxies too, jumping over their own
+    nested containers by the offsets recorded for the whole document.
+
+    """
+
+    __slots__ = ('_decoder', '_s', '_index', '_tables', '_cache')
+
+    def __init__(self, decoder, s, index, tables):
+        # @param decoder: Decoder object.
+        #
+        # @param s: JSON data.
+        #
+        # @param index: Array of element positions.
+        #
+        # @param tables: Start, end and skip tables of the document's
+        # containers.
+
+        # Decoder object
+        self._decoder = decoder
+
+        # JSON data
+        self._s = s
+
+        # Element positions
+        self._index = index
+
+        # Tables of the document's containers
+        self._tables = tables
+
+        # Map element index to decoded element
+        self._cache = {}
+
+    def __getitem__(self, i):
+        # Get decoded element.
+        #
+        # @param i: Element index, or slice.
+        #
+        # @return: Decoded element, or a list of decoded elements for slice.
+
+        # If given a slice
+        if isinstance(i, slice):
+            # Return a list of decoded elements
+            return [self[j] for j in range(*i.indices(len(self._index)))]
+
+        # If given a negative index
+        if i < 0:
+            # Convert to non-negative index
+            i += len(self._index)
+
+        #
+        try:
+            # Return cached element
+            return self._cache[i]
+
+        # If the element is not decoded yet
+        except KeyError:
+            # Decode it below
+            pass
+
+        # If the index is out of range
+        if not 0 <= i < len(self._index):
+            # Raise error
+            raise IndexError('array index out of range')
+
+        # Decode the element at its position
+        value = self._decoder._scan_lazy(
+            self._s, self._index[i], self._tables)[0]
+
+        # Cache the element
+        self._cache[i] = value
+
+        # Return the element
+        return value
+
+    def __len__(self):
+        # Return number of elements
+        return len(self._index)
+
+    def __eq__(self, other):
+        # Compare elements with another array
+        if isinstance(other, (list, LazyArray)):
+            # Return whether all elements are equal
+            return len(self) == len(other) and list(self) == list(other)
+
+        # Let the other object compare
+        return NotImplemented
+
+    def __ne__(self, other):
+        # Get result of equality test
+        result = self.__eq__(other)
+
+        # Return the negated result
+        return result if result is NotImplemented else not result
+
+    # Proxies are mutable containers' views, so they are not hashable
+    __hash__ = None
+
+    def __repr__(self):
+        # Return repr of the array with all elements decoded
+        return '{}({!r})'.format(self.__class__.__name__, list(self))
+
+
+# Regular expression object to match an array index token of JSON pointer
+ARRAY_INDEX = re.compile(r'0|[1-9][0-9]*', FLAGS)
+
+
+# Regular expression object to match an invalid escape of JSON pointer
+POINTER_BAD_ESCAPE = re.compile(r'~(?:[^01]|$)', FLAGS)
+
+
+#
+def parse_pointer(pointer):
+    """Return the list of reference tokens of RFC 6901 JSON pointer
+    ``pointer``, with ``~1`` and ``~0`` unescaped, e.g. ``'/a~1b/0'`` gives
+    ``['a/b', '0']``. Raise ``ValueError`` if the pointer is invalid.
+
+    """
+    # Parse JSON pointer.
+    #
+    # @param pointer: JSON pointer string.
+    #
+    # @return: List of reference tokens.
+
+    # If the pointer is empty
+    if not pointer:
+        # The pointer refers to the whole document
+        return []
+
+    # If the pointer does not start with "/",
+    # or the pointer has invalid escape.
+    if pointer[0] != '/' or POINTER_BAD_ESCAPE.search(pointer):
+        # Raise error
+        raise ValueError('invalid JSON pointer: {!r}'.format(pointer))
+
+    # Split the pointer into tokens.
+    # Unescape each token.
+    # Return the tokens.
+    return [token.replace('~1', '/').replace('~0', '~')
+            for token in pointer[1:].split('/')]
+
+
+#
+class StructuralIndex(object):
+    """Structural index of a JSON document, returned by
+    ``JSONDecoder.build_index``.
+
+    Every value in the document gets an entry, numbered in document order.
+    Compact ``array`` tables record each entry's text span and the number
+    of the entry after its subtree, and a list records the property name of
+    each object member. A container's children are found by jumping from
+    one child's entry to the next, never by rescanning text, so a path
+    lookup costs O(depth) once a container's children are cached, and only
+    the target value's text is decoded.
+
+    """
+
+    __slots__ = ('decoder', 's', 'starts', 'ends', 'skips', 'keys',
+                 '_children')
+
+    def __init__(self, decoder, s, starts, ends, skips, keys):
+        # @param decoder: Decoder object to decode values with.
+        #
+        # @param s: JSON data.
+        #
+        # @param starts: Array of entries' start positions.
+        #
+        # @param ends: Array of entries' end positions.
+        #
+        # @param skips: Array of numbers of the entries after entries'
+        # subtrees. A scalar's subtree is the scalar only.
+        #
+        # @param keys: List of entries' property names. None for entries that
+        # are not object members.
+
+        # Decoder object
+        self.decoder = decoder
+
+        # JSON data
+        self.s = s
+
+        # Entries' start positions
+        self.starts = starts
+
+        # Entries' end positions
+        self.ends = ends
+
+        # Numbers of the entries after entries' subtrees
+        self.skips = skips
+
+        # Entries' property names
+        self.keys = keys
+
+        # Map container entry number to its children, as a dict that maps
+        # property name to entry number, or an array of entry numbers
+        self._children = {}
+
+    def __len__(self):
+        # Return number of entries
+        return len(self.starts)
+
+    def children(self, entry):
+        """Return the children of container ``entry``, as a ``dict`` that
+        maps property name to entry number for an object, or an ``array`` of
+        entry numbers for an array.
+
+        """
+        # Get children of a container entry.
+        #
+        # @param entry: Entry number.
+        #
+        # @return: Dict of children of object, or array of children of array.
+
+        #
+        try:
+            # Return cached children
+            return self._children[entry]
+
+        # If the children are not cached yet
+        except KeyError:
+            # Collect them below
+            pass
+
+        # Get the container's first character
+        nextchar = self.s[self.starts[entry]]
+
+        # If the entry is not container
+        if nextchar != '{' and nextchar != '[':
+            # Raise error
+            raise TypeError('entry {} is not object or array'.format(entry))
+
+        # Get skip table
+        skips = self.skips
+
+        # Entry number after the container's subtree
+        stop = skips[entry]
+
+        # Entry number of the first child
+        child = entry + 1
+
+        # If the container is object
+        if nextchar == '{':
+            # Get property name table
+            keys = self.keys
+
+            # Map property name to child entry number
+            children = {}
+
+            # While have child
+            while child < stop:
+                # Add the child. Later duplicate names win.
+                children[keys[child]] = child
+
+                # Jump to the next child
+                child = skips[child]
+
+        # If the container is array
+        else:
+            # Child entry numbers
+            children = array('q')
+
+            # While have child
+            while child < stop:
+                # Add the child
+                children.append(child)
+
+                # Jump to the next child
+                child = skips[child]
+
+        # Cache the children
+        self._children[entry] = children
+
+        # Return the children
+        return children
+
+    def find(self, path):
+        """Return the number of the entry at ``path``.
+
+        ``path`` is a sequence of property names and array indexes, or a
+        ``str`` of them joined by ``'.'``, e.g. ``'data.3.id'``. Raise
+        ``KeyError`` or ``IndexError`` if no value is at the path.
+
+        """
+        # Find entry at given path.
+        #
+        # @param path: Sequence of path components, or string of path
+        # components joined by ".".
+        #
+        # @return: Entry number.
+
+        # If the path is string
+        if isinstance(path, str):
+            # Split the path into components
+            path = path.split('.') if path else ()
+
+        # Start from the top-level value
+        entry = 0
+
+        # For each path component
+        for component in path:
+            # Get the container's children
+            children = self.children(entry)
+
+            # If the container is object
+            if isinstance(children, dict):
+                # Get the member's entry number.
+                # Unknown property name raises KeyError.
+                entry = children[component]
+
+            # If the container is array
+            else:
+                # Get the element's entry number.
+                # Index out of range raises IndexError.
+                entry = children[int(component)]
+
+        # Return the entry number
+        return entry
+
+    def span(self, path):
+        """Return the ``(start, end)`` positions in the text of the value at
+        ``path``.
+
+        """
+        # Get text span of value at given path.
+        #
+        # @param path: Path components.
+        #
+        # @return: Start position and end position.
+
+        # Find the entry
+        entry = self.find(path)
+
+        # Return the entry's text span
+        return self.starts[entry], self.ends[entry]
+
+    def get(self, path):
+        """Return the Python representation of the value at ``path``,
+        decoding only that value's text.
+
+        """
+        # Decode value at given path.
+        #
+        # @param path: Path components.
+        #
+        # @return: Python object.
+
+        # Decode the value at the entry's start position.
+        # Return the Python object.
+        return self.decoder.raw_decode(self.s, self.starts[self.find(path)])[0]
+
+    __getitem__ = get
+
+
+#
+def _window_error(msg, s, idx, offset, lineno, colno):
+    # Create decode error for a window of a larger JSON document, with
+    # position relative to the document start.
+    #
+    # @param msg: Error message.
+    #
+    # @param s: Window text.
+    #
+    # @param idx: Window position where parsing failed.
+    #
+    # @param offset: Document position of window start.
+    #
+    # @param lineno: Number of newlines before window start.
+    #
+    # @param colno: Number of characters between the last newline and window
+    # start.
+    #
+    # @return: JSONDecodeError object. Its ``doc`` is the window text.
+
+    # Count newlines in window text before error position
+    newlines = s.count('\n', 0, idx)
+
+    # If have newlines
+    if newlines:
+        # Get column number relative to last newline
+        colno = idx - s.rfind('\n', 0, idx)
+
+    # If have no newlines
+    else:
+        # Get column number relative to window start
+        colno += idx + 1
+
+    # Get line number relative to document start
+    lineno += newlines + 1
+
+    # Get position relative to document start
+    pos = offset + idx
+
+    # Create error
+    err = JSONDecodeError(msg, s, idx)
+
+    # Set error message with error location relative to document start
+    err.args = ('%s: line %d column %d (char %d)' % (
+        msg, lineno, colno, pos),)
+
+    # Set error location relative to document start
+    err.pos = pos
+    err.lineno = lineno
+    err.colno = colno
+
+    # Return the error
+    return err
+
+
+# Types of bytes-like objects accepted as JSON data
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+#
+def detect_encoding(b):
+    # Detect encoding of JSON data in bytes, as specified by RFC 4627 and
+    # RFC 7159: UTF-8, UTF-16 or UTF-32, with or without BOM.
+    #
+    # @param b: The first bytes of JSON data. At most 4 bytes are used.
+    #
+    # @return: Encoding name.
+
+    # Get the first 4 bytes
+    b = bytes(b[:4])
+
+    # If have UTF-32 BOM.
+    #
+    # Test before UTF-16 BOM since UTF-32 LE BOM starts with UTF-16 LE BOM.
+    if b.startswith((codecs.BOM_UTF32_BE, codecs.BOM_UTF32_LE)):
+        # Decoding strips the BOM
+        return 'utf-32'
+
+    # If have UTF-16 BOM
+    if b.startswith((codecs.BOM_UTF16_BE, codecs.BOM_UTF16_LE)):
+        # Decoding strips the BOM
+        return 'utf-16'
+
+    # If have UTF-8 BOM
+    if b.startswith(codecs.BOM_UTF8):
+        # Decoding strips the BOM
+        return 'utf-8-sig'
+
+    # If have no BOM.
+    #
+    # The first character of JSON data is ASCII, so the positions of zero
+    # bytes in the first character tell the encoding.
+
+    # If have at least 4 bytes
+    if len(b) >= 4:
+        # If the first byte is zero
+        if not b[0]:
+            # 00 00 -- -- - utf-32-be
+            # 00 XX -- -- - utf-16-be
+            return 'utf-16-be' if b[1] else 'utf-32-be'
+
+        # If the second byte is zero
+        if not b[1]:
+            # XX 00 00 00 - utf-32-le
+            # XX 00 00 XX - utf-16-le
+            # XX 00 XX -- - utf-16-le
+            return 'utf-16-le' if b[2] or b[3] else 'utf-32-le'
+
+    # If have 2 bytes
+    elif len(b) == 2:
+        # If the first byte is zero
+        if not b[0]:
+            # 00 XX - utf-16-be
+            return 'utf-16-be'
+
+        # If the second byte is zero
+        if not b[1]:
+            # XX 00 - utf-16-le
+            return 'utf-16-le'
+
+    # Default to UTF-8
+    return 'utf-8'
+
+
+#
+class _BytesReader(object):
+    # ``.read()``-supporting file-like object over a bytes-like object.
+    #
+    # Reads return memoryview slices, so no bytes are copied.
+
+    def __init__(self, b):
+        # @param b: A bytes-like object.
+
+        # Byte view of the object
+        self.view = memoryview(b).cast('B')
+
+        # Reading position
+        self.pos = 0
+
+    def read(self, size):
+        # Read bytes.
+        #
+        # @param size: Number of bytes to read.
+        #
+        # @return: A memoryview of at most the number of bytes.
+
+        # Get reading position
+        pos = self.pos
+
+        # Forward reading position
+        self.pos = pos + size
+
+        # Return the bytes
+        return self.view[pos:pos + size]
+
+
+#
+class _TextReader(object):
+    # ``.read()``-supporting file-like object that reads text decoded from a
+    # binary file-like object.
+    #
+    # Encoding is detected from the first bytes by "detect_encoding". Bytes
+    # are decoded incrementally, so the whole text is never held in memory.
+
+    def __init__(self, fp, raw=None):
+        # @param fp: A binary ``.read()``-supporting file-like object.
+        #
+        # @param raw: Bytes already read from the file, or None.
+
+        # Binary file object
+        self.fp = fp
+
+        # Bytes already read from the file
+        self.raw = raw
+
+        # Incremental decode function. Created on first read.
+        self.decode = None
+
+    def read(self, size):
+        # Read text.
+        #
+        # @param size: Number of bytes to read.
+        #
+        # @return: Decoded text. Empty if end of file is reached.
+
+        # Get bytes already read
+        raw = self.raw
+
+        # If have no bytes already read
+        if raw is None:
+            # Read bytes
+            raw = self.fp.read(size)
+
+        # If have bytes already read
+        else:
+            # Clear bytes already read
+            self.raw = None
+
+        # If the bytes are not bytes-like
+        if not isinstance(raw, _BYTES_TYPES):
+            # Raise error
+            raise TypeError('the JSON object must be str, bytes or bytearray, '
+                            'not {!r}'.format(raw.__class__.__name__))
+
+        # If encoding is not detected yet
+        if self.decode is None:
+            # While have less than 4 bytes to detect encoding from
+            while len(raw) < 4:
+                # Read more bytes
+                more = self.fp.read(size)
+
+                # If end of file is reached
+                if not more:
+                    # Stop reading
+                    break
+
+                # Add the bytes
+                raw = bytes(raw) + bytes(more)
+
+            # Detect encoding.
+            # Create incremental decode function.
+            self.decode = codecs.getincrementaldecoder(
+                detect_encoding(raw))('surrogatepass').decode
+
+        # Decode the bytes. Bytes of a partial character are kept by the
+        # decoder until next read.
+        text = self.decode(raw, not raw)
+
+        # While have no text and end of file is not reached.
+        #
+        # E.g. the bytes are part of a multi-byte character.
+        while not text and raw:
+            # Read more bytes
+            raw = self.fp.read(size)
+
+            # Decode the bytes
+            text = self.decode(raw, not raw)
+
+        # Return the text
+        return text
+
+
+# Default maximum number of keys kept by "KeyMemo" with LRU policy
+DEFAULT_MEMO_SIZE = 4096
+
+
+# Default maximum length of string values interned by "JSONDecoder"
+DEFAULT_VALUE_MAXLEN = 32
+
+
+#
+class KeyMemo(object):
+    """Cache for interning decoded object keys, so that equal keys share one
+    ``str`` object. It can also intern string values, see ``JSONDecoder``.
+
+    With ``policy='document'``, keys are kept until the end of each
+    decoded document. Interned keys are referenced by the result anyway, so
+    this costs no extra memory.
+
+    With ``policy='lru'``, at most ``maxsize`` keys are kept across
+    documents, evicting the least recently used key. Sharing one such memo
+    between decoders lets documents of the same schema reuse the same key
+    strings.
+
+    A ``KeyMemo`` given to ``JSONDecoder`` interns the keys of every
+    decoding method. Values returned by the C scanner are walked afterwards
+    to intern their keys, and the pure-Python scanner is used instead if
+    ``object_hook`` or ``object_pairs_hook`` is given.
+
+    """
+
+    def __init__(self, maxsize=DEFAULT_MEMO_SIZE, policy='lru'):
+        # @param maxsize: Maximum number of keys kept with LRU policy.
+        #
+        # @param policy: 'lru', or 'document'.
+
+        # If policy is not valid
+        if policy not in ('lru', 'document'):
+            # Raise error
+            raise ValueError('policy must be lru or document, not {!r}'
+                             .format(policy))
+
+        # Maximum number of keys
+        self.maxsize = maxsize
+
+        # Eviction policy
+        self.policy = policy
+
+        # Map key to interned key, in least recently used first order
+        self.data = OrderedDict() if policy == 'lru' else {}
+
+        # If policy is per document
+        if policy == 'document':
+            # Use dict's setdefault function as-is, since no bookkeeping is
+            # needed until the end of a document
+            self.setdefault = self.data.setdefault
+
+    def __len__(self):
+        # Return number of keys kept
+        return len(self.data)
+
+    def setdefault(self, key, default):
+        # Get interned key with LRU policy. The signature follows
+        # "dict.setdefault" so that "JSONObject" can use a dict as memo too.
+        #
+        # @param key: Decoded key.
+        #
+        # @param default: Decoded key.
+        #
+        # @return: Interned key.
+
+        # Get keys dict
+        data = self.data
+
+        #
+        try:
+            # Get interned key
+            key = data[key]
+
+            # Mark the key as most recently used
+            data.move_to_end(key)
+
+            # Return the interned key
+            return key
+
+        # If the key is not kept.
+        #
+        # Also if another thread evicted the key above.
+        except KeyError:
+            # Keep the key
+            data[key] = default
+
+            # If number of keys exceeds maximum
+            if len(data) > self.maxsize:
+                # Evict least recently used key
+                data.popitem(last=False)
+
+            # Return the key
+            return default
+
+    def end_document(self):
+        # Called after each document is decoded.
+
+        # If policy is per document
+        if self.policy == 'document':
+            # Drop all keys
+            self.data.clear()
+
+    def clear(self):
+        # Drop all keys
+        self.data.clear()
+
+
+# Default number of characters to read from a file object at a time
+DEFAULT_BUFSIZE = 64 * 1024
+
+
+# Number of records decoded by "JSONDecoder.decode_columns" before their
+# values are moved into columns
+COLUMN_CHUNK_ROWS = 4096
+
+
+# Largest integer magnitude up to which every integer is exactly a float
+_FLOAT_EXACT_INT = 2 ** 53
+
+
+#
+def _floats_exact(ints, _limit=_FLOAT_EXACT_INT):
+    # Test whether integers are all exact as floats.
+    #
+    # @param ints: A non-empty sequence of integers.
+    #
+    # @return: True if every integer's magnitude is at most 2 ** 53.
+
+    # Return whether the smallest and largest integers are in exact range
+    return -_limit <= min(ints) and max(ints) <= _limit
+
+
+#
+def _extend_column(column, values, _types={int: 'q', float: 'd'},
+        _containers=frozenset((dict, list))):
+    # Add values to a column of "JSONDecoder.decode_columns".
+    #
+    # A column is "array('q')" while all its values are integers fitting in
+    # 64 bits, "array('d')" while all are numbers and its integers are exact
+    # as floats, and a list otherwise.
+    #
+    # @param column: None for a new column, an array, or a list.
+    #
+    # @param values: A sequence of values to add.
+    #
+    # @param _containers: Container types.
+    #
+    # @return: The column, or a new column if the values do not fit in the
+    # given one.
+
+    # Get the values' types
+    types = set(map(type, values))
+
+    # If a value is object or array
+    if not _containers.isdisjoint(types):
+        # Raise error
+        raise ValueError('container value')
+
+    # If the values are of one type
+    if len(types) == 1:
+        # Get array type code for the type, or None
+        typecode = _types.get(types.pop())
+
+    # If the values are integers and floats
+    elif types == {int, float}:
+        # Use array of floats if the integers are exact as floats, else list
+        typecode = 'd' if _floats_exact(
+            [v for v in values if type(v) is int]) else None
+
+    # If the values are of other types
+    else:
+        # Use list
+        typecode = None
+
+    # If the column is a list
+    if type(column) is list:
+        # Add the values
+        column.extend(values)
+
+        # Return the column
+        return column
+
+    # If the values need a list
+    if typecode is None:
+        # If the column is not new
+        if column is not None:
+            # Convert the column to list
+            column = column.tolist()
+
+            # Add the values
+            column.extend(values)
+
+        # If the column is new
+        else:
+            # Create list column
+            column = list(values)
+
+        # Return the column
+        return column
+
+    # If the column is array of integers, and the values need floats
+    if column is not None and typecode != column.typecode:
+        # Get the integers to be made floats, from the column if it is
+        # array of integers, else from the values
+        ints = column if typecode == 'd' else values
+
+        # If an integer is not exact as float
+        if not _floats_exact(ints):
+            # Convert the column to list
+            column = column.tolist()
+
+            # Add the values
+            column.extend(values)
+
+            # Return the column
+            return column
+
+        # If the column is array of integers
+        if typecode == 'd':
+            # Convert the column to array of floats
+            column = array('d', column)
+
+        # If the column is array of floats
+        else:
+            # Add the integers as floats
+            typecode = 'd'
+
+    #
+    try:
+        # Create array of the values
+        values = array(typecode, values)
+
+    # If an integer does not fit in 64 bits
+    except OverflowError:
+        # If the column is new
+        if column is None:
+            # Create list column
+            return list(values)
+
+        # Convert the column to list
+        column = column.tolist()
+
+        # Add the values
+        column.extend(values)
+
+        # Return the column
+        return column
+
+    # If the column is new
+    if column is None:
+        # Use the array as column
+        return values
+
+    # Add the array to the column
+    column.extend(values)
+
+    # Return the column
+    return column
+
+
+#
+def _extend_columns(s, columns, rows, starts,
+        _is_container={dict, list}.__contains__):
+    # Move rows of property values into columns of
+    # "JSONDecoder.decode_columns".
+    #
+    # @param s: JSON data.
+    #
+    # @param columns: A list of columns, None for new columns.
+    #
+    # @param rows: A list of tuples of property values.
+    #
+    # @param starts: A list of the rows' objects' starting positions.
+    #
+    # @param _is_container: Test function of whether a type is of
+    # containers.
+    #
+    # @return: A list of the columns.
+
+    #
+    try:
+        # Add the values to each column
+        return list(map(_extend_column, columns, zip(*rows)))
+
+    # If a value is object or array
+    except ValueError:
+        # For each row
+        for values, start in zip(rows, starts):
+            # If a value of the row is object or array
+            if any(map(_is_container, map(type, values))):
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting no object or array property values",
+                    s, start) from None
+
+        # Raise the error if it is from elsewhere
+        raise
+
+
+# Map scalar value's starting character to event name yielded by
+# "JSONDecoder.iterparse". Other starting characters are of numbers.
+_SCALAR_EVENTS = {
+    '"': 'string',
+    'n': 'null',
+    't': 'boolean',
+    'f': 'boolean',
+}
+
+
+# Event name for values selected by path. It is not a string so that it never
+# equals an event yielded by "JSONDecoder.iterparse".
+_ITEM_EVENT = object()
+
+
+#
+class _StreamBuffer(object):
+    # Sliding window over the text of a ``.read()``-supporting file-like
+    # object.
+    #
+    # Text before the parsing position is dropped whenever more text is read,
+    # so memory use is bounded by one chunk plus the longest token that
+    # crosses a chunk boundary.
+
+    def __init__(self, fp, bufsize=DEFAULT_BUFSIZE):
+        # @param fp: A ``.read()``-supporting file-like object, or a ``str``
+        # or bytes-like object containing all JSON data.
+        #
+        # @param bufsize: Number of characters to read at a time.
+
+        # If given JSON data is string
+        if isinstance(fp, str):
+            # Window text is the whole JSON data
+            self.s = fp
+
+            # No file object
+            self.fp = None
+
+        # If given JSON data is bytes-like object
+        elif isinstance(fp, _BYTES_TYPES):
+            # Window text
+            self.s = ''
+
+            # Read text decoded from the bytes chunk by chunk
+            self.fp = _TextReader(_BytesReader(fp))
+
+        # If given JSON data is file object
+        else:
+            # Window text
+            self.s = ''
+
+            # File object
+            self.fp = fp
+
+        # Number of characters to read at a time
+        self.bufsize = bufsize
+
+        # Absolute position of window start
+        self.offset = 0
+
+        # Number of newlines before window start
+        self.lineno = 0
+
+        # Number of characters between the last newline and window start
+        self.colno = 0
+
+        # Whether end of file is reached
+        self.eof = self.fp is None
+
+    def start(self):
+        # Skip starting white spaces, and check for BOM.
+        #
+        # @return: Window position of the first non-white-space character.
+
+        # Skip starting white spaces
+        idx = self.skip(0)
+
+        # If JSON data start with BOM
+        if self.s.startswith('\ufeff'):
+            # Raise error
+            raise self.error(
+                "Unexpected UTF-8 BOM (decode using utf-8-sig)", 0)
+
+        # Return the position
+        return idx
+
+    def fill(self, idx):
+        # Drop window text before given position, and read more text.
+        #
+        # @param idx: Window position of the first character to keep.
+        #
+        # @return: The position's new window position.
+
+        # Get window text
+        s = self.s
+
+        # Read at least one chunk. Read as much as the kept text so that a
+        # long token crossing many chunks is rescanned a logarithmic number
+        # of times only.
+        chunk = self.fp.read(max(self.bufsize, len(s) - idx))
+
+        # If the chunk is not string
+        if not isinstance(chunk, str):
+            # Read text decoded from the file's bytes from now on
+            self.fp = _TextReader(self.fp, chunk)
+
+            # Decode the chunk
+            chunk = self.fp.read(max(self.bufsize, len(s) - idx))
+
+        # Count newlines in dropped text
+        newlines = s.count('\n', 0, idx)
+
+        # If dropped text has newlines
+        if newlines:
+            # Update line number
+            self.lineno += newlines
+
+            # Reset column number
+            self.colno = idx - s.rfind('\n', 0, idx) - 1
+
+        # If dropped text has no newlines
+        else:
+            # Update column number
+            self.colno += idx
+
+        # Update absolute position of window start
+        self.offset += idx
+
+        # If the chunk is empty
+        if not chunk:
+            # Set end of file reached
+            self.eof = True
+
+        # Drop text before given position, and add the chunk
+        self.s = s[idx:] + chunk
+
+        # Return the position's new window position
+        return 0
+
+    def skip(self, idx, _w=WHITESPACE.match):
+        # Skip white spaces, reading more text if white spaces reach window
+        # end.
+        #
+        # @param idx: Window position.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: Window position of the next non-white-space character, or
+        # window end if end of file is reached.
+
+        # Loop
+        while True:
+            # Skip white spaces
+            idx = _w(self.s, idx).end()
+
+            # If not reach window end, or end of file is reached
+            if idx < len(self.s) or self.eof:
+                # Return the position
+                return idx
+
+            # Read more text
+            idx = self.fill(idx)
+
+    def truncated(self, err):
+        # Test whether a string decode error may be caused by window end.
+        #
+        # @param err: JSONDecodeError object with window position.
+        #
+        # @return: Boolean.
+
+        # An unterminated string, or an error in an escape sequence near
+        # window end
+        return (err.msg.startswith('Unterminated string')
+                or err.pos + 6 >= len(self.s))
+
+    def error(self, msg, idx):
+        # Create decode error with position relative to file start.
+        #
+        # @param msg: Error message.
+        #
+        # @param idx: Window position where parsing failed.
+        #
+        # @return: JSONDecodeError object. Its ``doc`` is the window text.
+
+        # Create error
+        return _window_error(msg, self.s, idx, self.offset, self.lineno,
+                             self.colno)
+
+
+#
+class JSONDecoder(object):
+    """Simple JSON <http://json.org> decoder
+
+    Performs the following translations in decoding by default:
+
+    +---------------+-------------------+
+    | JSON          | Python            |
+    +===============+===================+
+    | object        | dict              |
+    +---------------+-------------------+
+    | array         | list              |
+    +---------------+-------------------+
+    | string        | str               |
+    +---------------+-------------------+
+    | number (int)  | int               |
+    +---------------+-------------------+
+    | number (real) | float             |
+    +---------------+-------------------+
+    | true          | True              |
+    +---------------+-------------------+
+    | false         | False             |
+    +---------------+-------------------+
+    | null          | None              |
+    +---------------+-------------------+
+
+    It also understands ``NaN``, ``Infinity``, and ``-Infinity`` as
+    their corresponding ``float`` values, which is outside the JSON spec.
+
+    """
+
+    def __init__(self, object_hook=None, parse_float=None,
+            parse_int=None, parse_constant=None, strict=True,
+            object_pairs_hook=None, memo=None, lazy=False, iterative=False,
+            max_depth=None, number_arrays=False, number_cache=0,
+            value_memo=None, value_maxlen=DEFAULT_VALUE_MAXLEN):
+        """``object_hook``, if specified, will be called with the result
+        of every JSON object decoded and its return value will be used in
+        place of the given ``dict``.  This can be used to provide custom
+        deserializations (e.g. to support JSON-RPC class hinting).
+
+        ``object_pairs_hook``, if specified will be called with the result of
+        every JSON object decoded with an ordered list of pairs.  The return
+        value of ``object_pairs_hook`` will be used instead of the ``dict``.
+        This feature can be used to implement custom decoders that rely on the
+        order that the key and value pairs are decoded (for example,
+        collections.OrderedDict will remember the order of insertion). If
+        ``object_hook`` is also defined, the ``object_pairs_hook`` takes
+        priority.
+
+        ``parse_float``, if specified, will be called with the string
+        of every JSON float to be decoded. By default this is equivalent to
+        float(num_str). This can be used to use another datatype or parser
+        for JSON floats (e.g. decimal.Decimal).
+
+        ``parse_int``, if specified, will be called with the string
+        of every JSON int to be decoded. By default this is equivalent to
+        int(num_str). This can be used to use another datatype or parser
+        for JSON integers (e.g. float).
+
+        ``parse_constant``, if specified, will be called with one of the
+        following strings: -Infinity, Infinity, NaN.
+        This can be used to raise an exception if invalid JSON numbers
+        are encountered.
+
+        If ``strict`` is false (true is the default), then control
+        characters will be allowed inside strings.  Control characters in
+        this context are those with character codes in the 0-31 range,
+        including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+
+        ``memo``, if specified, is a ``KeyMemo`` used to intern decoded
+        object keys. It may be shared by several decoders so that documents
+        of the same schema reuse the same key strings. Dicts decoded by the
+        C scanner are then rebuilt with interned keys, and the pure-Python
+        scanner is used if ``object_hook`` or ``object_pairs_hook`` is
+        given. By default keys are interned within each document only.
+
+        If ``lazy`` is true, ``decode`` and ``raw_decode`` return a
+        ``LazyObject`` or ``LazyArray`` proxy for a document's top-level
+        object or array. One pass of regular expression matches over the
+        document records the start and end offsets of every object and
+        array, which costs about twice as much as a full ``decode`` with
+        the C scanner. A proxy then scans only its own level, jumping
+        over nested containers by those offsets, and each value is decoded
+        on first access, so reading a few values costs little more than the
+        pass. Lazy mode does not validate values that are never accessed:
+        the pass checks only that brackets match and strings are
+        terminated, and other syntax errors inside a value are raised when
+        it, or the container holding it, is accessed. ``lazy`` can not be
+        combined with ``object_hook`` or ``object_pairs_hook``.
+
+        If ``iterative`` is true, nested objects and arrays are decoded by
+        a pure-Python engine that keeps open containers on an explicit
+        stack instead of recursing, so deeply nested documents do not raise
+        ``RecursionError``. ``max_depth``, if specified, is the maximum
+        nesting depth of objects and arrays that engine accepts; a document
+        nested deeper is rejected with ``JSONDecodeError`` as soon as the
+        limit is passed, also by ``decode_stream``, ``iter_items``,
+        ``iterparse``, ``build_index`` and lazy decoding. ``extract`` and
+        ``decode_columns`` count depth from each value they decode.
+        ``max_depth`` requires ``iterative``.
+
+        If ``number_arrays`` is true, an array whose values are all plain
+        numbers (not ``NaN`` or ``Infinity``) is decoded in bulk into an
+        ``array('q')`` if they are all integers fitting in 64 bits, or into
+        an ``array('d')`` otherwise, instead of a ``list``. If it is
+        ``'numpy'``, such arrays are decoded into NumPy ``int64`` and
+        ``float64`` arrays. Arrays with other values, and empty arrays, are
+        decoded into lists. Other values are then decoded by the pure-Python
+        scanner, and ``number_arrays`` can not be combined with
+        ``parse_float``, ``parse_int`` or ``iterative``. Arrays that
+        ``decode_stream`` decodes element by element are packed the same
+        way, so the result does not depend on ``bufsize``.
+
+        ``number_cache``, if non-zero, is the maximum number of distinct
+        number literals cached within each document, so that numbers
+        repeated in a document, such as IDs, status codes and flags, are
+        parsed once and share one object. Decoding then uses the pure-Python
+        scanner.
+
+        ``value_memo``, if specified, is a ``KeyMemo`` used to intern decoded
+        string values of at most ``value_maxlen`` characters, so that
+        repeated enum-like values such as status names or country codes
+        share one ``str`` object. An LRU memo, which is the ``KeyMemo``
+        default, keeps them across documents, and may be shared by several
+        decoders; its ``maxsize`` bounds the number of values kept. Values
+        decoded by the C scanner are interned once each is decoded, so equal
+        strings still exist while it runs; only the interned ones are kept.
+        The C scanner's values are walked through dicts and lists only, not
+        through results of ``object_hook`` or ``object_pairs_hook``.
+
+        """
+        # If lazy mode is combined with object hooks
+        if lazy and (object_hook is not None or object_pairs_hook is not None):
+            # Raise error
+            raise ValueError(
+                'lazy can not be combined with object_hook or '
+                'object_pairs_hook')
+
+        # If maximum nesting depth is given without iterative engine
+        if max_depth is not None and not iterative:
+            # Raise error
+            raise ValueError('max_depth requires iterative')
+
+        # If number arrays mode is not a known value
+        if number_arrays not in (False, True, 'numpy'):
+            # Raise error
+            raise ValueError(
+                'number_arrays must be a bool or \'numpy\', not {!r}'.format(
+                    number_arrays))
+
+        # If number arrays mode is combined with number parse functions or
+        # iterative engine
+        if number_arrays and (parse_float is not None or
+                parse_int is not None or iterative):
+            # Raise error
+            raise ValueError(
+                'number_arrays can not be combined with parse_float, '
+                'parse_int or iterative')
+
+        # Object hook function
+        self.object_hook = object_hook
+
+        # Parse float function
+        self.parse_float = parse_float or float
+
+        # Parse int function
+        self.parse_int = parse_int or int
+
+        # Parse constant function
+        self.parse_constant = parse_constant or _CONSTANTS.__getitem__
+
+        # Whether disallow literal control characters
+        self.strict = strict
+
+        # Object pairs hook function
+        self.object_pairs_hook = object_pairs_hook
+
+        # Parse object function
+        self.parse_object = JSONObject
+
+        # Parse array function
+        self.parse_array = JSONArray
+
+        # Parse string function
+        self.parse_string = scanstring
+
+        # Memo for interning decoded object keys
+        self.memo = memo if memo is not None else KeyMemo(policy='document')
+
+        # Whether decode objects and arrays into lazy proxies
+        self.lazy = lazy
+
+        # Whether decode containers by explicit stack instead of recursion
+        self.iterative = iterative
+
+        # Maximum nesting depth of containers. None means no limit.
+        self.max_depth = max_depth
+
+        # Maximum number of number literals cached per document. 0 means no
+        # cache.
+        self.number_cache = number_cache
+
+        # Memo for interning decoded string values. None means no interning.
+        self.value_memo = value_memo
+
+        # Maximum length of interned string values
+        self.value_maxlen = value_maxlen
+
+        # Whether decode arrays of plain numbers in bulk. 'numpy' means into
+        # NumPy arrays.
+        self.number_arrays = number_arrays
+
+        # If number arrays are decoded into NumPy arrays
+        if number_arrays == 'numpy':
+            # Import here, as NumPy is optional and slow to import
+            import numpy
+
+            # Parse array function
+            self.parse_array = _make_number_array(self, numpy)
+
+        # If number arrays are decoded into arrays
+        elif number_arrays:
+            # Parse array function
+            self.parse_array = _make_number_array(self)
+
+        # If iterative engine is selected
+        if self.iterative:
+            # Create scan function that decodes containers by explicit stack
+            self.scan_once = scanner.make_iterative_scanner(self)
+
+        # If number arrays are decoded in bulk, or numbers are cached
+        elif self.number_arrays or self.number_cache:
+            # Create scan function that calls the parse array function and
+            # caches numbers, which the C scanner does not
+            self.scan_once = scanner.py_make_scanner(self)
+
+        # If object keys are interned in given memo, and objects are passed
+        # to object hooks
+        elif memo is not None and (object_hook is not None or
+                object_pairs_hook is not None):
+            # Create scan function that interns keys before calling the
+            # hooks, which the C scanner does not
+            self.scan_once = scanner.py_make_scanner(self)
+
+        # If string values are interned, or object keys are interned in
+        # given memo
+        elif self.value_memo is not None or memo is not None:
+            # Create scan function that interns string values and keys
+            self.scan_once = scanner.make_interning_scanner(
+                self, keys=memo is not None)
+
+        # If iterative engine is not selected
+        else:
+            # Create scan function
+            self.scan_once = scanner.make_scanner(self)
+
+        # Create validate function
+        self.validate_once = scanner.make_validator(self)
+
+
+    def decode(self, s, _w=WHITESPACE.match):
+        """Return the Python representation of ``s`` (a ``str`` instance
+        containing a JSON document).
+
+        """
+        # Decode JSON data to Python object.
+        # If JSON data have extraneous data at the end, raise error.
+        #
+        # @param s: JSON data.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: Python object.
+
+        # Skip starting white spaces.
+        # Call "raw_decode" to decode the JSON data.
+        # Get result object, and parsing end position.
+        obj, end = self.raw_decode(s, idx=_w(s, 0).end())
+
+        # Skip ending white spaces, get parsing end position
+        end = _w(s, end).end()
+
+        # If parsing end position is not JSON data end
+        if end != len(s):
+            # Raise error
+            raise JSONDecodeError("Extra data", s, end)
+
+        # Return the result object
+        return obj
+
+    def raw_decode(self, s, idx=0):
+        """Decode a JSON document from ``s`` (a ``str`` beginning with
+        a JSON document) and return a 2-tuple of the Python
+        representation and the index in ``s`` where the document ended.
+
+        This can be used to decode a JSON document from a string that may
+        have extraneous data at the end.
+
+        """
+        # Decode JSON data to Python object.
+        #
+        # @param s: JSON data.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: Python object, and parsing end position.
+
+        # If lazy mode is on
+        if self.lazy:
+            # Scan a value into lazy proxy.
+            # Return the proxy, and parsing end position.
+            return self._scan_lazy(s, idx)
+
+        #
+        try:
+            # Scan a value, get parsing end position
+            obj, end = self.scan_once(s, idx)
+
+        # If no more value
+        except StopIteration as err:
+            # Raise error
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+
+        # Return the Python object, and parsing end position
+        return obj, end
+
+    def _scan_lazy(self, s, idx, tables=None,
+            _number_chars=NUMBER_ARRAY_CHARS.match):
+        # Scan a value, decoding object or array into lazy proxy.
+        #
+        # @param s: JSON data.
+        #
+        # @param idx: Start position.
+        #
+        # @param tables: Start, end and skip tables of the document's
+        # containers. None for a top-level value.
+        #
+        # @param _number_chars: Number array characters match function.
+        #
+        # @return: Python object or lazy proxy, and parsing end position.
+
+        # Get the value's first character
+        nextchar = s[idx:idx + 1]
+
+        #
+        try:
+            # If the character is starting `{` or `[` of JSON container
+            if nextchar == '{' or nextchar == '[':
+                # If arrays of plain numbers are decoded in bulk, and the
+                # array has only characters of numbers
+                if nextchar == '[' and self.number_arrays and \
+                        _number_chars(s, idx + 1):
+                    # Decode the array in bulk.
+                    # Return the array, and parsing end position.
+                    return self.parse_array((s, idx + 1), self.scan_once)
+
+                # If the value is top-level
+                if tables is None:
+                    # Match the brackets of the whole value in one pass,
+                    # recording every container's text span
+                    tables = _container_tables(s, idx, self.max_depth)[0]
+
+                    # The container is the first in the tables
+                    entry = 0
+
+                # If the value is nested
+                else:
+                    # Find the container's entry by its start position
+                    entry = bisect_left(tables[0], idx)
+
+                # Scan the container's own structure.
+                # Return the proxy, and parsing end position.
+                return (self._lazy_object if nextchar == '{'
+                        else self._lazy_array)(s, idx + 1, tables, entry)
+
+            #
+            try:
+                # Scan a scalar value.
+                # Return the value, and parsing end position.
+                return self.scan_once(s, idx)
+
+            # If no more value
+            except StopIteration as err:
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting value", s, err.value) from None
+
+        # Before returning
+        finally:
+            # End memo's document
+            self.memo.end_document()
+
+    def _lazy_object(self, s, end, tables, entry, _w=WHITESPACE.match,
+            _ws=WHITESPACE_STR, _skip=skip_value):
+        # Scan JSON object's structure into lazy proxy.
+        #
+        # Mirrors "JSONObject", except that values are skipped, not decoded.
+        # Nested containers are jumped over by the tables.
+        #
+        # @param s: JSON data.
+        #
+        # @param end: Position after the starting `{`.
+        #
+        # @param tables: Start, end and skip tables of the document's
+        # containers.
+        #
+        # @param entry: The object's number in the tables.
+        #
+        # @return: LazyObject, and parsing end position.
+
+        # Map property name to value position
+        index = {}
+
+        # Get containers' end and skip tables
+        _, ends, skips = tables
+
+        # Number of the next nested container
+        child = entry + 1
+
+        # Get memo's setdefault function
+        memo_get = self.memo.setdefault
+
+        # Get parse string function
+        scanstring = self.parse_string
+
+        # Get whether disallow literal control characters
+        strict = self.strict
+
+        # Get the next character
+        nextchar = s[end:end + 1]
+
+        # If the next character is not `"`
+        if nextchar != '"':
+            # If the next character is white space
+            if nextchar in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
+
+                # Get the next character
+                nextchar = s[end:end + 1]
+
+            # If the next character is ending `}` of JSON object
+            if nextchar == '}':
+                # Return empty proxy, and parsing end position
+                return LazyObject(self, s, index, tables), end + 1
+
+            # If the next character is not `"`
+            elif nextchar != '"':
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting property name enclosed in double quotes",
+                    s, end)
+
+        # Skip the `"`
+        end += 1
+
+        # Loop
+        while True:
+            # Scan property name, get parsing end position
+            key, end = scanstring(s, end, strict)
+
+            # Intern the property name
+            key = memo_get(key, key)
+
+            # If the next character is not `:`
+            if s[end:end + 1] != ':':
+                # Skip white spaces
+                end = _w(s, end).end()
+
+                # If the next character is not `:`
+                if s[end:end + 1] != ':':
+                    # Raise error
+                    raise JSONDecodeError("Expecting ':' delimiter", s, end)
+
+            # Skip the `:`
+            end += 1
+
+            # If the next character is white space
+            if s[end:end + 1] in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
+
+            # Record the value position.
+            #
+            # Later duplicate names win, same as the dict "JSONObject" builds.
+            index[key] = end
+
+            # Get the value's first character
+            nextchar = s[end:end + 1]
+
+            # If the value is object or array
+            if nextchar == '{' or nextchar == '[':
+                # Jump to the container's end position
+                end = ends[child]
+
+                # Get the number of the next nested container
+                child = skips[child]
+
+            # If the value is scalar
+            else:
+                # Skip the value, get parsing end position
+                end = _skip(s, end)
+
+            # Get the next character
+            nextchar = s[end:end + 1]
+
+            # If the next character is white space
+            if nextchar in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
+
+                # Get the next character
+                nextchar = s[end:end + 1]
+
+            # Skip the next character
+            end += 1
+
+            # If the next character is ending `}` of JSON object
+            if nextchar == '}':
+                # Stop the loop
+                break
+
+            # If the next character is not `,`
+            elif nextchar != ',':
+                # Raise error
+                raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
+
+            # Skip white spaces
+            end = _w(s, end).end()
+
+            # Get the next character
+            nextchar = s[end:end + 1]
+
+            # Skip the next character
+            end += 1
+
+            # If the next character is not `"`
+            if nextchar != '"':
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting property name enclosed in double quotes",
+                    s, end - 1)
+
+        # Return the proxy, and parsing end position
+        return LazyObject(self, s, index, tables), end
+
+    def _lazy_array(self, s, end, tables, entry, _w=WHITESPACE.match,
+            _ws=WHITESPACE_STR, _skip=skip_value):
+        # Scan JSON array's structure into lazy proxy.
+        #
+        # Mirrors "JSONArray", except that elements are skipped, not decoded.
+        # Nested containers are jumped over by the tables.
+        #
+        # @param s: JSON data.
+        #
+        # @param end: Position after the starting `[`.
+        #
+        # @param tables: Start, end and skip tables of the document's
+        # containers.
+        #
+        # @param entry: The array's number in the tables.
+        #
+        # @return: LazyArray, and parsing end position.
+
+        # Element positions
+        index = array('q')
+
+        # Get containers' end and skip tables
+        _, ends, skips = tables
+
+        # Number of the next nested container
+        child = entry + 1
+
+        # Get the next character
+        nextchar = s[end:end + 1]
+
+        # If the next character is white space
+        if nextchar in _ws:
+            # Skip white spaces
+            end = _w(s, end).end()
+
+            # Get the next character
+            nextchar = s[end:end + 1]
+
+        # If the next character is ending `]` of JSON array
+        if nextchar == ']':
+            # Return empty proxy, and parsing end position
+            return LazyArray(self, s, index, tables), end + 1
+
+        # Get append function
+        _append = index.append
+
+        # Loop
+        while True:
+            # Record the element position
+            _append(end)
+
+            # Get the element's first character
+            nextchar = s[end:end + 1]
+
+            # If the element is object or array
+            if nextchar == '{' or nextchar == '[':
+                # Jump to the container's end position
+                end = ends[child]
+
+                # Get the number of the next nested container
+                child = skips[child]
+
+            # If the element is scalar
+            else:
+                # Skip the element, get parsing end position
+                end = _skip(s, end)
+
+            # Get the next character
+            nextchar = s[end:end + 1]
+
+            # If the next character is white space
+            if nextchar in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
+
+                # Get the next character
+                nextchar = s[end:end + 1]
+
+            # Skip the next character
+            end += 1
+
+            # If the next character is ending `]` of JSON array
+            if nextchar == ']':
+                # Stop the loop
+                break
+
+            # If the next character is not `,`
+            elif nextchar != ',':
+                # Raise error
+                raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
+
+            # If the next character is white space
+            if s[end:end + 1] in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
+
+        # Return the proxy, and parsing end position
+        return LazyArray(self, s, index, tables), end
+
+    def validate(self, s, _w=WHITESPACE.match):
+        """Check that ``s`` (a ``str`` instance) is a valid JSON document,
+        raising ``JSONDecodeError`` at the first error as ``decode`` would.
+
+        The grammar and string escapes are checked without creating any
+        dict, list, string or number. ``parse_constant`` is still called
+        for ``NaN``, ``Infinity`` and ``-Infinity``, so that it can reject
+        them.
+
+        """
+        # Validate JSON data.
+        # If JSON data have extraneous data at the end, raise error.
+        #
+        # @param s: JSON data.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: None.
+
+        #
+        try:
+            # Skip starting white spaces.
+            # Validate a value, get parsing end position.
+            end = self.validate_once(s, _w(s, 0).end())
+
+        # If no value
+        except StopIteration as err:
+            # Raise error
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+
+        # Skip ending white spaces, get parsing end position
+        end = _w(s, end).end()
+
+        # If parsing end position is not JSON data end
+        if end != len(s):
+            # Raise error
+            raise JSONDecodeError("Extra data", s, end)
+
+    def build_index(self, s, _w=WHITESPACE.match):
+        """Return a ``StructuralIndex`` of ``s`` (a ``str`` instance
+        containing a JSON document), for repeated lookups by path.
+
+        The whole document's structure is checked and recorded in one pass,
+        decoding property names only. Each lookup then jumps through the
+        index and decodes only the value it finds.
+
+        """
+        # Build structural index of JSON data.
+        # If JSON data have extraneous data at the end, raise error.
+        #
+        # @param s: JSON data.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: StructuralIndex.
+
+        # Skip starting white spaces.
+        # Scan the JSON data into index tables.
+        # Get the tables, and parsing end position.
+        tables, end = self._index_tables(s, _w(s, 0).end())
+
+        # Skip ending white spaces, get parsing end position
+        end = _w(s, end).end()
+
+        # If parsing end position is not JSON data end
+        if end != len(s):
+            # Raise error
+            raise JSONDecodeError("Extra data", s, end)
+
+        # Return the index
+        return StructuralIndex(self, s, *tables)
+
+    def _index_tables(self, s, end, _w=WHITESPACE.match, _ws=WHITESPACE_STR,
+            _skip=skip_value):
+        # Scan JSON value's structure into index tables.
+        #
+        # Nested containers are tracked by an explicit stack, so deep
+        # documents do not hit the recursion limit.
+        #
+        # @param s: JSON data.
+        #
+        # @param end: Position of the value's first character.
+        #
+        # @return: A tuple of start, end, skip and property name tables, and
+        # parsing end position.
+
+        # Entries' start positions
+        starts = array('q')
+
+        # Entries' end positions
+        ends = array('q')
+
+        # Numbers of the entries after entries' subtrees
+        skips = array('q')
+
+        # Entries' property names
+        keys = []
+
+        # Stack of open containers' entry numbers
+        stack = []
+
+        # Get memo's setdefault function
+        memo_get = self.memo.setdefault
+
+        # Get parse string function
+        scanstring = self.parse_string
+
+        # Get whether disallow literal control characters
+        strict = self.strict
+
+        # Property name of the next value
+        key = None
+
+        # Get maximum nesting depth of containers. None means no limit.
+        max_depth = self.max_depth
+
+        #
+        try:
+            # Loop for each value
+            while True:
+                # Get the value's entry number
+                entry = len(starts)
+
+                # Add the value's entry
+                starts.append(end)
+                ends.append(-1)
+                skips.append(-1)
+                keys.append(key)
+
+                # Get the value's first character
+                nextchar = s[end:end + 1]
+
+                # If the value is object or array
+                if nextchar == '{' or nextchar == '[':
+                    # If the container is nested too deep
+                    if max_depth is not None and len(stack) >= max_depth:
+                        # Raise error
+                        raise JSONDecodeError(
+                            "Maximum nesting depth exceeded", s, end)
+
+                    # Push the container
+                    stack.append(entry)
+
+                    # Skip the starting bracket, and white spaces
+                    end = _w(s, end + 1).end()
+
+                    # Get the next character
+                    char = s[end:end + 1]
+
+                    # If the container is empty
+                    if char == ('}' if nextchar == '{' else ']'):
+                        # Close it below
+                        pass
+
+                    # If the container is array
+                    elif nextchar == '[':
+                        # Scan the first element
+                        key = None
+
+                        # Continue with the element
+                        continue
+
+                    # If the next character is not `"`
+                    elif char != '"':
+                        # Raise error
+                        raise JSONDecodeError(
+                            "Expecting property name enclosed in double "
+                            "quotes", s, end)
+
+                    # If the container is object with members
+                    else:
+                        # Scan the first property name
+                        key, end = self._index_key(
+                            s, end + 1, scanstring, strict, memo_get)
+
+                        # Continue with the member's value
+                        continue
+
+                # If the value is scalar
+                else:
+                    # Skip the value, get parsing end position
+                    end = _skip(s, end)
+
+                    # Record the value's end position
+                    ends[entry] = end
+
+                    # Record the entry number after the value
+                    skips[entry] = entry + 1
+
+                    # If the value is top-level
+                    if not stack:
+                        # Return the tables, and parsing end position
+                        return (starts, ends, skips, keys), end
+
+                # Loop to close containers
+                while True:
+                    # Get the next character
+                    char = s[end:end + 1]
+
+                    # If the next character is white space
+                    if char in _ws:
+                        # Skip white spaces
+                        end = _w(s, end).end()
+
+                        # Get the next character
+                        char = s[end:end + 1]
+
+                    # Get the innermost container's entry number
+                    top = stack[-1]
+
+                    # Get whether the container is object
+                    is_object = s[starts[top]] == '{'
+
+                    # If the next character is `,`
+                    if char == ',':
+                        # Skip the `,` and white spaces
+                        end = _w(s, end + 1).end()
+
+                        # If the container is array
+                        if not is_object:
+                            # Scan the next element
+                            key = None
+
+                        # If the next character is not `"`
+                        elif s[end:end + 1] != '"':
+                            # Raise error
+                            raise JSONDecodeError(
+                                "Expecting property name enclosed in double "
+                                "quotes", s, end)
+
+                        # If the next character is `"`
+                        else:
+                            # Scan the next property name
+                            key, end = self._index_key(
+                                s, end + 1, scanstring, strict, memo_get)
+
+                        # Continue with the next value
+                        break
+
+                    # If the next character is not the container's ending
+                    # bracket
+                    if char != ('}' if is_object else ']'):
+                        # Raise error
+                        raise JSONDecodeError(
+                            "Expecting ',' delimiter", s, end)
+
+                    # Skip the ending bracket
+                    end += 1
+
+                    # Pop the container
+                    stack.pop()
+
+                    # Record the container's end position
+                    ends[top] = end
+
+                    # Record the entry number after the container's subtree
+                    skips[top] = len(starts)
+
+                    # If the container is top-level
+                    if not stack:
+                        # Return the tables, and parsing end position
+                        return (starts, ends, skips, keys), end
+
+        # Before returning
+        finally:
+            # End memo's document
+            self.memo.end_document()
+
+    def _index_key(self, s, end, scanstring, strict, memo_get,
+            _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+        # Scan property name and the following `:`.
+        #
+        # @param s: JSON data.
+        #
+        # @param end: Position after the property name's starting `"`.
+        #
+        # @param scanstring: Parse string function.
+        #
+        # @param strict: Whether disallow literal control characters.
+        #
+        # @param memo_get: Memo's setdefault function.
+        #
+        # @return: Property name, and position of the member's value.
+
+        # Scan property name, get parsing end position
+        key, end = scanstring(s, end, strict)
+
+        # Intern the property name
+        key = memo_get(key, key)
+
+        # If the next character is not `:`
+        if s[end:end + 1] != ':':
+            # Skip white spaces
+            end = _w(s, end).end()
+
+            # If the next character is not `:`
+            if s[end:end + 1] != ':':
+                # Raise error
+                raise JSONDecodeError("Expecting ':' delimiter", s, end)
+
+        # Skip the `:`
+        end += 1
+
+        # If the next character is white space
+        if s[end:end + 1] in _ws:
+            # Skip white spaces
+            end = _w(s, end).end()
+
+        # Return the property name, and position of the value
+        return key, end
+
+    def extract(self, s, pointer, _w=WHITESPACE.match):
+        """Return the Python representation of the value at RFC 6901 JSON
+        pointer ``pointer`` (e.g. ``'/a/b/3'``) in ``s`` (a ``str`` instance
+        containing a JSON document). If ``pointer`` is a sequence of
+        pointers, return the list of their values.
+
+        The text is walked with the scanning primitives: subtrees off the
+        pointers' paths are skipped by ``skip_value``, each container on a
+        path is walked once, and only the targeted values are decoded.
+        Skipping a container costs about as much as decoding it with the C
+        scanner, so the saving comes from the text after the targets, which
+        is not walked at all. That text is not checked: a document that is
+        truncated or invalid after the last target value is not rejected,
+        e.g. ``extract('[1, 2', '/0')`` returns ``1``. For the pointer
+        ``''`` the whole document is the target, and extra data after it is
+        rejected as in ``decode``. The first occurrence of a duplicated
+        property name is used. Raise ``KeyError`` with the pointer if no
+        value is at it.
+
+        """
+        # Extract values at given JSON pointers.
+        #
+        # @param s: JSON data.
+        #
+        # @param pointer: JSON pointer string, or sequence of them.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: Python object, or list of Python objects.
+
+        # Whether given one pointer
+        single = isinstance(pointer, str)
+
+        # Get list of pointers
+        pointers = [pointer] if single else list(pointer)
+
+        # Find the pointers' values, get map pointer to its value's position
+        found = self._find_pointers(s, pointers)
+
+        # Map value position to decoded value, to decode a value pointed to
+        # by several pointers once
+        decoded = {}
+
+        # List of values
+        values = []
+
+        # For each pointer
+        for ptr in pointers:
+            # Get the value's position.
+            # Pointer not found raises KeyError.
+            idx = found[ptr]
+
+            # If the value is not decoded yet
+            if idx not in decoded:
+                # Decode the value, get parsing end position
+                decoded[idx], end = self.raw_decode(s, idx)
+
+                # If the value is the whole document
+                if ptr == '':
+                    # Skip ending white spaces, get parsing end position
+                    end = _w(s, end).end()
+
+                    # If parsing end position is not JSON data end
+                    if end != len(s):
+                        # Raise error
+                        raise JSONDecodeError("Extra data", s, end)
+
+            # Add the value
+            values.append(decoded[idx])
+
+        # Return the value, or list of values
+        return values[0] if single else values
+
+    def _find_pointers(self, s, pointers, _w=WHITESPACE.match):
+        # Find the values at JSON pointers without decoding them.
+        #
+        # @param s: JSON data.
+        #
+        # @param pointers: List of JSON pointer strings.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: Dict that maps found pointer to its value's position.
+
+        # Trie of pointers' tokens. Each node is a list of the pointers
+        # ending at it, and a dict that maps token to child node.
+        root = [[], {}]
+
+        # For each pointer
+        for ptr in pointers:
+            # Start from root node
+            node = root
+
+            # For each token of the pointer
+            for token in parse_pointer(ptr):
+                # Get or add the token's child node
+                node = node[1].setdefault(token, [[], {}])
+
+            # Add the pointer to its node
+            node[0].append(ptr)
+
+        # Map pointer to its value's position
+        found = {}
+
+        #
+        try:
+            # Skip starting white spaces.
+            # Walk the top-level value.
+            self._extract_value(s, _w(s, 0).end(), root, found, False)
+
+        # Before returning
+        finally:
+            # End memo's document
+            self.memo.end_document()
+
+        # Return the found positions
+        return found
+
+    def _extract_value(self, s, idx, node, found, finish,
+            _skip=skip_value):
+        # Walk a value for extraction.
+        #
+        # @param s: JSON data.
+        #
+        # @param idx: Position of the value's first character.
+        #
+        # @param node: Pointer trie node of the value.
+        #
+        # @param found: Dict to put found pointers' value positions into.
+        #
+        # @param finish: Whether walk to the value's end, so that the outer
+        # container can go on after it. Otherwise walking stops once all
+        # pointers under the value are found.
+        #
+        # @return: Position after the value if "finish" is true, otherwise
+        # None.
+
+        # Get the pointers ending at the value, and child nodes
+        targets, children = node
+
+        # For each pointer ending at the value
+        for ptr in targets:
+            # Put the value's position
+            found[ptr] = idx
+
+        # If have child nodes
+        if children:
+            # Get the value's first character
+            nextchar = s[idx:idx + 1]
+
+            # If the value is object
+            if nextchar == '{':
+                # Walk the object's members.
+                # Return the position after the object, or None.
+                return self._extract_object(
+                    s, idx + 1, children, found, finish)
+
+            # If the value is array
+            elif nextchar == '[':
+                # Walk the array's elements.
+                # Return the position after the array, or None.
+                return self._extract_array(
+                    s, idx + 1, children, found, finish)
+
+        # If the value has no wanted children.
+
+        # Skip the value if need its end.
+        # Return the position after the value, or None.
+        return _skip(s, idx) if finish else None
+
+    def _extract_object(self, s, end, children, found, finish,
+            _w=WHITESPACE.match, _ws=WHITESPACE_STR, _skip=skip_value):
+        # Walk JSON object's members for extraction.
+        #
+        # @param s: JSON data.
+        #
+        # @param end: Position after the starting `{`.
+        #
+        # @param children: Dict that maps token to child node.
+        #
+        # @param found: Dict to put found pointers' value positions into.
+        #
+        # @param finish: Whether walk to the object's end.
+        #
+        # @return: Position after the object if "finish" is true, otherwise
+        # None.
+
+        # Property names not found yet
+        pending = set(children)
+
+        # Get memo's setdefault function
+        memo_get = self.memo.setdefault
+
+        # Skip white spaces
+        end = _w(s, end).end()
+
+        # Get the next character
+        nextchar = s[end:end + 1]
+
+        # If the next character is ending `}` of JSON object
+        if nextchar == '}':
+            # Return the position after the object
+            return end + 1
+
+        # If the next character is not `"`
+        if nextchar != '"':
+            # Raise error
+            raise JSONDecodeError(
+                "Expecting property name enclosed in double quotes", s, end)
+
+        # Loop
+        while True:
+            # Scan property name and `:`, get position of the value
+            key, end = self._index_key(
+                s, end + 1, self.parse_string, self.strict, memo_get)
+
+            # If the property is wanted
+            if key in pending:
+                # Mark the property found
+                pending.remove(key)
+
+                # If all pointers are found after walking the value, and the
+                # object's end is not needed
+                if not pending and not finish:
+                    # Walk the value.
+                    # Stop walking.
+                    return self._extract_value(
+                        s, end, children[key], found, False)
+
+                # Walk the value to its end, get parsing end position
+                end = self._extract_value(s, end, children[key], found, True)
+
+            # If the property is not wanted
+            else:
+                # Skip the value, get parsing end position
+                end = _skip(s, end)
+
+            # Get the next character
+            nextchar = s[end:end + 1]
+
+            # If the next character is white space
+            if nextchar in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
+
+                # Get the next character
+                nextchar = s[end:end + 1]
+
+            # If the next character is ending `}` of JSON object
+            if nextchar == '}':
+                # Return the position after the object
+                return end + 1
+
+            # If the next character is not `,`
+            if nextchar != ',':
+                # Raise error
+                raise JSONDecodeError("Expecting ',' delimiter", s, end)
+
+            # Skip the `,` and white spaces
+            end = _w(s, end + 1).end()
+
+            # If the next character is not `"`
+            if s[end:end + 1] != '"':
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting property name enclosed in double quotes",
+                    s, end)
+
+    def _extract_array(self, s, end, children, found, finish,
+            _w=WHITESPACE.match, _ws=WHITESPACE_STR, _skip=skip_value,
+            _index=ARRAY_INDEX.fullmatch):
+        # Walk JSON array's elements for extraction.
+        #
+        # @param s: JSON data.
+        #
+        # @param end: Position after the starting `[`.
+        #
+        # @param children: Dict that maps token to child node.
+        #
+        # @param found: Dict to put found pointers' value positions into.
+        #
+        # @param finish: Whether walk to the array's end.
+        #
+        # @return: Position after the array if "finish" is true, otherwise
+        # None.
+
+        # Map element index to child node.
+        # Tokens that are not array indexes match no element.
+        wanted = {int(token): node for token, node in children.items()
+                  if _index(token)}
+
+        # If no element is wanted
+        if not wanted:
+            # Skip the array if need its end.
+            # Return the position after the array, or None.
+            return _skip(s, end - 1) if finish else None
+
+        # Get the last wanted index
+        last = max(wanted)
+
+        # Element index
+        i = 0
+
+        # Skip white spaces
+        end = _w(s, end).end()
+
+        # If the next character is ending `]` of JSON array
+        if s[end:end + 1] == ']':
+            # Return the position after the array
+            return end + 1
+
+        # Loop
+        while True:
+            # Get the element's child node
+            node = wanted.get(i)
+
+            # If the element is wanted
+            if node is not None:
+                # If the element is the last wanted, and the array's end is
+                # not needed
+                if i == last and not finish:
+                    # Walk the element.
+                    # Stop walking.
+                    return self._extract_value(s, end, node, found, False)
+
+                # Walk the element to its end, get parsing end position
+                end = self._extract_value(s, end, node, found, True)
+
+            # If the element is not wanted
+            else:
+                # Skip the element, get parsing end position
+                end = _skip(s, end)
+
+            # Get the next character
+            nextchar = s[end:end + 1]
+
+            # If the next character is white space
+            if nextchar in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
+
+                # Get the next character
+                nextchar = s[end:end + 1]
+
+            # If the next character is ending `]` of JSON array
+            if nextchar == ']':
+                # Return the position after the array
+                return end + 1
+
+            # If the next character is not `,`
+            if nextchar != ',':
+                # Raise error
+                raise JSONDecodeError("Expecting ',' delimiter", s, end)
+
+            # Skip the `,` and white spaces
+            end = _w(s, end + 1).end()
+
+            # Increment element index
+            i += 1
+
+    def decode_columns(self, s, pointer='', use_numpy=None,
+            _w=WHITESPACE.match):
+        """Decode the array of objects at RFC 6901 JSON pointer ``pointer``
+        in ``s`` (a ``str`` instance containing a JSON document) into
+        columns, and return a 2-tuple of a dict that maps each property name
+        to the column of its values, and the number of elements. The number
+        is kept apart as the columns can not give it when the elements have
+        no properties, as in ``[{}, {}]``.
+
+        Every element of the array must be an object with the same property
+        names as the first, and no object or array property values. No dict
+        is kept per element: values are moved into columns, which are
+        ``array('q')`` if all values are integers fitting in 64 bits,
+        ``array('d')`` if all are numbers and the integers among them are at
+        most 2**53 in magnitude, so exact as floats, and ``list`` otherwise.
+        If ``use_numpy`` is true, or is None and NumPy can be imported, array
+        columns are returned as NumPy ``int64`` and ``float64`` arrays
+        sharing their memory, and columns of booleans as NumPy ``bool``
+        arrays.
+
+        With the default pointer ``''`` the whole document must be the
+        array, as in ``decode``. Otherwise the array is found as in
+        ``extract``, and ``KeyError`` with the pointer is raised if no value
+        is at it.
+
+        """
+        # Decode array of objects into columns.
+        #
+        # @param s: JSON data.
+        #
+        # @param pointer: JSON pointer string of the array.
+        #
+        # @param use_numpy: Whether return NumPy arrays. None means if NumPy
+        # can be imported.
+        #
+        # @param _w: White space match function.
+        #
+        # @return: Tuple of dict that maps property name to column, and number
+        # of elements.
+
+        # Find the array, get its position.
+        # Pointer not found raises KeyError.
+        idx = self._find_pointers(s, [pointer])[pointer]
+
+        # Decode the array into columns, get number of elements and parsing
+        # end position
+        columns, count, end = self._decode_columns(s, idx)
+
+        # If the array is the whole document
+        if pointer == '':
+            # Skip ending white spaces, get parsing end position
+            end = _w(s, end).end()
+
+            # If parsing end position is not JSON data end
+            if end != len(s):
+                # Raise error
+                raise JSONDecodeError("Extra data", s, end)
+
+        # If may use NumPy
+        if use_numpy is None or use_numpy:
+            #
+            try:
+                # Import here, as NumPy is optional and slow to import
+                import numpy
+
+            # If NumPy is not available
+            except ImportError:
+                # If NumPy is required
+                if use_numpy:
+                    # Raise error
+                    raise
+
+                # Not use NumPy
+                numpy = None
+
+            # If NumPy is available
+            if numpy is not None:
+                # For each column
+                for name, column in columns.items():
+                    # If the column is array
+                    if type(column) is array:
+                        # Convert to NumPy array sharing the array's memory
+                        columns[name] = numpy.frombuffer(
+                            column, numpy.float64 if column.typecode == 'd'
+                            else numpy.int64)
+
+                    # If the column is a list of booleans
+                    elif set(map(type, column)) == {bool}:
+                        # Convert to NumPy array of booleans
+                        columns[name] = numpy.array(column, numpy.bool_)
+
+        # Return the columns, and number of elements
+        return columns, count
+
+    def _decode_columns(self, s, idx, _w=WHITESPACE.match,
+            _ws=WHITESPACE_STR):
+        # Decode array of objects into columns.
+        #
+        # @param s: JSON data.
+        #
+        # @param idx: Position of the array's starting `[`.
+        #
+        # @param _w: White space match function.
+        #
+        # @param _ws: White-space character set.
+        #
+        # @return: Dict that maps property name to column, number of
+        # elements, and parsing end position.
+
+        # If the value is not array
+        if s[idx:idx + 1] != '[':
+            # Raise error
+            raise JSONDecodeError("Expecting array", s, idx)
+
+        # Get scan function
+        scan_once = self.scan_once
+
+        # Property names of the first object
+        names = None
+
+        # Columns of the property values
+        columns = None
+
+        # Tuples of property values of objects not moved into columns yet
+        rows = []
+
+        # Starting positions of the objects of the tuples
+        starts = []
+
+        # Number of objects moved into columns
+        count = 0
+
+        # Skip the `[`, and white spaces
+        end = _w(s, idx + 1).end()
+
+        # If the array is empty
+        if s[end:end + 1] == ']':
+            # Return no columns, no elements, and parsing end position
+            return {}, 0, end + 1
+
+        # Loop
+        while True:
+            #
+            try:
+                # Scan the element, get parsing end position
+                row, row_end = scan_once(s, end)
+
+            # If no more value
+            except StopIteration as err:
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting value", s, err.value) from None
+
+            # If the element is not object
+            if type(row) is not dict:
+                # Raise error
+                raise JSONDecodeError("Expecting object", s, end)
+
+            # If the element is the first
+            if names is None:
+                # Get the property names
+                names = list(row)
+
+                # Get the set of property names
+                name_set = frozenset(names)
+
+                # If the object has two or more properties
+                if len(names) > 1:
+                    # Get function that gets the property values as tuple
+                    get_values = itemgetter(*names)
+
+                # If the object has one property or none
+                else:
+                    # Get function that gets the property values as tuple
+                    get_values = lambda row: tuple(map(row.__getitem__, names))
+
+                # Create columns
+                columns = [None] * len(names)
+
+            # If the element has other property names than the first
+            elif row.keys() != name_set:
+                # Raise error
+                raise JSONDecodeError(
+                    "Expecting the same property names as the first object",
+                    s, end)
+
+            # Add the property values in the first object's order
+            rows.append(get_values(row))
+
+            # Add the object's starting position
+            starts.append(end)
 
-        ``parse_constant``, if specified, will be called with one of the
-        following strings: -Infinity, Infinity, NaN.
-        This can be used to raise an exception if invalid JSON numbers
-        are encountered.
+            # If enough objects are decoded
+            if len(rows) >= COLUMN_CHUNK_ROWS:
+                # Move the property values into columns
+                columns = _extend_columns(s, columns, rows, starts)
 
-        If ``strict`` is false (true is the default), then control
-        characters will be allowed inside strings.  Control characters in
-        this context are those with character codes in the 0-31 range,
-        including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+                # Count the objects
+                count += len(rows)
 
-        """
-        # Object hook function
-        self.object_hook = object_hook
+                # Clear the property values
+                rows = []
 
-        # Parse float function
-        self.parse_float = parse_float or float
+                # Clear the starting positions
+                starts = []
 
-        # Parse int function
-        self.parse_int = parse_int or int
+            # Get the next character
+            nextchar = s[row_end:row_end + 1]
 
-        # Parse constant function
-        self.parse_constant = parse_constant or _CONSTANTS.__getitem__
+            # If the character is white space
+            if nextchar in _ws:
+                # Skip white spaces
+                row_end = _w(s, row_end).end()
 
-        # Whether disallow literal control characters
-        self.strict = strict
+                # Get the next character
+                nextchar = s[row_end:row_end + 1]
 
-        # Object pairs hook function
-        self.object_pairs_hook = object_pairs_hook
+            # If the character is `]`
+            if nextchar == ']':
+                # Stop decoding
+                break
 
-        # Parse object function
-        self.parse_object = JSONObject
+            # If the character is not `,`
+            if nextchar != ',':
+                # Raise error
+                raise JSONDecodeError("Expecting ',' delimiter", s, row_end)
 
-        # Parse array function
-        self.parse_array = JSONArray
+            # Skip the `,`
+            end = row_end + 1
 
-        # Parse string function
-        self.parse_string = scanstring
+            # If the next character is white space
+            if s[end:end + 1] in _ws:
+                # Skip white spaces
+                end = _w(s, end).end()
 
-        # Memo dict for caching decoded string chunks
-        self.memo = {}
+        # If have property values not moved into columns
+        if rows:
+            # Move the property values into columns
+            columns = _extend_columns(s, columns, rows, starts)
 
-        # Create scan function
-        self.scan_once = scanner.make_scanner(self)
+            # Count the objects
+            count += len(rows)
 
+        # Return the columns, number of objects, and parsing end position
+        return dict(zip(names, columns)), count, row_end + 1
 
-    def decode(self, s, _w=WHITESPACE.match):
-        """Return the Python representation of ``s`` (a ``str`` instance
-        containing a JSON document).
+    def decode_stream(self, fp, bufsize=DEFAULT_BUFSIZE):
+        """Return the Python representation of the JSON document read from
+        ``fp`` (a ``.read()``-supporting text or binary file-like object, or
+        a bytes-like object, containing a JSON document).
+
+        ``fp`` is read ``bufsize`` characters at a time, and text is dropped
+        once decoded, so the whole document is never held in memory. A token
+        crossing a chunk boundary is rescanned after more text is read.
+
+        Values that fit in the current chunk are decoded by ``scan_once``.
+        Containers that do not are decoded member by member. Each object is
+        passed to ``object_hook`` or ``object_pairs_hook`` once.
+
+        In lazy mode the whole text is read, as the returned proxy refers to
+        it.
 
         """
-        # Decode JSON data to Python object.
+        # Decode JSON data read from file to Python object.
         # If JSON data have extraneous data at the end, raise error.
         #
-        # @param s: JSON data.
+        # @param fp: A file-like object, or a bytes-like object.
         #
-        # @param _w: White space match function.
+        # @param bufsize: Number of characters to read at a time.
         #
         # @return: Python object.
 
-        # Skip starting white spaces.
-        # Call "raw_decode" to decode the JSON data.
-        # Get result object, and parsing end position.
-        obj, end = self.raw_decode(s, idx=_w(s, 0).end())
+        # Create stream buffer
+        buf = _StreamBuffer(fp, bufsize)
 
-        # Skip ending white spaces, get parsing end position
-        end = _w(s, end).end()
+        # Skip starting white spaces
+        idx = buf.start()
+
+        # If lazy mode is on
+        if self.lazy:
+            # Lazy proxies reference the JSON data, so read the whole text.
+            #
+            # While end of file is not reached
+            while not buf.eof:
+                # Read more text, keeping text from the value's start
+                idx = buf.fill(idx)
+
+            # Decode the text into lazy proxy.
+            # Return the proxy.
+            return self.decode(buf.s)
+
+        #
+        try:
+            # Decode a value, get parsing end position
+            obj, idx = self._scan_stream(buf, idx)
+
+        # Before returning
+        finally:
+            # End memo's document
+            self.memo.end_document()
+
+        # Skip ending white spaces
+        idx = buf.skip(idx)
 
         # If parsing end position is not JSON data end
-        if end != len(s):
+        if idx != len(buf.s):
             # Raise error
-            raise JSONDecodeError("Extra data", s, end)
+            raise buf.error("Extra data", idx)
 
         # Return the result object
         return obj
 
-    def raw_decode(self, s, idx=0):
-        """Decode a JSON document from ``s`` (a ``str`` beginning with
-        a JSON document) and return a 2-tuple of the Python
-        representation and the index in ``s`` where the document ended.
+    def iter_decode(self, s_or_fp, bufsize=DEFAULT_BUFSIZE):
+        """Yield the Python representation of each JSON document in
+        ``s_or_fp`` (a ``str`` or bytes-like object, or a
+        ``.read()``-supporting file-like object containing zero or more
+        concatenated JSON documents, optionally separated by white spaces),
+        e.g. ``'{"a": 1}{"b": 2}'``.
 
-        This can be used to decode a JSON document from a string that may
-        have extraneous data at the end.
+        A ``str`` is walked by offset, with no slicing between documents. A
+        file object is read ``bufsize`` characters at a time as the documents
+        are decoded.
 
         """
-        # Decode JSON data to Python object.
+        # Decode concatenated JSON documents to Python objects.
         #
-        # @param s: JSON data.
+        # @param s_or_fp: JSON data, or file object to read JSON data from.
+        #
+        # @param bufsize: Number of characters to read at a time.
+        #
+        # @return: Iterator of Python objects.
+
+        # Create stream buffer
+        buf = _StreamBuffer(s_or_fp, bufsize)
+
+        # Skip starting white spaces
+        idx = buf.start()
+
+        #
+        try:
+            # While JSON data end is not reached
+            while idx != len(buf.s):
+                # Decode a document, get parsing end position
+                obj, idx = self._scan_stream(buf, idx)
+
+                # Yield the Python object
+                yield obj
+
+                # Skip white spaces
+                idx = buf.skip(idx)
+
+        # Before returning
+        finally:
+            # End memo's document
+            self.memo.end_document()
+
+    def decode_lines(self, fp, bufsize=DEFAULT_BUFSIZE, _w=WHITESPACE.match):
+        """Yield the Python representation of each line of ``fp`` (a
+        ``.read()``-supporting file-like object containing one JSON document
+        per line, i.e. JSON Lines or NDJSON). Blank lines are skipped.
+
+        ``fp`` is read ``bufsize`` characters at a time and each block is
+        split into lines at once. Every line is scanned by the same
+        ``scan_once``, without the per-call checks of ``decode``. Errors
+        report the line and column in ``fp``.
+
+        """
+        # Decode JSON data of each line to Python object.
+        #
+        # @param fp: A ``.read()``-supporting file-like object.
+        #
+        # @param bufsize: Number of characters to read at a time.
         #
         # @param _w: White space match function.
         #
-        # @return: Python object, and parsing end position.
+        # @return: Iterator of Python objects.
+
+        # Get scan function
+        scan_once = self.scan_once
+
+        # Text of incomplete last line of the previous block
+        rest = ''
+
+        # Number of lines before the current line
+        lineno = 0
+
+        # Position of the current line's start
+        offset = 0
+
+        # Whether end of file is reached
+        eof = False
 
         #
         try:
-            # Scan a value, get parsing end position
-            obj, end = self.scan_once(s, idx)
+            # While end of file is not reached
+            while not eof:
+                # Read a block
+                block = fp.read(bufsize)
+
+                # If the block is not string
+                if not isinstance(block, str):
+                    # Read text decoded from the file's bytes from now on
+                    fp = _TextReader(fp, block)
+
+                    # Decode the block
+                    block = fp.read(bufsize)
+
+                # If the block is not empty
+                if block:
+                    # Split the block into lines
+                    lines = (rest + block).split('\n')
+
+                    # Keep the incomplete last line for the next block
+                    rest = lines.pop()
+
+                # If the block is empty
+                else:
+                    # The last line is complete
+                    lines = [rest]
+
+                    # Set end of file is reached
+                    eof = True
+
+                # If is the first line, and it starts with BOM
+                if lineno == 0 and lines and lines[0].startswith('\ufeff'):
+                    # Raise error
+                    raise JSONDecodeError(
+                        "Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                        lines[0], 0)
+
+                # For each line
+                for line in lines:
+                    # Skip starting white spaces
+                    idx = _w(line, 0).end()
+
+                    # If the line is not blank
+                    if idx != len(line):
+                        #
+                        try:
+                            # Scan a value, get parsing end position
+                            obj, end = scan_once(line, idx)
+
+                        # If no value
+                        except StopIteration as err:
+                            # Raise error
+                            raise _window_error("Expecting value", line,
+                                err.value, offset, lineno, 0) from None
+
+                        # If the value is invalid
+                        except JSONDecodeError as err:
+                            # Raise error
+                            raise _window_error(err.msg, line, err.pos,
+                                offset, lineno, 0) from None
+
+                        # Skip ending white spaces
+                        end = _w(line, end).end()
+
+                        # If parsing end position is not line end
+                        if end != len(line):
+                            # Raise error
+                            raise _window_error("Extra data", line, end,
+                                offset, lineno, 0)
+
+                        # Yield the Python object
+                        yield obj
+
+                    # Increment line number
+                    lineno += 1
+
+                    # Forward position to the next line's start
+                    offset += len(line) + 1
+
+        # Before returning
+        finally:
+            # End memo's document
+            self.memo.end_document()
+
+    def iterparse(self, s_or_fp, bufsize=DEFAULT_BUFSIZE):
+        """Parse the JSON document in ``s_or_fp`` (a ``str`` or bytes-like
+        object, or a ``.read()``-supporting file-like object) and yield a
+        3-tuple of ``(event, value, position)`` for each token as it is
+        scanned.
+
+        ``event`` is one of ``'start_map'``, ``'map_key'``, ``'end_map'``,
+        ``'start_array'``, ``'end_array'``, ``'null'``, ``'boolean'``,
+        ``'number'`` and ``'string'``. ``value`` is the decoded key or
+        scalar value, or ``None`` for the other events. ``position`` is the
+        index of the token's first character in the document.
+
+        No objects or arrays are built, so a document can be filtered or
+        aggregated without holding its tree in memory. A file object is read
+        ``bufsize`` characters at a time.
 
-        # If no more value
-        except StopIteration as err:
+        """
+        # Parse JSON data to events.
+        #
+        # @param s_or_fp: JSON data, or file object to read JSON data from.
+        #
+        # @param bufsize: Number of characters to read at a time.
+        #
+        # @return: Iterator of (event, value, position) tuples.
+
+        # Create stream buffer.
+        # Return the iterator of events.
+        return self._iter_events(_StreamBuffer(s_or_fp, bufsize), None)
+
+    def iter_items(self, s_or_fp, prefix, bufsize=DEFAULT_BUFSIZE):
+        """Yield the Python representation of each value found at path
+        ``prefix`` in the JSON document in ``s_or_fp`` (a ``str`` or
+        bytes-like object, or a ``.read()``-supporting file-like object).
+
+        ``prefix`` is a sequence of path components, or a ``str`` of path
+        components joined by ``'.'``. A component is an object's property
+        name, or ``'item'`` for any array element. E.g. ``'data.item'``
+        selects each element of the array under key ``'data'`` of the
+        top-level object, and ``''`` selects the whole document.
+
+        Each value is yielded as soon as it is decoded, and nothing outside
+        selected values is built, so records of a huge array can be processed
+        one by one in constant memory. A file object is read ``bufsize``
+        characters at a time.
+
+        """
+        # Decode values at given path.
+        #
+        # @param s_or_fp: JSON data, or file object to read JSON data from.
+        #
+        # @param prefix: Path of values to decode.
+        #
+        # @param bufsize: Number of characters to read at a time.
+        #
+        # @return: Iterator of Python objects.
+
+        # If the path is string
+        if isinstance(prefix, str):
+            # Split the path into components
+            prefix = prefix.split('.') if prefix else []
+
+        # If the path is sequence
+        else:
+            # Convert the path to list for comparing with current path
+            prefix = list(prefix)
+
+        # For each event
+        for event, value, pos in self._iter_events(
+                _StreamBuffer(s_or_fp, bufsize), prefix):
+            # If the event is of selected value
+            if event is _ITEM_EVENT:
+                # Yield the value
+                yield value
+
+    def _iter_events(self, buf, prefix):
+        # Parse JSON data to events.
+        #
+        # @param buf: Stream buffer.
+        #
+        # @param prefix: None, or a list of path components. Values at the
+        # path are decoded as a whole and yielded as "_ITEM_EVENT" events
+        # instead of events of their tokens.
+        #
+        # @return: Iterator of (event, value, position) tuples.
+
+        # Skip starting white spaces
+        idx = buf.start()
+
+        # Cache memo dict's setdefault function
+        memo_get = self.memo.setdefault
+
+        # Stack of containers being parsed. Each item is True for object,
+        # False for array.
+        stack = []
+
+        # Path of the current value. Each item is a property name, or "item"
+        # for array element.
+        path = []
+
+        # Get maximum nesting depth of containers. None means no limit.
+        max_depth = self.max_depth
+
+        #
+        try:
+            # Loop
+            while True:
+                # Get next character
+                nextchar = buf.s[idx:idx + 1]
+
+                # Get the token's position
+                pos = buf.offset + idx
+
+                # Whether a value is ended
+                ended = True
+
+                # If the value's path is selected
+                if path == prefix:
+                    # Decode the value, get parsing end position
+                    value, idx = self._scan_stream(buf, idx, len(path))
+
+                    # Yield event
+                    yield _ITEM_EVENT, value, pos
+
+                # If the value is container nested too deep
+                elif (nextchar == '{' or nextchar == '[') and \
+                        max_depth is not None and len(stack) >= max_depth:
+                    # Raise error
+                    raise buf.error("Maximum nesting depth exceeded", idx)
+
+                # If the character is starting `{`
+                elif nextchar == '{':
+                    # Yield event
+                    yield 'start_map', None, pos
+
+                    # Skip white spaces
+                    idx = buf.skip(idx + 1)
+
+                    # If the object is empty
+                    if buf.s[idx:idx + 1] == '}':
+                        # Yield event
+                        yield 'end_map', None, buf.offset + idx
+
+                        # Increment parsing end position
+                        idx += 1
+
+                    # If the object is not empty
+                    else:
+                        # Get the property name's position
+                        pos = buf.offset + idx
+
+                        # Decode property name, get parsing end position
+                        key, idx = self._stream_key(buf, idx, memo_get)
+
+                        # Yield event
+                        yield 'map_key', key, pos
+
+                        # Push the object
+                        stack.append(True)
+
+                        # Push the property name to path
+                        path.append(key)
+
+                        # Set value is not ended
+                        ended = False
+
+                # If the character is starting `[`
+                elif nextchar == '[':
+                    # Yield event
+                    yield 'start_array', None, pos
+
+                    # Skip white spaces
+                    idx = buf.skip(idx + 1)
+
+                    # If the array is empty
+                    if buf.s[idx:idx + 1] == ']':
+                        # Yield event
+                        yield 'end_array', None, buf.offset + idx
+
+                        # Increment parsing end position
+                        idx += 1
+
+                    # If the array is not empty
+                    else:
+                        # Push the array
+                        stack.append(False)
+
+                        # Push array element component to path
+                        path.append('item')
+
+                        # Set value is not ended
+                        ended = False
+
+                # If the character is not starting `{` or `[`
+                else:
+                    # Decode a scalar value, get parsing end position
+                    value, idx = self._stream_scalar(buf, idx)
+
+                    # Yield event according to the starting character
+                    yield _SCALAR_EVENTS.get(nextchar, 'number'), value, pos
+
+                # If value is not ended
+                if not ended:
+                    # Parse the container's first value
+                    continue
+
+                # Loop to end containers
+                while True:
+                    # If have no container
+                    if not stack:
+                        # Skip ending white spaces
+                        idx = buf.skip(idx)
+
+                        # If parsing end position is not JSON data end
+                        if idx != len(buf.s):
+                            # Raise error
+                            raise buf.error("Extra data", idx)
+
+                        # Stop the iteration
+                        return
+
+                    # Skip white spaces
+                    idx = buf.skip(idx)
+
+                    # Get next character
+                    nextchar = buf.s[idx:idx + 1]
+
+                    # If the character is `,`
+                    if nextchar == ',':
+                        # Skip white spaces
+                        idx = buf.skip(idx + 1)
+
+                        # If the container is object
+                        if stack[-1]:
+                            # Get the property name's position
+                            pos = buf.offset + idx
+
+                            # Decode property name, get parsing end position
+                            key, idx = self._stream_key(buf, idx, memo_get)
+
+                            # Yield event
+                            yield 'map_key', key, pos
+
+                            # Replace the property name in path
+                            path[-1] = key
+
+                        # Parse the next value
+                        break
+
+                    # If the character ends the container
+                    elif nextchar == ('}' if stack[-1] else ']'):
+                        # Pop the container.
+                        # Yield event.
+                        yield ('end_map' if stack.pop() else 'end_array',
+                               None, buf.offset + idx)
+
+                        # Pop the container's component from path
+                        path.pop()
+
+                        # Increment parsing end position
+                        idx += 1
+
+                    # If the character is not `,` and not container end
+                    else:
+                        # Raise error
+                        raise buf.error("Expecting ',' delimiter", idx)
+
+        # Before returning
+        finally:
+            # End memo's document
+            self.memo.end_document()
+
+    def _scan_stream(self, buf, idx, depth=0):
+        # Decode a value from stream buffer.
+        #
+        # Containers are decoded by "scan_once" if they fit in the window.
+        # Otherwise they are decoded member by member, using an explicit
+        # container stack.
+        #
+        # @param buf: Stream buffer.
+        #
+        # @param idx: Window position of the value's first character.
+        #
+        # @param depth: Number of containers enclosing the value, counted
+        # toward "max_depth".
+        #
+        # @return: Python object, and window position after the value.
+
+        # Get scan function
+        scan_once = self.scan_once
+
+        # Get maximum nesting depth of containers. None means no limit.
+        max_depth = self.max_depth
+
+        # Whether object hooks are given. A hook must not be called for
+        # objects of a container that is decoded again member by member.
+        hooked = (self.object_hook is not None or
+                  self.object_pairs_hook is not None)
+
+        # Cache memo dict's setdefault function
+        memo_get = self.memo.setdefault
+
+        # Get whether decode arrays of plain numbers in bulk
+        number_arrays = self.number_arrays
+
+        # If number arrays are decoded into NumPy arrays
+        if number_arrays == 'numpy':
+            # Import here, as NumPy is optional and slow to import
+            import numpy
+
+        # If number arrays are not decoded into NumPy arrays
+        else:
+            # No NumPy
+            numpy = None
+
+        # Stack of containers being decoded. Each item is a list of
+        # (is_object, list of pairs or values, pending key). For array, the
+        # last item is whether its values are all plain numbers so far.
+        stack = []
+
+        # Loop
+        while True:
+            # Get window text
+            s = buf.s
+
+            # Get next character
+            nextchar = s[idx:idx + 1]
+
+            # Whether a container is started
+            started = False
+
+            # Whether the value is a plain number, i.e. not a constant
+            plain = False
+
+            # If the character is starting `{` or `[`
+            if nextchar == '{' or nextchar == '[':
+                # Get number of open containers
+                level = depth + len(stack)
+
+                # If the container is nested too deep
+                if max_depth is not None and level >= max_depth:
+                    # Raise error
+                    raise buf.error("Maximum nesting depth exceeded", idx)
+
+                # Whether the container is known to end in the window. If
+                # end of file is reached, the window has all the rest.
+                whole = buf.eof
+
+                # Whether the container is decoded member by member
+                split = False
+
+                #
+                try:
+                    # If object hooks are given, and end of file is not
+                    # reached
+                    if hooked and not whole:
+                        # Find the container's end without decoding it.
+                        # Raise error if it is not in the window.
+                        skip_value(s, idx)
+
+                        # The container ends in the window
+                        whole = True
+
+                    # If nesting depth is not limited
+                    if max_depth is None:
+                        # Decode the whole container if it fits in the window
+                        value, idx = scan_once(s, idx)
+
+                    # If nesting depth is limited
+                    else:
+                        # Decode the whole container if it fits in the
+                        # window, counting the open containers toward the
+                        # limit
+                        value, idx = scan_once(s, idx, level)
+
+                # If no value.
+                #
+                # E.g. a container's value is cut by window end.
+                except StopIteration as err:
+                    # If the error can not be caused by window end
+                    if whole:
+                        # Raise error
+                        raise buf.error("Expecting value", err.value) \
+                            from None
+
+                    # Decode the container member by member
+                    split = True
+
+                # If the container is invalid.
+                #
+                # E.g. the container is cut by window end.
+                except JSONDecodeError as err:
+                    # If the error can not be caused by window end
+                    if whole or err.msg == "Maximum nesting depth exceeded":
+                        # Raise error
+                        raise buf.error(err.msg, err.pos) from None
+
+                    # Decode the container member by member
+                    split = True
+
+                # If the container does not fit in the window
+                if split:
+                    # Skip white spaces after the starting character
+                    idx = buf.skip(idx + 1)
+
+                    # Get window text
+                    s = buf.s
+
+                    # If the container is object
+                    if nextchar == '{':
+                        # If the object is empty
+                        if s[idx:idx + 1] == '}':
+                            # Create result object
+                            value = self._stream_object([])
+
+                            # Increment parsing end position
+                            idx += 1
+
+                        # If the object is not empty
+                        else:
+                            # Decode property name, get parsing end position
+                            key, idx = self._stream_key(buf, idx, memo_get)
+
+                            # Push the object
+                            stack.append([True, [], key])
+
+                            # Set a container is started
+                            started = True
+
+                    # If the container is array.
+
+                    # If the array is empty
+                    elif s[idx:idx + 1] == ']':
+                        # Create result list
+                        value = []
+
+                        # Increment parsing end position
+                        idx += 1
+
+                    # If the array is not empty
+                    else:
+                        # Push the array
+                        stack.append([False, [], True])
+
+                        # Set a container is started
+                        started = True
+
+            # If the character is not starting `{` or `[`
+            else:
+                # If number arrays are decoded in bulk
+                if number_arrays:
+                    # If the value starts with "-" at window end
+                    if nextchar == '-' and idx + 1 == len(s) and \
+                            not buf.eof:
+                        # Read more text, to tell "-Infinity" from numbers
+                        idx = buf.fill(idx)
+
+                        # Get window text
+                        s = buf.s
+
+                    # Get whether the value is a plain number
+                    plain = (nextchar in '0123456789' or
+                             nextchar == '-' and s[idx + 1:idx + 2] != 'I')
+
+                # Decode a scalar value, get parsing end position
+                value, idx = self._stream_scalar(buf, idx)
+
+            # If a container is started
+            if started:
+                # Decode its first value
+                continue
+
+            # Loop to add the value to its container
+            while True:
+                # If have no container
+                if not stack:
+                    # Return the value, and parsing end position
+                    return value, idx
+
+                # Get the innermost container
+                frame = stack[-1]
+
+                # If the container is object
+                if frame[0]:
+                    # Add property item to pairs list
+                    frame[1].append((frame[2], value))
+
+                # If the container is array
+                else:
+                    # Add the value to values list
+                    frame[1].append(value)
+
+                    # If the value is not a plain number
+                    if not plain:
+                        # Set the array has other values
+                        frame[2] = False
+
+                # Skip white spaces
+                idx = buf.skip(idx)
+
+                # Get next character
+                nextchar = buf.s[idx:idx + 1]
+
+                # If the character is `,`
+                if nextchar == ',':
+                    # Skip white spaces
+                    idx = buf.skip(idx + 1)
+
+                    # If the container is object
+                    if frame[0]:
+                        # If next character is not `"`
+                        if buf.s[idx:idx + 1] != '"':
+                            # Raise error
+                            raise buf.error("Expecting property name "
+                                            "enclosed in double quotes", idx)
+
+                        # Decode property name, get parsing end position
+                        frame[2], idx = self._stream_key(buf, idx, memo_get)
+
+                    # Decode the next value
+                    break
+
+                # If the character ends the container
+                elif nextchar == ('}' if frame[0] else ']'):
+                    # Pop the container
+                    stack.pop()
+
+                    # Increment parsing end position
+                    idx += 1
+
+                    # If the container is object
+                    if frame[0]:
+                        # Create result object
+                        value = self._stream_object(frame[1])
+
+                    # If the container is array, and number arrays are
+                    # decoded in bulk, and its values are all plain numbers
+                    elif number_arrays and frame[2]:
+                        # Pack the numbers like "parse_array" does
+                        value = _pack_numbers(
+                            frame[1], float not in set(map(type, frame[1])),
+                            numpy)
+
+                    # If the container is array
+                    else:
+                        # Use values list as result
+                        value = frame[1]
+
+                    # The result is not a plain number
+                    plain = False
+
+                    # Add the result to the outer container
+
+                # If the character is not `,` and not container end
+                else:
+                    # Raise error
+                    raise buf.error("Expecting ',' delimiter", idx)
+
+    def _stream_object(self, pairs):
+        # Create result object from property items like "JSONObject".
+        #
+        # @param pairs: A list of property items.
+        #
+        # @return: Result object.
+
+        # If object pairs hook function is given
+        if self.object_pairs_hook is not None:
+            # Call object pairs hook function to create result
+            return self.object_pairs_hook(pairs)
+
+        # Create result dict
+        pairs = dict(pairs)
+
+        # If object hook function is given
+        if self.object_hook is not None:
+            # Call object hook function
+            pairs = self.object_hook(pairs)
+
+        # Return the result dict
+        return pairs
+
+    def _stream_key(self, buf, idx, memo_get):
+        # Decode a property name and its following `:` from stream buffer.
+        #
+        # @param buf: Stream buffer.
+        #
+        # @param idx: Window position of the starting `"`.
+        #
+        # @param memo_get: Memo dict's setdefault function.
+        #
+        # @return: Property name, and window position of the property value.
+
+        # If the character is not `"`
+        if buf.s[idx:idx + 1] != '"':
             # Raise error
-            raise JSONDecodeError("Expecting value", s, err.value) from None
+            raise buf.error(
+                "Expecting property name enclosed in double quotes", idx)
+
+        # Loop
+        while True:
+            #
+            try:
+                # Decode the property name, get parsing end position
+                key, idx = scanstring(buf.s, idx + 1, self.strict)
+
+                # Stop reading
+                break
+
+            # If the property name is invalid or crosses window end
+            except JSONDecodeError as err:
+                # If the error can not be caused by window end
+                if buf.eof or not buf.truncated(err):
+                    # Raise error
+                    raise buf.error(err.msg, err.pos) from None
+
+                # Read more text
+                idx = buf.fill(idx)
+
+        # Cache the property name
+        key = memo_get(key, key)
+
+        # Skip white spaces
+        idx = buf.skip(idx)
+
+        # If next character is not `:`
+        if buf.s[idx:idx + 1] != ':':
+            # Raise error
+            raise buf.error("Expecting ':' delimiter", idx)
+
+        # Skip white spaces.
+        # Return the property name, and parsing end position.
+        return key, buf.skip(idx + 1)
+
+    def _stream_scalar(self, buf, idx):
+        # Decode a string, number or constant from stream buffer.
+        #
+        # @param buf: Stream buffer.
+        #
+        # @param idx: Window position of the value's first character.
+        #
+        # @return: Python object, and window position after the value.
+
+        # Loop
+        while True:
+            # Get window text
+            s = buf.s
+
+            #
+            try:
+                # Scan a value, get parsing end position
+                value, end = self.scan_once(s, idx)
+
+            # If no value.
+            #
+            # E.g. a constant or number is cut by window end.
+            except StopIteration as err:
+                # If the error can not be caused by window end
+                if buf.eof or len(s) - idx >= 9:
+                    # Raise error
+                    raise buf.error("Expecting value", err.value) from None
+
+            # If the value is invalid.
+            #
+            # E.g. a string is cut by window end.
+            except JSONDecodeError as err:
+                # If the error can not be caused by window end
+                if buf.eof or not buf.truncated(err):
+                    # Raise error
+                    raise buf.error(err.msg, err.pos) from None
+
+            # If have value
+            else:
+                # If the value does not end near window end, or end of file
+                # is reached.
+                #
+                # A number ending near window end may be continued by digits,
+                # a fraction part or an exponent part, e.g. "1" before ".5",
+                # or "1.5" before "e+3".
+                if end + 2 < len(s) or buf.eof:
+                    # Return the value, and parsing end position
+                    return value, end
+
+            # Read more text
+            idx = buf.fill(idx)
 
-        # Return the Python object, and parsing end position
-        return obj, end
@@ -1,6 +1,14 @@
 """Implementation of JSONEncoder
 """
+import io
 import re
+import sys
+from array import array
+from enum import Enum
+from itertools import chain, compress, repeat
+from keyword import iskeyword
+from math import isfinite
+from operator import not_
 
 try:
     from _json import encode_basestring_ascii as c_encode_basestring_ascii
@@ -63,6 +71,589 @@ INFINITY = float('inf')
 FLOAT_REPR = repr
 
 
+# Number of characters encoded to bytes at a time by "encode_bytes"
+BYTES_BATCH_SIZE = 64 * 1024
+
+
+# Maximum number of items in the subtree of a container encoded in one chunk
+# by C version of encoder function, when encoding without indentation is not
+# one-shot, e.g. by "json.dump"
+STREAM_CHUNK_ITEMS = 4096
+
+
+# Map type to function registered by "register" to convert its objects to
+# serializable objects
+_dispatch = {}
+
+
+# Map exact type of encoded objects to the registered function found in its
+# MRO, or None if no function is registered for any of its bases
+_dispatch_cache = {}
+
+
+#
+def register(cls, func):
+    """Register ``func`` to convert objects of type ``cls`` to serializable
+    objects, for every ``JSONEncoder``.
+
+    ``func`` is called with an object that is not otherwise serializable
+    and should return a serializable object, like ``JSONEncoder.default``.
+    It also applies to subclasses of ``cls`` with no function registered
+    for a closer base. Registered functions are tried before ``default``;
+    objects of unregistered types are still passed to ``default``.
+
+    If ``func`` is None, the registration for ``cls`` is removed.
+
+    For example::
+
+        >>> import json, json.encoder, uuid
+        >>> json.encoder.register(uuid.UUID, str)
+        >>> json.dumps([uuid.UUID(int=1)])
+        '["00000000-0000-0000-0000-000000000001"]'
+
+    """
+    # If the type is not a class
+    if not isinstance(cls, type):
+        # Raise error
+        raise TypeError('register() argument 1 must be a class, not ' +
+                        type(cls).__name__)
+
+    # If function is not given
+    if func is None:
+        # Remove the registration
+        _dispatch.pop(cls, None)
+
+    # If function is given
+    else:
+        # Add the registration
+        _dispatch[cls] = func
+
+    # Clear resolved lookups, as they may be changed by the registration
+    _dispatch_cache.clear()
+
+    # Clear record fields, as a registered function takes priority
+    _record_cache.clear()
+
+    # Clear record-to-dict functions
+    _record_dict_cache.clear()
+
+    # Clear array-to-list functions, as a registered function takes priority
+    _array_cache.clear()
+
+
+# Map type to field names of its objects encoded as records, None if its
+# objects are enum members encoded as their values, or False if its objects
+# are not encoded as records
+_record_cache = {}
+
+
+#
+def _record_fields(cls, _cache=_record_cache):
+    # Get how objects of a type are encoded when encoding records natively.
+    #
+    # Field names are read once per type:
+    # - Dataclass: its fields;
+    # - Class whose instances have no "__dict__": its public attributes
+    # named in "__slots__" of it and its bases.
+    #
+    # @param cls: A type.
+    #
+    # @return: A tuple of field names if objects of the type are records,
+    # None if they are enum members, or False if they are neither.
+
+    #
+    try:
+        # Return the cached result
+        return _cache[cls]
+
+    # If the type is not cached
+    except KeyError:
+        # Compute the result below
+        pass
+
+    # Get the type's MRO without "object"
+    bases = cls.__mro__[:-1]
+
+    # If a function is registered for the type or a base by "register"
+    if any(map(_dispatch.__contains__, bases)):
+        # Leave objects of the type to the registered function
+        fields = False
+
+    # If the type is an enum
+    elif issubclass(cls, Enum):
+        # Encode members as their values
+        fields = None
+
+    # If the type is a dataclass
+    elif hasattr(cls, '__dataclass_fields__'):
+        # Import here, as few programs encode dataclasses
+        import dataclasses
+
+        # Get names of the dataclass fields
+        fields = tuple(field.name for field in dataclasses.fields(cls))
+
+    # If the type and all its bases define "__slots__" without "__dict__"
+    elif (bases and not cls.__dictoffset__
+            and all('__slots__' in base.__dict__ for base in bases)):
+        # Field names
+        fields = []
+
+        # For each base, from the outermost
+        for base in reversed(bases):
+            # Get the base's slot names
+            slots = base.__dict__['__slots__']
+
+            # If the slot names is given as one string
+            if isinstance(slots, str):
+                # Wrap the name in a tuple
+                slots = (slots,)
+
+            # Add public slot names
+            fields.extend(name for name in slots
+                          if not name.startswith('_'))
+
+        # If have public slot names, use them as field names.
+        # Else, e.g. for implementation details like "_pydecimal.Decimal",
+        # not encode objects of the type as records.
+        fields = tuple(fields) or False
+
+    # If the type is something else
+    else:
+        # Not encode objects of the type as records
+        fields = False
+
+    # Cache the result
+    _cache[cls] = fields
+
+    # Return the result
+    return fields
+
+
+# Marker of a record field that has no value, e.g. a slot never assigned
+_UNSET = object()
+
+
+#
+def _record_items(o, fields):
+    # Get the items of a record's fields that have values. Fields without
+    # values, e.g. slots never assigned, are skipped.
+    #
+    # @param o: A record object.
+    #
+    # @param fields: A sequence of the record's field names.
+    #
+    # @return: A list of (field name, value) tuples.
+
+    # Read field values, using the marker for fields without values.
+    # Return the items of fields with values.
+    return [item for item in zip(fields, map(getattr, repeat(o), fields,
+                                             repeat(_UNSET)))
+            if item[1] is not _UNSET]
+
+
+# Map type to function converting its objects, records or enum members, to
+# dicts or values, or to None if its objects are neither
+_record_dict_cache = {}
+
+
+#
+def _record_dict_function(cls):
+    # Create the function converting objects of a type to serializable
+    # objects for C version of encoder function, and cache it.
+    #
+    # A record is converted to a dict of its fields by a function made from
+    # a dict display, e.g. "lambda o: {'x': o.x}", which is several times
+    # faster than creating the dict from field names in a loop.
+    #
+    # @param cls: A type.
+    #
+    # @return: Function converting objects of the type, or None if they are
+    # not records or enum members.
+
+    # Get the type's field names
+    fields = _record_fields(cls)
+
+    # If objects of the type are not records or enum members
+    if fields is False:
+        # No function
+        func = None
+
+    # If objects of the type are enum members
+    elif fields is None:
+        # Get member's value
+        func = _enum_value
+
+    # If objects of the type are records
+    else:
+        # Get expressions of the items of the dict display. Keywords can not
+        # be attribute names in source code, but can be slot names.
+        items = ', '.join(
+            ('%r: getattr(o, %r)' if iskeyword(name) else '%r: o.%s') % (
+                name, name) for name in fields)
+
+        # Create the function
+        func = eval('lambda o: {' + items + '}', {})
+
+    # Cache the function
+    _record_dict_cache[cls] = func
+
+    # Return the function
+    return func
+
+
+#
+def _enum_value(o):
+    # Get an enum member's value.
+    #
+    # @param o: An enum member.
+    #
+    # @return: The member's value.
+
+    # Return the member's value
+    return o.value
+
+
+#
+def _make_record_default(default, _cache=_record_dict_cache,
+        ## HACK: hand-optimized bytecode; turn globals into locals
+        KeyError=KeyError,
+        type=type,
+    ):
+    # Factory function of unserializable object handler that converts
+    # records to dicts and enum members to their values, for C version of
+    # encoder function.
+    #
+    # @param default: Handler for objects of other types.
+    #
+    # @return: Unserializable object handler.
+
+    # Create unserializable object handler
+    def _default(o):
+        # Convert an object to serializable object.
+        #
+        # @param o: An unserializable object.
+        #
+        # @return: Serializable object.
+
+        # Get the object's type
+        cls = type(o)
+
+        #
+        try:
+            # Get the function converting objects of the type
+            func = _cache[cls]
+
+        # If the function is not created yet
+        except KeyError:
+            # Create the function
+            func = _record_dict_function(cls)
+
+        # If the object is not record or enum member
+        if func is None:
+            # Call given handler
+            return default(o)
+
+        #
+        try:
+            # Convert the object.
+            # Return the serializable object.
+            return func(o)
+
+        # If a field of the record has no value, e.g. a slot never assigned
+        except AttributeError:
+            # Convert the record to a dict of the fields with values.
+            # Return the dict.
+            return dict(_record_items(o, _record_fields(cls)))
+
+    # Return unserializable object handler
+    return _default
+
+
+# Map type to function converting its objects, arrays or array scalars, to
+# lists or numbers, or to None if its objects are neither
+_array_cache = {}
+
+
+#
+def _array_function(cls, _cache=_array_cache):
+    # Get the function converting objects of a type to lists or numbers when
+    # encoding arrays natively:
+    # - NumPy array: its "tolist" method;
+    # - NumPy scalar: its "item" method;
+    # - "array.array" and "memoryview": their "tolist" methods.
+    #
+    # @param cls: A type.
+    #
+    # @return: Function converting objects of the type, or None if they are
+    # not arrays or array scalars.
+
+    #
+    try:
+        # Return the cached result
+        return _cache[cls]
+
+    # If the type is not cached
+    except KeyError:
+        # Compute the result below
+        pass
+
+    # Get NumPy module if it is imported. If not, no object is of its types,
+    # so it is not imported here.
+    numpy = sys.modules.get('numpy')
+
+    # If a function is registered for the type or a base by "register"
+    if any(map(_dispatch.__contains__, cls.__mro__[:-1])):
+        # Leave objects of the type to the registered function
+        func = None
+
+    # If the type is of NumPy arrays
+    elif numpy is not None and issubclass(cls, numpy.ndarray):
+        # Convert arrays to nested lists of Python scalars
+        func = cls.tolist
+
+    # If the type is of NumPy scalars
+    elif numpy is not None and issubclass(cls, numpy.generic):
+        # Convert scalars to Python scalars
+        func = cls.item
+
+    # If the type is of standard library arrays or buffers
+    elif issubclass(cls, (array, memoryview)):
+        # Convert arrays to lists of Python scalars
+        func = cls.tolist
+
+    # If the type is something else
+    else:
+        # Not encode objects of the type as arrays
+        func = None
+
+    # Cache the result
+    _cache[cls] = func
+
+    # Return the result
+    return func
+
+
+#
+def _make_array_default(default,
+        ## HACK: hand-optimized bytecode; turn globals into locals
+        type=type,
+        _array_function=_array_function,
+    ):
+    # Factory function of unserializable object handler that converts
+    # arrays to lists and array scalars to numbers, for C version of encoder
+    # function.
+    #
+    # @param default: Handler for objects of other types.
+    #
+    # @return: Unserializable object handler.
+
+    # Create unserializable object handler
+    def _default(o):
+        # Convert an object to serializable object.
+        #
+        # @param o: An unserializable object.
+        #
+        # @return: Serializable object.
+
+        # Get the function converting objects of the object's type
+        func = _array_function(type(o))
+
+        # If the object is not array or array scalar
+        if func is None:
+            # Call given handler
+            return default(o)
+
+        # Convert the object.
+        # Return the serializable object.
+        return func(o)
+
+    # Return unserializable object handler
+    return _default
+
+
+#
+def _make_array_encoder(_indent, _item_separator, _floatstr,
+        ## HACK: hand-optimized bytecode; turn globals into locals
+        all=all,
+        bool=bool,
+        float=float,
+        int=int,
+        len=len,
+        list=list,
+        map=map,
+        set=set,
+        type=type,
+        _bool_texts={True: 'true', False: 'false'}.__getitem__,
+    ):
+    # Factory function of encode function for lists converted from arrays.
+    #
+    # @param _indent: None, or indentation text.
+    #
+    # @param _item_separator: Item separator.
+    #
+    # @param _floatstr: Float-to-text function.
+    #
+    # @return: Encode function.
+
+    # Get float repr function
+    _repr = FLOAT_REPR
+
+    # Encode function for list converted from array
+    def _encode_array(values, _current_indent_level):
+        # Encode a list of numbers of the same type, or nested lists thereof,
+        # to JSON data in one pass over each innermost list.
+        #
+        # @param values: A list converted from array.
+        #
+        # @param _current_indent_level: Indentation level of the list.
+        #
+        # @return: Result chunk, or None if the list has other items, e.g.
+        # converted from an array of objects.
+
+        # If the list is empty
+        if not values:
+            # Return result chunk
+            return '[]'
+
+        # If the list is of nested lists
+        if type(values[0]) is list:
+            # Texts of the nested lists
+            texts = []
+
+            # For each nested list
+            for value in values:
+                # If the item is not list
+                if type(value) is not list:
+                    # Not encode the list
+                    return None
+
+                # Encode the nested list
+                text = _encode_array(value, _current_indent_level + 1)
+
+                # If the nested list is not encoded
+                if text is None:
+                    # Not encode the list
+                    return None
+
+                # Add the nested list's text
+                texts.append(text)
+
+        # If the list is of scalars
+        else:
+            # Get the types of the items
+            types = set(map(type, values))
+
+            # If the items are of different types
+            if len(types) != 1:
+                # Not encode the list
+                return None
+
+            # Get the items' type
+            kind = types.pop()
+
+            # If the items are float
+            if kind is float:
+                # If all items are finite, which is the usual case
+                if all(map(isfinite, values)):
+                    # Get the items' texts by float repr function
+                    texts = map(_repr, values)
+
+                # If an item is NaN or infinity
+                else:
+                    # Get the items' texts by float-to-text function, which
+                    # raises error if NaN is not allowed
+                    texts = map(_floatstr, values)
+
+            # If the items are integer
+            elif kind is int:
+                # Get the items' texts
+                texts = map(int.__repr__, values)
+
+            # If the items are boolean
+            elif kind is bool:
+                # Get the items' texts
+                texts = map(_bool_texts, values)
+
+            # If the items are something else
+            else:
+                # Not encode the list
+                return None
+
+        # If indentation argument is not given
+        if _indent is None:
+            # Join the items' texts.
+            # Return result chunk.
+            return '[' + _item_separator.join(texts) + ']'
+
+        # Get indentation text of the items
+        newline_indent = '\n' + _indent * (_current_indent_level + 1)
+
+        # Join the items' texts with indentation.
+        # Return result chunk.
+        return ('[' + newline_indent +
+                (_item_separator + newline_indent).join(texts) +
+                '\n' + _indent * _current_indent_level + ']')
+
+    # Return encode function
+    return _encode_array
+
+
+#
+def _make_default(default, _cache=_dispatch_cache, _dispatch=_dispatch,
+        ## HACK: hand-optimized bytecode; turn globals into locals
+        KeyError=KeyError,
+        type=type,
+    ):
+    # Factory function of unserializable object handler that tries
+    # registered functions before given handler.
+    #
+    # @param default: Handler for objects of unregistered types.
+    #
+    # @return: Unserializable object handler.
+
+    # Create unserializable object handler
+    def _default(o):
+        # Convert an object to serializable object.
+        #
+        # @param o: An unserializable object.
+        #
+        # @return: Serializable object.
+
+        # Get the object's type
+        cls = type(o)
+
+        #
+        try:
+            # Get the function resolved for the type
+            func = _cache[cls]
+
+        # If the type is not resolved yet
+        except KeyError:
+            # For each class in the type's MRO
+            for base in cls.__mro__:
+                # Get the function registered for the class
+                func = _dispatch.get(base)
+
+                # If have registered function
+                if func is not None:
+                    # Stop finding
+                    break
+
+            # Remember the resolved function, or None
+            _cache[cls] = func
+
+        # If no function is registered for the type
+        if func is None:
+            # Call given handler
+            return default(o)
+
+        # Call registered function
+        return func(o)
+
+    # Return unserializable object handler
+    return _default
+
+
 #
 def py_encode_basestring(s):
     """Return a JSON representation of a Python string
@@ -214,7 +805,8 @@ class JSONEncoder(object):
     #
     def __init__(self, skipkeys=False, ensure_ascii=True,
             check_circular=True, allow_nan=True, sort_keys=False,
-            indent=None, separators=None, default=None):
+            indent=None, separators=None, default=None, iterative=False,
+            records=False, arrays=False):
         """Constructor for JSONEncoder, with sensible defaults.
 
         If skipkeys is false, then it is a TypeError to attempt
@@ -253,6 +845,27 @@ class JSONEncoder(object):
         that can't otherwise be serialized.  It should return a JSON encodable
         version of the object or raise a ``TypeError``.
 
+        If iterative is true, the pure Python encoder that tracks nested
+        containers by an explicit stack is used, instead of the C encoder or
+        a generator per nesting level. Deeply nested objects are then
+        encoded in linear time, with no recursion limit.
+
+        If records is true, instances of dataclasses and of classes whose
+        instances only have ``__slots__`` are encoded as JSON objects of
+        their fields, and enum members as their values, without calling
+        ``default``. Field names are read once per class, and only public
+        slots are fields; slots never assigned are left out of the object.
+        Functions registered by ``register`` still take
+        priority. Named tuples are encoded as arrays either way.
+
+        If arrays is true, NumPy arrays, ``array.array`` and ``memoryview``
+        objects are encoded as JSON arrays of their ``tolist()``, and NumPy
+        scalars as their ``item()``, without calling ``default``. Numeric
+        arrays are converted and formatted in one pass, not element by
+        element; NaN and infinities follow allow_nan as for floats. NumPy is
+        not imported by the encoder. Functions registered by ``register``
+        still take priority.
+
         """
 
         # Whether skip non-regular-type keys
@@ -289,6 +902,16 @@ class JSONEncoder(object):
             # Override "JSONEncoder.default" function
             self.default = default
 
+        # Whether use explicit-stack encoder
+        self.iterative = iterative
+
+        # Whether encode dataclasses, slotted objects and enum members
+        # natively
+        self.records = records
+
+        # Whether encode arrays, buffers and array scalars natively
+        self.arrays = arrays
+
     def default(self, o):
         """Implement this method in a subclass such that it returns
         a serializable object for ``o``, or calls the base implementation
@@ -360,6 +983,95 @@ class JSONEncoder(object):
         # Return the result string.
         return ''.join(chunks)
 
+    def encode_bytes(self, o):
+        """Return a JSON representation of a Python data structure, as UTF-8
+        ``bytes``.
+
+        >>> from json.encoder import JSONEncoder
+        >>> JSONEncoder().encode_bytes({"foo": ["bar", "baz"]})
+        b'{"foo": ["bar", "baz"]}'
+
+        Chunks from the C encoder are joined and encoded once, with the
+        chunks released first, so the result costs no more than
+        ``encode(o)``. Chunks from the Python encoder are encoded in batches
+        into a bytes buffer, so no ``str`` of the whole result is built.
+        With ``ensure_ascii`` true, the text is ASCII, and encoding it is a
+        plain copy.
+
+        """
+        # Encode Python object to UTF-8 JSON data.
+        #
+        # @param o: Python Object to encode.
+        #
+        # @return: JSON data bytes.
+
+        # If given object is string
+        if isinstance(o, str):
+            # Encode the string.
+            # Encode the JSON data to bytes.
+            # Return the bytes.
+            return self.encode(o).encode('utf-8', 'surrogatepass')
+
+        # Call "self.iterencode" to get an iterable of output chunks
+        chunks = self.iterencode(o, _one_shot=True)
+
+        # If the iterable is list or tuple, i.e. from C version of encoder
+        if isinstance(chunks, (list, tuple)):
+            # Join the list of chunks into a result string
+            text = ''.join(chunks)
+
+            # Release the chunks before encoding
+            del chunks
+
+            # Encode the result string to bytes.
+            # Lone surrogates, which only occur with "ensure_ascii" false,
+            # are encoded as is, same as the decoder reads them back.
+            # Return the bytes.
+            return text.encode('utf-8', 'surrogatepass')
+
+        # If the iterable is generator, i.e. from Python version of encoder.
+
+        # Create bytes buffer
+        out = io.BytesIO()
+
+        # Get buffer's write function
+        write = out.write
+
+        # A list of encoded chunks not encoded to bytes yet
+        batch = []
+
+        # Cache append function
+        batch_append = batch.append
+
+        # Number of characters not encoded to bytes yet
+        size = 0
+
+        # For each encoded chunk
+        for chunk in chunks:
+            # Add the chunk to batch
+            batch_append(chunk)
+
+            # Increment number of characters not encoded to bytes yet
+            size += len(chunk)
+
+            # If number of characters reaches batch size
+            if size >= BYTES_BATCH_SIZE:
+                # Encode the batch to bytes, and write to buffer
+                write(''.join(batch).encode('utf-8', 'surrogatepass'))
+
+                # Clear batch
+                del batch[:]
+
+                # Reset number of characters not encoded to bytes yet
+                size = 0
+
+        # Encode the rest of chunks to bytes, and write to buffer
+        write(''.join(batch).encode('utf-8', 'surrogatepass'))
+
+        # Return the buffer's bytes.
+        # The bytes share the buffer's memory, with no copy.
+        return out.getvalue()
+
     def iterencode(self, o, _one_shot=False):
         """Encode the given object and yield each string
         representation as available.
@@ -379,6 +1091,32 @@ class JSONEncoder(object):
         #
         # @return: An iterable of result chunks.
 
+        # If have functions registered by "register"
+        if _dispatch:
+            # Try registered functions before "default" function
+            _default = _make_default(self.default)
+
+        # If have no registered functions
+        else:
+            # Use "default" function as-is
+            _default = self.default
+
+        # If encode records natively
+        if self.records:
+            # Convert records and enum members before "default" function.
+            #
+            # The Python version of encoder functions encode records
+            # directly, but the C version passes them to the handler.
+            _default = _make_record_default(_default)
+
+        # If encode arrays natively
+        if self.arrays:
+            # Convert arrays and array scalars before "default" function.
+            #
+            # The Python version of encoder functions encode arrays
+            # directly, but the C version passes them to the handler.
+            _default = _make_array_default(_default)
+
         # If check circular references
         if self.check_circular:
             # Create makers dict
@@ -445,14 +1183,22 @@ class JSONEncoder(object):
             return text
 
 
+        # If use explicit-stack encoder
+        if self.iterative:
+            # Use explicit-stack make-encoder function to create iterable
+            _iterencode = _make_stack_iterencode(
+                markers, _default, _encoder, self.indent, floatstr,
+                self.key_separator, self.item_separator, self.sort_keys,
+                self.skipkeys, _one_shot, self.records, self.arrays)
+
         # If the iteration is one-shot,
         # and C version of encoder function is available,
         # and indentation argument is not given
-        if (_one_shot and c_make_encoder is not None
+        elif (_one_shot and c_make_encoder is not None
                 and self.indent is None):
             # Use C version of make-encoder function to create iterable
             _iterencode = c_make_encoder(
-                markers, self.default, _encoder, self.indent,
+                markers, _default, _encoder, self.indent,
                 self.key_separator, self.item_separator, self.sort_keys,
                 self.skipkeys, self.allow_nan)
 
@@ -460,11 +1206,37 @@ class JSONEncoder(object):
         # or C version of encoder is not available,
         # or indentation argument is given
         else:
+            # If C version of encoder function is available.
+            #
+            # The C version does not indent, and encodes a whole object in
+            # one call. With indentation, it can still encode a container of
+            # scalars only, given an item separator with the container's
+            # indentation. Without indentation, it can encode a small
+            # subtree as one chunk.
+            if c_make_encoder is not None:
+                # Create a factory function of C version of encoder function
+                def _make_c_encoder(item_separator):
+                    # @param item_separator: Item separator.
+                    #
+                    # @return: C version of encoder function.
+
+                    # Create and return C version of encoder function
+                    return c_make_encoder(
+                        markers, _default, _encoder, None,
+                        self.key_separator, item_separator, self.sort_keys,
+                        self.skipkeys, self.allow_nan)
+
+            # If C version of encoder function is not available
+            else:
+                # Not use C version of encoder function
+                _make_c_encoder = None
+
             # Use Python version of make-encoder function to create iterable
             _iterencode = _make_iterencode(
-                markers, self.default, _encoder, self.indent, floatstr,
+                markers, _default, _encoder, self.indent, floatstr,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, _one_shot)
+                self.skipkeys, _one_shot, _make_c_encoder, self.records,
+                self.arrays)
 
         # Create and return the iterable
         return _iterencode(o, 0)
@@ -473,16 +1245,26 @@ class JSONEncoder(object):
 #
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
+        _make_c_encoder=None, _records=False, _arrays=False,
         ## HACK: hand-optimized bytecode; turn globals into locals
         ValueError=ValueError,
+        all=all,
         dict=dict,
         float=float,
+        getattr=getattr,
         id=id,
         int=int,
         isinstance=isinstance,
         list=list,
+        map=map,
+        sorted=sorted,
         str=str,
         tuple=tuple,
+        type=type,
+        zip=zip,
+        _record_fields=_record_fields,
+        _record_items=_record_items,
+        _array_function=_array_function,
     ):
     # Factory function of encode-to-iterable function that encodes Python
     # object to JSON data by returning an iterable of result chunks.
@@ -507,6 +1289,18 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
     #
     # @param _one_shot: Whether the iteration is one-shot.
     #
+    # @param _make_c_encoder: None, or factory function of C version of
+    # encoder function given an item separator. If given, with indentation, a
+    # list or dict of scalars only is encoded by the C version in one call.
+    # Without indentation, a list or dict of at most "STREAM_CHUNK_ITEMS"
+    # items in its subtree is.
+    #
+    # @param _records: Whether encode dataclasses, slotted objects and enum
+    # members natively.
+    #
+    # @param _arrays: Whether encode arrays, buffers and array scalars
+    # natively.
+    #
     # @return: Encode-to-iterable function.
 
     # If indentation argument is given,
@@ -516,6 +1310,253 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         # Get indentation text
         _indent = ' ' * _indent
 
+    # If encode arrays natively
+    if _arrays:
+        # Create encode function for lists converted from arrays
+        _encode_array = _make_array_encoder(_indent, _item_separator,
+                                            _floatstr)
+
+    # Get test function of whether a type is of scalar values the C version
+    # encodes the same way. Subclasses are left to the Python version.
+    _is_scalar = {str, int, float, bool, type(None)}.__contains__
+
+    # Get test function of whether a type is of containers
+    _is_container = {list, tuple, dict}.__contains__
+
+    # If use C version of encoder function
+    if _make_c_encoder is not None:
+        # Map indentation level to C version of encoder function. With
+        # indentation, the function is cached with indentation texts of the
+        # items and the ending bracket.
+        c_encoders = {}
+
+    # Slots whose containers the C version could not encode with
+    # indentation. A slot is the indentation level for list items, or a
+    # tuple of indentation level and key for dict item values. Records of one
+    # schema nest containers the same way, so later containers in these
+    # slots are left to the Python version without checking them.
+    flat_misses = set()
+
+    # Encode function for list or dict of scalars only
+    def _encode_flat(o, _current_indent_level):
+        # Encode a non-empty list or dict of scalars only to JSON data, using
+        # C version of encoder function.
+        #
+        # @param o: Python object.
+        #
+        # @param _current_indent_level: Indentation level of the object.
+        #
+        # @return: Result chunk, or None if the object is not a list, tuple
+        # or dict of scalars only.
+
+        # If the object is list or tuple
+        if isinstance(o, (list, tuple)):
+            # If the object is empty
+            if not o:
+                # Return the result chunk
+                return '[]'
+
+            # Get the items
+            values = o
+
+        # If the object is dict
+        elif isinstance(o, dict):
+            # If the object is empty
+            if not o:
+                # Return the result chunk
+                return '{}'
+
+            # Get the item values
+            values = o.values()
+
+        # If the object is something else
+        else:
+            # Not encode the object
+            return None
+
+        # If the object has an item that is not scalar
+        if not all(map(_is_scalar, map(type, values))):
+            # Not encode the object
+            return None
+
+        #
+        try:
+            # Get C version of encoder function for the object's level, and
+            # indentation texts of its items and its ending bracket
+            encode, newline_indent, end_indent = \
+                c_encoders[_current_indent_level]
+
+        # If the encoder function is not created yet
+        except KeyError:
+            # Get indentation text of the items
+            newline_indent = '\n' + _indent * (_current_indent_level + 1)
+
+            # Get indentation text of the ending bracket
+            end_indent = '\n' + _indent * _current_indent_level
+
+            # Create the encoder function with the items' item separator
+            encode = _make_c_encoder(_item_separator + newline_indent)
+
+            # Cache them
+            c_encoders[_current_indent_level] = (
+                encode, newline_indent, end_indent)
+
+        # Encode the object, e.g. "[1,\n  2]"
+        text = ''.join(encode(o, 0))
+
+        # Add indentation after the starting bracket, and before the ending
+        # bracket.
+        # Return the result chunk.
+        return text[0] + newline_indent + text[1:-1] + end_indent + text[-1]
+
+    # Encode function for list or dict with a small subtree
+    def _encode_small(o, _current_indent_level):
+        # Encode a list or dict with at most "STREAM_CHUNK_ITEMS" items in
+        # its subtree to JSON data, using C version of encoder function.
+        #
+        # Objects converted by the unserializable object handler are not
+        # counted.
+        #
+        # @param o: Python object.
+        #
+        # @param _current_indent_level: Indentation level of the object.
+        #
+        # @return: Result chunk, or None if the object is not a list, tuple
+        # or dict with a small subtree.
+
+        # If the object is not list, tuple or dict
+        if not isinstance(o, (list, tuple, dict)):
+            # Not encode the object
+            return None
+
+        # Number of items allowed in the subtree
+        budget = STREAM_CHUNK_ITEMS
+
+        # Containers of the subtree's current depth
+        level = [o]
+
+        # While have containers of current depth.
+        #
+        # Each depth is handled by a few calls iterating in C, not by a
+        # Python loop over containers.
+        while level:
+            # Subtract the containers' numbers of items
+            budget -= sum(map(len, level))
+
+            # If the subtree has too many items
+            if budget < 0:
+                # Not encode the object
+                return None
+
+            # Get whether each container is dict
+            is_dict = list(map(isinstance, level, repeat(dict)))
+
+            # Get item values of the containers
+            values = list(chain(
+                chain.from_iterable(compress(level, map(not_, is_dict))),
+                chain.from_iterable(map(dict.values,
+                                        compress(level, is_dict)))))
+
+            # Get item values that are containers, of the next depth
+            level = list(compress(values,
+                                  map(_is_container, map(type, values))))
+
+        # Get C version of encoder function
+        encode = c_encoders.get(0)
+
+        # If the encoder function is not created yet
+        if encode is None:
+            # Create the encoder function
+            encode = c_encoders[0] = _make_c_encoder(_item_separator)
+
+        # Encode the object.
+        # Return the result chunk.
+        return ''.join(encode(o, 0))
+
+    # If not use C version of encoder function
+    if _make_c_encoder is None:
+        # Set encode function to None
+        _encode_c = None
+
+    # If use C version of encoder function, with indentation
+    elif _indent is not None:
+        # Use encode function for list or dict of scalars only
+        _encode_c = _encode_flat
+
+    # If use C version of encoder function, without indentation
+    else:
+        # Use encode function for list or dict with a small subtree
+        _encode_c = _encode_small
+
+    # Encode-to-iterable function for list object, encoding runs of items by
+    # C version of encoder function
+    def _iterencode_runs(lst, _current_indent_level):
+        # Encode a non-empty list to JSON data by returning an iterable of
+        # result chunks. Each run of items with a small subtree in total is
+        # encoded by C version of encoder function as one chunk.
+        #
+        # @param lst: A list object.
+        #
+        # @param _current_indent_level: Indentation level.
+        #
+        # @return: An iterable of result chunks.
+
+        # Yield list starting "["
+        yield '['
+
+        # Get number of items
+        count = len(lst)
+
+        # Start index of the next run
+        start = 0
+
+        # Number of items to try to encode in the next run
+        size = 1
+
+        # While have items to encode
+        while start < count:
+            # Try to encode a run of items, e.g. "[1, 2]"
+            text = _encode_small(lst[start:start + size],
+                                 _current_indent_level)
+
+            # If the run is encoded
+            if text is not None:
+                # If the run is not the first
+                if start:
+                    # Yield item separator
+                    yield _item_separator
+
+                # Yield the run's items without brackets
+                yield text[1:-1]
+
+                # Forward start index
+                start += size
+
+                # Try a longer run next
+                size = min(size * 2, STREAM_CHUNK_ITEMS)
+
+            # If the run has too many items, and more than one item
+            elif size > 1:
+                # Try a shorter run
+                size //= 2
+
+            # If one item has too many items in its subtree
+            else:
+                # If the item is not the first
+                if start:
+                    # Yield item separator
+                    yield _item_separator
+
+                # Create another iterable to encode the item.
+                # Yield from the iterable.
+                yield from _iterencode(lst[start], _current_indent_level)
+
+                # Forward start index
+                start += 1
+
+        # Yield list ending "]"
+        yield ']'
+
     # Encode-to-iterable function for list object
     def _iterencode_list(lst, _current_indent_level):
         # Encode a list to JSON data by returning an iterable of result chunks.
@@ -548,6 +1589,19 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
             # add the object ID to the markers dict.
             markers[markerid] = lst
 
+        # If use C version of encoder function without indentation
+        if _encode_c is _encode_small:
+            # Yield from the iterable encoding runs of items
+            yield from _iterencode_runs(lst, _current_indent_level)
+
+            # If check circular references
+            if markers is not None:
+                # Delete the object ID from the markers dict
+                del markers[markerid]
+
+            # Stop the iteration
+            return
+
         # Output chunk to yield
         buf = '['
 
@@ -628,6 +1682,28 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
 
             # If the item is something else
             else:
+                # If use C version of encoder function, and the C version
+                # encoded the list items of this level so far
+                if _encode_c is not None and \
+                        _current_indent_level not in flat_misses:
+                    # Encode the item if it is a container the C version can
+                    # encode
+                    text = _encode_c(value, _current_indent_level)
+
+                    # If the item is encoded
+                    if text is not None:
+                        # Yield the output chunk plus the item's text
+                        yield buf + text
+
+                        # Continue with the next item
+                        continue
+
+                    # Not check list items of this level again.
+                    #
+                    # Lists are encoded by runs without indentation, so the
+                    # C version here is the one for indentation.
+                    flat_misses.add(_current_indent_level)
+
                 # Yield the output chunk
                 yield buf
 
@@ -666,17 +1742,30 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
             del markers[markerid]
 
     # Encode-to-iterable function for dict object
-    def _iterencode_dict(dct, _current_indent_level):
+    def _iterencode_dict(dct, _current_indent_level, _fields=None):
         # Encode a dict to JSON data by returning an iterable of result chunks.
         #
-        # @param dct: A dict object.
+        # @param dct: A dict object, or a record object if field names are
+        # given.
         #
         # @param _current_indent_level: Indentation level.
         #
+        # @param _fields: None, or a tuple of the record object's field names.
+        #
         # @return: An iterable of result chunks.
 
-        # If the dict is empty
-        if not dct:
+        # If the object is record
+        if _fields is not None:
+            # If sort dict keys
+            if _sort_keys:
+                # Sort field names
+                _fields = sorted(_fields)
+
+            # Get items of the record's fields with values
+            items = _record_items(dct, _fields)
+
+        # If the dict is empty, or the record object has no field values
+        if not (dct if _fields is None else items):
             # Yield result
             yield '{}'
 
@@ -723,8 +1812,13 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         # Whether is the first item in the dict
         first = True
 
+        # If the object is record
+        if _fields is not None:
+            # Use the items read above
+            pass
+
         # If sort dict keys
-        if _sort_keys:
+        elif _sort_keys:
             # Get iterable of sorted items
             items = sorted(dct.items(), key=lambda kv: kv[0])
 
@@ -836,6 +1930,27 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
 
             # If the item value is something else
             else:
+                # If use C version of encoder function, and the C version
+                # encoded the values of this key and level so far
+                if _encode_c is not None and \
+                        (_current_indent_level, key) not in flat_misses:
+                    # Encode the item value if it is a container the C
+                    # version can encode
+                    text = _encode_c(value, _current_indent_level)
+
+                    # If the item value is encoded
+                    if text is not None:
+                        # Yield the item value's text
+                        yield text
+
+                        # Continue with the next item
+                        continue
+
+                    # If indentation argument is given
+                    if newline_indent is not None:
+                        # Not check values of this key and level again
+                        flat_misses.add((_current_indent_level, key))
+
                 # If the item value is list or tuple
                 if isinstance(value, (list, tuple)):
                     # Create another iterable to encode the item value
@@ -915,17 +2030,102 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
             # see comment for int/float in _make_iterencode
             yield _floatstr(float(o))
 
-        # If the object is list or tuple
-        elif isinstance(o, (list, tuple)):
-            # Create another iterable to encode the object.
-            # Yield from the iterable.
-            yield from _iterencode_list(o, _current_indent_level)
+        # If the object is list, tuple or dict
+        elif isinstance(o, (list, tuple, dict)):
+            # If use C version of encoder function
+            if _encode_c is not None:
+                # Encode the object if it is a container the C version can
+                # encode.
+                #
+                # Items of containers are checked by the containers'
+                # iterables.
+                text = _encode_c(o, _current_indent_level)
 
-        # If the object is dict
-        elif isinstance(o, dict):
-            # Create another iterable to encode the object
-            # Yield from the iterable.
-            yield from _iterencode_dict(o, _current_indent_level)
+            # If not use C version of encoder function
+            else:
+                # Not encoded
+                text = None
+
+            # If the object is encoded
+            if text is not None:
+                # Yield the object's text
+                yield text
+
+            # If the object is dict
+            elif isinstance(o, dict):
+                # Create another iterable to encode the object
+                # Yield from the iterable.
+                yield from _iterencode_dict(o, _current_indent_level)
+
+            # If the object is list or tuple
+            else:
+                # Create another iterable to encode the object.
+                # Yield from the iterable.
+                yield from _iterencode_list(o, _current_indent_level)
+
+        # If encode arrays natively, and the object is an array or array
+        # scalar
+        elif _arrays and _array_function(type(o)) is not None:
+            # Convert the object to list or number
+            value = _array_function(type(o))(o)
+
+            # If the object is converted to list
+            if type(value) is list:
+                # Encode the list in one pass
+                text = _encode_array(value, _current_indent_level)
+
+            # If the object is converted to number
+            else:
+                # Not encoded
+                text = None
+
+            # If the object is encoded
+            if text is not None:
+                # Yield the object's text
+                yield text
+
+            # If the object is not encoded, e.g. an array of objects
+            else:
+                # If check circular references
+                if markers is not None:
+                    # Get the object ID
+                    markerid = id(o)
+
+                    # If the object ID exists in the markers dict
+                    if markerid in markers:
+                        # Raise error
+                        raise ValueError("Circular reference detected")
+
+                    # If the object ID not exists in the markers dict,
+                    # add the object ID to the markers dict.
+                    markers[markerid] = o
+
+                # Create another iterable to encode the converted object.
+                # Yield from the iterable.
+                yield from _iterencode(value, _current_indent_level)
+
+                # If check circular references
+                if markers is not None:
+                    # Delete the object ID from the markers dict
+                    del markers[markerid]
+
+        # If encode records natively, and the object is a record or enum
+        # member
+        elif _records and _record_fields(type(o)) is not False:
+            # Get the object's field names
+            fields = _record_fields(type(o))
+
+            # If the object is enum member
+            if fields is None:
+                # Create another iterable to encode the member's value.
+                # Yield from the iterable.
+                yield from _iterencode(o.value, _current_indent_level)
+
+            # If the object is record
+            else:
+                # Create another iterable to encode the record as dict.
+                # Yield from the iterable.
+                yield from _iterencode_dict(o, _current_indent_level, fields)
 
         # If the object is something else
         else:
@@ -958,3 +2158,508 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
 
     # Return the encode-to-iterable function for object
     return _iterencode
+
+
+# Kinds of frames of "_make_stack_iterencode"'s stack
+_LIST_FRAME = 0
+_DICT_FRAME = 1
+_DEFAULT_FRAME = 2
+
+
+#
+def _make_stack_iterencode(markers, _default, _encoder, _indent, _floatstr,
+        _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
+        _records=False, _arrays=False,
+        ## HACK: hand-optimized bytecode; turn globals into locals
+        ValueError=ValueError,
+        dict=dict,
+        float=float,
+        getattr=getattr,
+        id=id,
+        int=int,
+        isinstance=isinstance,
+        iter=iter,
+        len=len,
+        list=list,
+        map=map,
+        next=next,
+        sorted=sorted,
+        str=str,
+        tuple=tuple,
+        type=type,
+        zip=zip,
+        _record_fields=_record_fields,
+        _record_items=_record_items,
+        _array_function=_array_function,
+    ):
+    # Factory function of encode-to-iterable function that encodes Python
+    # object to JSON data by returning an iterable of result chunks.
+    #
+    # Same as "_make_iterencode", except that nested containers are tracked
+    # by an explicit stack, and chunks are appended to one output list, not
+    # passed up through a generator per nesting level. Deep objects are
+    # encoded in linear time with no recursion limit.
+    #
+    # @param markers: Markers dict to remember circular references.
+    #
+    # @param _default: Unserializable object handler.
+    #
+    # @param _encoder: String escape function.
+    #
+    # @param _indent: Indentation argument: a text, or number of spaces.
+    #
+    # @param _floatstr: Float-to-text function.
+    #
+    # @param _key_separator: Key separator.
+    #
+    # @param _item_separator: Item separator.
+    #
+    # @param _sort_keys: Whether sort dict keys.
+    #
+    # @param _skipkeys: Whether skip non-regular-type keys.
+    #
+    # @param _one_shot: Whether the iteration is one-shot. If not, output is
+    # yielded about every "STREAM_CHUNK_ITEMS" chunks.
+    #
+    # @param _records: Whether encode dataclasses, slotted objects and enum
+    # members natively.
+    #
+    # @param _arrays: Whether encode arrays, buffers and array scalars
+    # natively.
+    #
+    # @return: Encode-to-iterable function.
+
+    # If indentation argument is given,
+    # and the value is not string,
+    # it means it is number of spaces.
+    if _indent is not None and not isinstance(_indent, str):
+        # Get indentation text
+        _indent = ' ' * _indent
+
+    # If encode arrays natively
+    if _arrays:
+        # Create encode function for lists converted from arrays
+        _encode_array = _make_array_encoder(_indent, _item_separator,
+                                            _floatstr)
+
+    # Number of output chunks to yield at a time
+    batch_size = None if _one_shot else STREAM_CHUNK_ITEMS
+
+    # End marker of items iterators, which is never an item
+    end = object()
+
+    # Get test function of whether a type is of containers
+    _is_container = {list, tuple, dict}.__contains__
+
+    # Encode-to-iterable function for object
+    def _iterencode(o, _current_indent_level):
+        # Encode an object to JSON data by returning an iterable of result
+        # chunks.
+        #
+        # @param o: An object.
+        #
+        # @param _current_indent_level: Indentation level.
+        #
+        # @return: An iterable of result chunks.
+
+        # Output chunks not yielded yet
+        out = []
+
+        # Cache append function
+        append = out.append
+
+        # Stack of frames of open containers, and of objects converted by
+        # unserializable object handler. A container's frame is a list of
+        # kind, items iterator, item separator, indentation text of the
+        # ending bracket, object ID, indentation level of items, and whether
+        # no item is output yet. A converted object's frame is a list of
+        # kind, and object ID.
+        stack = []
+
+        # Loop for each value
+        while True:
+            # If enough output chunks are not yielded
+            if batch_size is not None and len(out) >= batch_size:
+                # Yield the output chunks joined
+                yield ''.join(out)
+
+                # Clear output chunks
+                del out[:]
+
+            # If the value is string
+            if isinstance(o, str):
+                # Output the value's escaped text
+                append(_encoder(o))
+
+            # If the value is None
+            elif o is None:
+                # Output the value's text
+                append('null')
+
+            # If the value is True
+            elif o is True:
+                # Output the value's text
+                append('true')
+
+            # If the value is False
+            elif o is False:
+                # Output the value's text
+                append('false')
+
+            # If the value is integer
+            elif isinstance(o, int):
+                # Output the value's text.
+                #
+                # see comment for int/float in _make_iterencode
+                append(str(int(o)))
+
+            # If the value is float
+            elif isinstance(o, float):
+                # Output the value's text.
+                #
+                # see comment for int/float in _make_iterencode
+                append(_floatstr(float(o)))
+
+            # If the value is list, tuple or dict,
+            # or encode records natively and the value is a record or enum
+            # member
+            elif (isinstance(o, (list, tuple, dict)) or
+                    _records and _record_fields(type(o)) is not False):
+                # If encode records natively, and the value is not of a
+                # container type exactly
+                if _records and not _is_container(type(o)):
+                    # Get the value's field names
+                    fields = _record_fields(type(o))
+
+                    # If the value is enum member
+                    if fields is None:
+                        # Get the member's value
+                        o = o.value
+
+                        # Continue with the value
+                        continue
+
+                # If the value is a container
+                else:
+                    # The value is not a record
+                    fields = False
+
+                # If the value is record
+                if fields is not False:
+                    # If sort dict keys
+                    if _sort_keys:
+                        # Sort field names
+                        fields = sorted(fields)
+
+                    # Get items of the record's fields with values
+                    record_items = _record_items(o, fields)
+
+                # Get whether the value is dict, or a record encoded as dict
+                is_dict = fields is not False or isinstance(o, dict)
+
+                # If the value is empty, or the record has no field values
+                if not (o if fields is False else record_items):
+                    # Output the value's text
+                    append('{}' if is_dict else '[]')
+
+                # If the value is not empty
+                else:
+                    # If check circular references
+                    if markers is not None:
+                        # Get the value's object ID
+                        markerid = id(o)
+
+                        # If the object ID exists in the markers dict
+                        if markerid in markers:
+                            # Raise error
+                            raise ValueError("Circular reference detected")
+
+                        # If the object ID not exists in the markers dict,
+                        # add the object ID to the markers dict.
+                        markers[markerid] = o
+
+                    # If not check circular references
+                    else:
+                        # Set object ID to None
+                        markerid = None
+
+                    # Output starting bracket
+                    append('{' if is_dict else '[')
+
+                    # If indentation argument is given
+                    if _indent is not None:
+                        # Get indentation text of the ending bracket
+                        close_indent = '\n' + _indent * _current_indent_level
+
+                        # Increment indentation level
+                        _current_indent_level += 1
+
+                        # Get indentation text of the items
+                        newline_indent = '\n' + _indent * _current_indent_level
+
+                        # Add indentation text to item separator
+                        separator = _item_separator + newline_indent
+
+                        # Output indentation text
+                        append(newline_indent)
+
+                    # If indentation argument is not given
+                    else:
+                        # Set indentation text of the ending bracket to None
+                        close_indent = None
+
+                        # Use item separator as-is
+                        separator = _item_separator
+
+                    # If the value is record
+                    if fields is not False:
+                        # Get iterator of the items read above
+                        items = iter(record_items)
+
+                    # If the value is dict, and sort dict keys
+                    elif is_dict and _sort_keys:
+                        # Get iterator of sorted items
+                        items = iter(sorted(o.items(), key=lambda kv: kv[0]))
+
+                    # If the value is dict, and not sort dict keys
+                    elif is_dict:
+                        # Get iterator of items
+                        items = iter(o.items())
+
+                    # If the value is list or tuple
+                    else:
+                        # Get iterator of items
+                        items = iter(o)
+
+                    # Push the container's frame
+                    stack.append([_DICT_FRAME if is_dict else _LIST_FRAME,
+                                  items, separator, close_indent, markerid,
+                                  _current_indent_level, True])
+
+            # If encode arrays natively, and the value is an array or array
+            # scalar
+            elif _arrays and _array_function(type(o)) is not None:
+                # Convert the value to list or number
+                value = _array_function(type(o))(o)
+
+                # If the value is converted to list
+                if type(value) is list:
+                    # Encode the list in one pass
+                    text = _encode_array(value, _current_indent_level)
+
+                # If the value is converted to number
+                else:
+                    # Not encoded
+                    text = None
+
+                # If the value is encoded
+                if text is not None:
+                    # Output the value's text
+                    append(text)
+
+                # If the value is not encoded, e.g. an array of objects
+                else:
+                    # If check circular references
+                    if markers is not None:
+                        # Get the value's object ID
+                        markerid = id(o)
+
+                        # If the object ID exists in the markers dict
+                        if markerid in markers:
+                            # Raise error
+                            raise ValueError("Circular reference detected")
+
+                        # If the object ID not exists in the markers dict,
+                        # add the object ID to the markers dict.
+                        markers[markerid] = o
+
+                        # Push the converted object's frame, to delete the
+                        # object ID after the converted object is encoded
+                        stack.append([_DEFAULT_FRAME, markerid])
+
+                    # Get the converted object
+                    o = value
+
+                    # Continue with the converted object
+                    continue
+
+            # If the value is something else
+            else:
+                # If check circular references
+                if markers is not None:
+                    # Get the value's object ID
+                    markerid = id(o)
+
+                    # If the object ID exists in the markers dict
+                    if markerid in markers:
+                        # Raise error
+                        raise ValueError("Circular reference detected")
+
+                    # If the object ID not exists in the markers dict,
+                    # add the object ID to the markers dict.
+                    markers[markerid] = o
+
+                    # Push the converted object's frame, to delete the object
+                    # ID after the serializable object is encoded
+                    stack.append([_DEFAULT_FRAME, markerid])
+
+                # Call unserializable object handler to convert the value to
+                # a serializable object
+                o = _default(o)
+
+                # Continue with the serializable object
+                continue
+
+            # Loop to find the next value.
+            #
+            # A value that opens a container is followed by its first item.
+            while stack:
+                # Get the innermost frame
+                frame = stack[-1]
+
+                # Get the frame's kind
+                kind = frame[0]
+
+                # If the frame is of list
+                if kind == _LIST_FRAME:
+                    # Get the next item
+                    o = next(frame[1], end)
+
+                    # If have next item
+                    if o is not end:
+                        # If is the first item
+                        if frame[6]:
+                            # Set the boolean to False
+                            frame[6] = False
+
+                        # If is not the first item
+                        else:
+                            # Output item separator
+                            append(frame[2])
+
+                        # Get indentation level of the item
+                        _current_indent_level = frame[5]
+
+                        # Stop finding
+                        break
+
+                # If the frame is of dict
+                elif kind == _DICT_FRAME:
+                    # For each remaining item
+                    for key, o in frame[1]:
+                        # If the key is string
+                        if isinstance(key, str):
+                            # No need to convert the key to text
+                            pass
+
+                        # If the key is float.
+                        #
+                        # see comment for keys in _make_iterencode
+                        elif isinstance(key, float):
+                            # Convert the key to text
+                            key = _floatstr(float(key))
+
+                        # If the key is True
+                        elif key is True:
+                            # Convert the key to text
+                            key = 'true'
+
+                        # If the key is False
+                        elif key is False:
+                            # Convert the key to text
+                            key = 'false'
+
+                        # If the key is None
+                        elif key is None:
+                            # Convert the key to text
+                            key = 'null'
+
+                        # If the key is integer
+                        elif isinstance(key, int):
+                            # Convert the key to text
+                            key = str(int(key))
+
+                        # If the key is of non-regular-type,
+                        # and skip non-regular-type keys
+                        elif _skipkeys:
+                            # Skip the item
+                            continue
+
+                        # If the key is of non-regular-type,
+                        # and not skip non-regular-type keys
+                        else:
+                            # Raise error
+                            raise TypeError(
+                                "key " + repr(key) + " is not a string")
+
+                        # If is the first item
+                        if frame[6]:
+                            # Set the boolean to False
+                            frame[6] = False
+
+                        # If is not the first item
+                        else:
+                            # Output item separator
+                            append(frame[2])
+
+                        # Output escaped key
+                        append(_encoder(key))
+
+                        # Output key separator
+                        append(_key_separator)
+
+                        # Get indentation level of the item value
+                        _current_indent_level = frame[5]
+
+                        # Stop the items loop
+                        break
+
+                    # If have no more items
+                    else:
+                        # Set the value to end marker
+                        o = end
+
+                    # If have next item value
+                    if o is not end:
+                        # Stop finding
+                        break
+
+                # If the frame is of converted object
+                else:
+                    # Pop the frame
+                    stack.pop()
+
+                    # Delete the object ID from the markers dict
+                    del markers[frame[1]]
+
+                    # Continue with the outer frame
+                    continue
+
+                # If the container has no more items.
+
+                # Pop the frame
+                stack.pop()
+
+                # If indentation argument is given
+                if frame[3] is not None:
+                    # Output indentation text of the ending bracket
+                    append(frame[3])
+
+                # Output ending bracket
+                append('}' if kind == _DICT_FRAME else ']')
+
+                # If check circular references
+                if markers is not None:
+                    # Delete the object ID from the markers dict
+                    del markers[frame[4]]
+
+            # If the stack is empty, i.e. the object is encoded
+            else:
+                # Yield the output chunks joined
+                yield ''.join(out)
+
+                # Stop the iteration
+                return
+
+    # Return the encode-to-iterable function for object
+    return _iterencode
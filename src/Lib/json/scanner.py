@@ -6,7 +6,8 @@ try:
 except ImportError:
     c_make_scanner = None
 
-__all__ = ['make_scanner']
+__all__ = ['make_scanner', 'make_validator', 'make_iterative_scanner',
+           'make_interning_scanner']
 
 
 # Regular expression object to match a number.
@@ -90,9 +91,38 @@ def py_make_scanner(context):
     # Get object pairs hook function
     object_pairs_hook = context.object_pairs_hook
 
-    # Get memo dict for caching decoded string chunks
+    # Get memo for interning decoded object keys
     memo = context.memo
 
+    # Get function to call after each document. A plain dict memo is cleared.
+    end_document = getattr(memo, 'end_document', memo.clear)
+
+    # Get maximum number of number literals cached per document. 0 means no
+    # cache.
+    number_cache_size = context.number_cache
+
+    # Map number literal to parsed value, within a document
+    number_cache = {}
+
+    # Cache number cache's get function
+    number_cache_get = number_cache.get
+
+    # Get memo for interning decoded string values, or None
+    value_memo = context.value_memo
+
+    # Get maximum length of interned string values
+    value_maxlen = context.value_maxlen
+
+    # If string values are interned
+    if value_memo is not None:
+        # Cache value memo's setdefault function
+        value_memo_get = value_memo.setdefault
+
+        # Get function to call after each document. A plain dict memo is
+        # cleared.
+        value_end_document = getattr(
+            value_memo, 'end_document', value_memo.clear)
+
     # Create scanner function
     def _scan_once(string, idx):
         # Scan next symbol from input string.
@@ -118,9 +148,22 @@ def py_make_scanner(context):
 
         # If the character is starting `"` of JSON string,
         if nextchar == '"':
-            # Call parse string function,
-            # return parsed value, and parsing end position
-            return parse_string(string, idx + 1, strict)
+            # If string values are not interned
+            if value_memo is None:
+                # Call parse string function,
+                # return parsed value, and parsing end position
+                return parse_string(string, idx + 1, strict)
+
+            # Call parse string function, get parsing end position
+            res, end = parse_string(string, idx + 1, strict)
+
+            # If the string is short enough
+            if len(res) <= value_maxlen:
+                # Get interned string
+                res = value_memo_get(res, res)
+
+            # Return parsed value, and parsing end position
+            return res, end
 
         # If the character is starting `{` of JSON object,
         elif nextchar == '{':
@@ -155,18 +198,33 @@ def py_make_scanner(context):
 
         # If have match result
         if m is not None:
-            # Get integer, fraction, and exponent parts
-            integer, frac, exp = m.groups()
+            # Get the number's text, which is one slice of the JSON data
+            number = m.group()
+
+            # If number cache is enabled
+            if number_cache_size:
+                # Get cached value
+                res = number_cache_get(number)
+
+                # If the value is cached
+                if res is not None:
+                    # Return cached value, and parsing end position
+                    return res, m.end()
 
             # If fraction part or exponent part exists
-            if frac or exp:
+            if m.lastindex != 1:
                 # Call parse float function
-                res = parse_float(integer + (frac or '') + (exp or ''))
+                res = parse_float(number)
 
             # If fraction part and exponent part not exist
             else:
                 # Call parse int function
-                res = parse_int(integer)
+                res = parse_int(number)
+
+            # If number cache is enabled and not full
+            if number_cache_size and len(number_cache) < number_cache_size:
+                # Cache the value
+                number_cache[number] = res
 
             # Return parsed value, and parsing end position
             return res, m.end()
@@ -196,7 +254,9 @@ def py_make_scanner(context):
             # Raise StopIteration to notify caller
             raise StopIteration(idx)
 
-    # Create a wrapping function that clears memo dict after each call. Unused.
+    # Create a wrapping function that ends memo's document after each call,
+    # so that a per-document memo does not keep keys of all documents ever
+    # decoded.
     def scan_once(string, idx):
         # Scan next symbol from input string.
         # Call parse function according to the symbol's type.
@@ -211,13 +271,894 @@ def py_make_scanner(context):
             return _scan_once(string, idx)
         # Before returning
         finally:
-            # Clear memo dict
-            memo.clear()
+            # End memo's document
+            end_document()
+
+            # Drop cached numbers
+            number_cache.clear()
+
+            # If string values are interned
+            if value_memo is not None:
+                # End value memo's document
+                value_end_document()
 
     # Return scanner function
-    return _scan_once
+    return scan_once
 
 
 # If C version is available, use C version.
 # Else, use Python version.
 make_scanner = c_make_scanner or py_make_scanner
+
+
+#
+def make_interning_scanner(context, keys=False):
+    # Factory function of scanner function that interns short string values
+    # in decoder's "value_memo", and object keys in decoder's "memo".
+    #
+    # The Python scanner interns string values and keys as it decodes them.
+    # The C scanner can not, so each value it returns is walked afterwards.
+    # Short strings in dicts and lists are replaced by interned ones, and
+    # dicts are rebuilt with interned keys. Equal strings are still created
+    # while a document is decoded, but only the interned ones are kept.
+    #
+    # @param context: Decoder object.
+    #
+    # @param keys: Whether intern object keys in decoder's "memo". The C
+    # scanner interns keys in its own per-document memo only.
+    #
+    # @return: Scanner function.
+
+    # If C version is not available
+    if c_make_scanner is None:
+        # Return Python scanner function, which interns string values and
+        # keys
+        return py_make_scanner(context)
+
+    # Create C scanner function
+    c_scan_once = c_make_scanner(context)
+
+    # Get memo for interning decoded string values, or None
+    value_memo = context.value_memo
+
+    # If string values are interned
+    if value_memo is not None:
+        # Cache value memo's setdefault function
+        value_memo_get = value_memo.setdefault
+
+        # Get function to call after each document. A plain dict memo is
+        # cleared.
+        value_end_document = getattr(
+            value_memo, 'end_document', value_memo.clear)
+
+    # Get maximum length of interned string values
+    value_maxlen = context.value_maxlen
+
+    # Get memo for interning decoded object keys
+    memo = context.memo
+
+    # Cache memo's setdefault function
+    memo_get = memo.setdefault
+
+    # Get function to call after each document. A plain dict memo is cleared.
+    end_document = getattr(memo, 'end_document', memo.clear)
+
+    # Get test function of whether a type is of containers to walk. Results
+    # of object hooks are not walked.
+    is_container = {dict, list}.__contains__
+
+    # Create scanner function
+    def scan_once(string, idx):
+        # Scan next symbol from input string, and intern its short string
+        # values and object keys.
+        #
+        # @param string: JSON data.
+        #
+        # @param idx: JSON data's parsing position.
+        #
+        # @return: Next symbol or structure's parsed value.
+
+        #
+        try:
+            # Scan the value, get parsing end position
+            value, end = c_scan_once(string, idx)
+
+            # If the value is a string
+            if type(value) is str:
+                # If string values are interned, and the string is short
+                # enough
+                if value_memo is not None and len(value) <= value_maxlen:
+                    # Get interned string
+                    value = value_memo_get(value, value)
+
+                # Return the value, and parsing end position
+                return value, end
+
+            # If the value is a dict, and keys are interned
+            if keys and type(value) is dict:
+                # Rebuild the dict with interned keys
+                value = {memo_get(k, k): v for k, v in value.items()}
+
+            # Containers to walk
+            stack = [value] if is_container(type(value)) else []
+
+            # Cache pop function
+            pop = stack.pop
+
+            # Cache append function
+            push = stack.append
+
+            # While have container to walk
+            while stack:
+                # Get a container
+                container = pop()
+
+                # If the container is dict
+                if type(container) is dict:
+                    # Get its members
+                    items = container.items()
+
+                # If the container is list
+                else:
+                    # Get its elements with indexes
+                    items = enumerate(container)
+
+                # For each member or element.
+                #
+                # Replacing a dict member's value does not change the dict's
+                # size, so iteration goes on.
+                for key, item in items:
+                    # If the item is a string
+                    if type(item) is str:
+                        # If string values are interned, and the string is
+                        # short enough
+                        if value_memo is not None and \
+                                len(item) <= value_maxlen:
+                            # Replace by interned string
+                            container[key] = value_memo_get(item, item)
+
+                    # If the item is a dict
+                    elif type(item) is dict:
+                        # If keys are interned
+                        if keys:
+                            # Replace by the dict rebuilt with interned keys
+                            item = container[key] = {
+                                memo_get(k, k): v for k, v in item.items()}
+
+                        # Walk it later
+                        push(item)
+
+                    # If the item is a list
+                    elif type(item) is list:
+                        # Walk it later
+                        push(item)
+
+            # Return the value, and parsing end position
+            return value, end
+
+        # Before returning
+        finally:
+            # If keys are interned
+            if keys:
+                # End memo's document
+                end_document()
+
+            # If string values are interned
+            if value_memo is not None:
+                # End value memo's document
+                value_end_document()
+
+    # Return scanner function
+    return scan_once
+
+
+# Regular expression object to match the rest of a valid JSON string after its
+# starting `"`: characters other than `"`, `\` and control characters, and
+# valid escape sequences, until the ending `"`.
+STRING_RE = re.compile(
+    r'[^"\\\x00-\x1f]*'
+    r'(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"',
+    re.DOTALL)
+
+
+# Regular expression object to match the rest of a valid JSON string after its
+# starting `"`, allowing literal control characters.
+NONSTRICT_STRING_RE = re.compile(
+    r'[^"\\]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\]*)*"', re.DOTALL)
+
+
+#
+def py_make_validator(context):
+    # Validator function's factory function.
+    #
+    # The validator function checks the grammar of a JSON value, including
+    # string escapes, without creating any dict, list, str or number.
+    #
+    # @param context: Decoder object.
+    #
+    # @return: Validator function.
+
+    # Import here, as "json.decoder" module imports this module
+    from json.decoder import JSONDecodeError, WHITESPACE, WHITESPACE_STR
+
+    # Get parse string function
+    parse_string = context.parse_string
+
+    # Whether disallow literal control characters
+    strict = context.strict
+
+    # Get parse constant function
+    parse_constant = context.parse_constant
+
+    # Get match number function
+    match_number = NUMBER_RE.match
+
+    # Get match string function
+    match_string = (STRING_RE if strict else NONSTRICT_STRING_RE).match
+
+    # Get white space match function
+    _w = WHITESPACE.match
+
+    # White space characters
+    _ws = WHITESPACE_STR
+
+    # Create string validator function
+    def _check_string(string, idx):
+        # Validate a string.
+        #
+        # @param string: JSON data.
+        #
+        # @param idx: Position after the string's starting `"`.
+        #
+        # @return: Parsing end position.
+
+        # Match the rest of the string
+        m = match_string(string, idx)
+
+        # If no match result
+        if m is None:
+            # Parse the string to raise the error at its position.
+            # Return parsing end position if the string is valid after all.
+            return parse_string(string, idx, strict)[1]
+
+        # Return parsing end position
+        return m.end()
+
+    # Create property name validator function
+    def _check_key(string, end):
+        # Validate a property name and the following `:`.
+        #
+        # @param string: JSON data.
+        #
+        # @param end: Position after the property name's starting `"`.
+        #
+        # @return: Position of the member's value.
+
+        # Validate the property name, get parsing end position
+        end = _check_string(string, end)
+
+        # If the next character is not `:`
+        if string[end:end + 1] != ':':
+            # Skip white spaces
+            end = _w(string, end).end()
+
+            # If the next character is not `:`
+            if string[end:end + 1] != ':':
+                # Raise error
+                raise JSONDecodeError("Expecting ':' delimiter", string, end)
+
+        # Skip the `:`, and white spaces.
+        # Return the position.
+        return _w(string, end + 1).end()
+
+    # Create validator function
+    def validate_once(string, idx):
+        # Validate the JSON value at given position.
+        #
+        # Nested containers are tracked by an explicit stack, so deep
+        # documents do not hit the recursion limit.
+        #
+        # @param string: JSON data.
+        #
+        # @param idx: JSON data's parsing position.
+        #
+        # @return: Parsing end position.
+
+        # Stack of open containers. True for object, False for array.
+        stack = []
+
+        # Parsing end position
+        end = idx
+
+        # Loop for each value
+        while True:
+            # Get the value's first character
+            nextchar = string[end:end + 1]
+
+            # If the character is starting `"` of JSON string
+            if nextchar == '"':
+                # Validate the string, get parsing end position
+                end = _check_string(string, end + 1)
+
+            # If the character is starting `{` of JSON object
+            elif nextchar == '{':
+                # Skip the `{`, and white spaces
+                end = _w(string, end + 1).end()
+
+                # Get the next character
+                nextchar = string[end:end + 1]
+
+                # If the next character is `"`
+                if nextchar == '"':
+                    # Push the object
+                    stack.append(True)
+
+                    # Validate the first property name
+                    end = _check_key(string, end + 1)
+
+                    # Continue with the member's value
+                    continue
+
+                # If the next character is not ending `}` of JSON object
+                if nextchar != '}':
+                    # Raise error
+                    raise JSONDecodeError(
+                        "Expecting property name enclosed in double quotes",
+                        string, end)
+
+                # Skip the `}`
+                end += 1
+
+            # If the character is starting `[` of JSON array
+            elif nextchar == '[':
+                # Skip the `[`, and white spaces
+                end = _w(string, end + 1).end()
+
+                # If the next character is not ending `]` of JSON array
+                if string[end:end + 1] != ']':
+                    # Push the array
+                    stack.append(False)
+
+                    # Continue with the first element
+                    continue
+
+                # Skip the `]`
+                end += 1
+
+            # If next symbol is "null"
+            elif nextchar == 'n' and string.startswith('null', end):
+                # Skip the symbol
+                end += 4
+
+            # If next symbol is "true"
+            elif nextchar == 't' and string.startswith('true', end):
+                # Skip the symbol
+                end += 4
+
+            # If next symbol is "false"
+            elif nextchar == 'f' and string.startswith('false', end):
+                # Skip the symbol
+                end += 5
+
+            # If next symbol is not one of above
+            else:
+                # Match a number
+                m = match_number(string, end)
+
+                # If have match result
+                if m is not None:
+                    # Skip the number
+                    end = m.end()
+
+                # If no match result
+                else:
+                    # For each special float constant
+                    for name in ('NaN', 'Infinity', '-Infinity'):
+                        # If next symbol is the constant
+                        if string.startswith(name, end):
+                            # Call parse constant function, so that a
+                            # function rejecting the constant does here too
+                            parse_constant(name)
+
+                            # Skip the symbol
+                            end += len(name)
+
+                            # Stop finding
+                            break
+
+                    # If next symbol is no constant
+                    else:
+                        # If the value is top-level
+                        if not stack:
+                            # Raise StopIteration to notify caller
+                            raise StopIteration(end)
+
+                        # Raise error
+                        raise JSONDecodeError("Expecting value", string, end)
+
+            # While have open container
+            while stack:
+                # Get the next character
+                nextchar = string[end:end + 1]
+
+                # If the next character is white space
+                if nextchar in _ws:
+                    # Skip white spaces
+                    end = _w(string, end).end()
+
+                    # Get the next character
+                    nextchar = string[end:end + 1]
+
+                # Skip the next character
+                end += 1
+
+                # If the next character is `,`
+                if nextchar == ',':
+                    # Skip white spaces
+                    end = _w(string, end).end()
+
+                    # If the container is object
+                    if stack[-1]:
+                        # If the next character is not `"`
+                        if string[end:end + 1] != '"':
+                            # Raise error
+                            raise JSONDecodeError(
+                                "Expecting property name enclosed in double "
+                                "quotes", string, end)
+
+                        # Validate the next property name
+                        end = _check_key(string, end + 1)
+
+                    # Continue with the next value
+                    break
+
+                # If the next character is not the container's ending bracket
+                if nextchar != ('}' if stack[-1] else ']'):
+                    # Raise error
+                    raise JSONDecodeError(
+                        "Expecting ',' delimiter", string, end - 1)
+
+                # Pop the container
+                stack.pop()
+
+            # If have no open container
+            else:
+                # Return parsing end position
+                return end
+
+    # Return validator function
+    return validate_once
+
+
+# Validator function's factory function. No C version exists.
+make_validator = py_make_validator
+
+
+#
+def py_make_iterative_scanner(context):
+    # Iterative scanner function's factory function.
+    #
+    # The scanner function decodes like the one made by "py_make_scanner",
+    # except that nested containers are tracked by an explicit stack instead
+    # of recursive calls of parse object and parse array functions. Deep
+    # documents do not hit the recursion limit, and documents nested deeper
+    # than decoder's "max_depth" are rejected as soon as the limit is passed.
+    #
+    # @param context: Decoder object.
+    #
+    # @return: Scanner function.
+
+    # Import here, as "json.decoder" module imports this module
+    from json.decoder import JSONDecodeError, WHITESPACE, WHITESPACE_STR
+
+    # Get parse string function
+    parse_string = context.parse_string
+
+    # Get match number function
+    match_number = NUMBER_RE.match
+
+    # Whether disallow literal control characters
+    strict = context.strict
+
+    # Get parse float function
+    parse_float = context.parse_float
+
+    # Get parse int function
+    parse_int = context.parse_int
+
+    # Get parse constant function
+    parse_constant = context.parse_constant
+
+    # Get object hook function
+    object_hook = context.object_hook
+
+    # Get object pairs hook function
+    object_pairs_hook = context.object_pairs_hook
+
+    # Get maximum nesting depth of containers. None means no limit.
+    max_depth = context.max_depth
+
+    # Get memo for interning decoded object keys
+    memo = context.memo
+
+    # Cache memo's setdefault function
+    memo_get = memo.setdefault
+
+    # Get function to call after each document. A plain dict memo is cleared.
+    end_document = getattr(memo, 'end_document', memo.clear)
+
+    # Get maximum number of number literals cached per document. 0 means no
+    # cache.
+    number_cache_size = context.number_cache
+
+    # Map number literal to parsed value, within a document
+    number_cache = {}
+
+    # Cache number cache's get function
+    number_cache_get = number_cache.get
+
+    # Get memo for interning decoded string values, or None
+    value_memo = context.value_memo
+
+    # Get maximum length of interned string values
+    value_maxlen = context.value_maxlen
+
+    # If string values are interned
+    if value_memo is not None:
+        # Cache value memo's setdefault function
+        value_memo_get = value_memo.setdefault
+
+        # Get function to call after each document. A plain dict memo is
+        # cleared.
+        value_end_document = getattr(
+            value_memo, 'end_document', value_memo.clear)
+
+    # Get white space match function
+    _w = WHITESPACE.match
+
+    # White space characters
+    _ws = WHITESPACE_STR
+
+    # Create property name scanner function
+    def _scan_key(string, end):
+        # Decode a property name and skip the following `:`.
+        #
+        # @param string: JSON data.
+        #
+        # @param end: Position after the property name's starting `"`.
+        #
+        # @return: Property name, and position of the member's value.
+
+        # Decode the property name, get parsing end position
+        key, end = parse_string(string, end, strict)
+
+        # Cache the property name
+        key = memo_get(key, key)
+
+        # If the next character is not `:`
+        if string[end:end + 1] != ':':
+            # Skip white spaces
+            end = _w(string, end).end()
+
+            # If the next character is not `:`
+            if string[end:end + 1] != ':':
+                # Raise error
+                raise JSONDecodeError("Expecting ':' delimiter", string, end)
+
+        # Skip the `:`, and white spaces.
+        # Return the property name, and the position.
+        return key, _w(string, end + 1).end()
+
+    # Create object maker function
+    def _make_object(pairs):
+        # Create result object from property items like "JSONObject".
+        #
+        # @param pairs: A list of property items.
+        #
+        # @return: Result object.
+
+        # If object pairs hook function is given
+        if object_pairs_hook is not None:
+            # Call object pairs hook function to create result
+            return object_pairs_hook(pairs)
+
+        # Create result dict
+        pairs = dict(pairs)
+
+        # If object hook function is given
+        if object_hook is not None:
+            # Call object hook function
+            pairs = object_hook(pairs)
+
+        # Return the result dict
+        return pairs
+
+    # Create scanner function
+    def _scan_once(string, idx, depth):
+        # Scan the JSON value at given position.
+        #
+        # @param string: JSON data.
+        #
+        # @param idx: JSON data's parsing position.
+        #
+        # @param depth: Number of containers enclosing the value, counted
+        # toward "max_depth".
+        #
+        # @return: Parsed value, and parsing end position.
+
+        # Stack of containers being decoded. Each item is a list of
+        # (is_object, list of pairs or values, pending key).
+        stack = []
+
+        # Parsing end position
+        end = idx
+
+        # Loop for each value
+        while True:
+            # Get the value's first character
+            nextchar = string[end:end + 1]
+
+            # If the character is starting `"` of JSON string
+            if nextchar == '"':
+                # Decode the string, get parsing end position
+                value, end = parse_string(string, end + 1, strict)
+
+                # If string values are interned, and the string is short
+                # enough
+                if value_memo is not None and len(value) <= value_maxlen:
+                    # Get interned string
+                    value = value_memo_get(value, value)
+
+            # If the character is starting `{` or `[`
+            elif nextchar == '{' or nextchar == '[':
+                # If the container is nested too deep
+                if max_depth is not None and \
+                        depth + len(stack) >= max_depth:
+                    # Raise error
+                    raise JSONDecodeError(
+                        "Maximum nesting depth exceeded", string, end)
+
+                # Skip the starting character, and white spaces
+                end = _w(string, end + 1).end()
+
+                # If the container is object
+                if nextchar == '{':
+                    # Get the next character
+                    nextchar = string[end:end + 1]
+
+                    # If the next character is `"`
+                    if nextchar == '"':
+                        # Decode the first property name, get position of
+                        # its value
+                        key, end = _scan_key(string, end + 1)
+
+                        # Push the object
+                        stack.append([True, [], key])
+
+                        # Continue with the member's value
+                        continue
+
+                    # If the next character is not ending `}` of JSON object
+                    if nextchar != '}':
+                        # Raise error
+                        raise JSONDecodeError(
+                            "Expecting property name enclosed in double "
+                            "quotes", string, end)
+
+                    # Create empty result object
+                    value = _make_object([])
+
+                    # Skip the `}`
+                    end += 1
+
+                # If the container is array.
+
+                # If the next character is not ending `]` of JSON array
+                elif string[end:end + 1] != ']':
+                    # Push the array
+                    stack.append([False, [], None])
+
+                    # Continue with the first element
+                    continue
+
+                # If the array is empty
+                else:
+                    # Create empty result list
+                    value = []
+
+                    # Skip the `]`
+                    end += 1
+
+            # If next symbol is "null"
+            elif nextchar == 'n' and string[end:end + 4] == 'null':
+                # Get the value, and skip the symbol
+                value = None
+                end += 4
+
+            # If next symbol is "true"
+            elif nextchar == 't' and string[end:end + 4] == 'true':
+                # Get the value, and skip the symbol
+                value = True
+                end += 4
+
+            # If next symbol is "false"
+            elif nextchar == 'f' and string[end:end + 5] == 'false':
+                # Get the value, and skip the symbol
+                value = False
+                end += 5
+
+            # If next symbol is not one of above
+            else:
+                # Match a number
+                m = match_number(string, end)
+
+                # If have match result
+                if m is not None:
+                    # Get the number's text, which is one slice of the JSON
+                    # data
+                    number = m.group()
+
+                    # Get cached value if number cache is enabled
+                    value = (number_cache_get(number) if number_cache_size
+                             else None)
+
+                    # If the value is not cached
+                    if value is None:
+                        # If fraction part or exponent part exists
+                        if m.lastindex != 1:
+                            # Call parse float function
+                            value = parse_float(number)
+
+                        # If fraction part and exponent part not exist
+                        else:
+                            # Call parse int function
+                            value = parse_int(number)
+
+                        # If number cache is enabled and not full
+                        if (number_cache_size and
+                                len(number_cache) < number_cache_size):
+                            # Cache the value
+                            number_cache[number] = value
+
+                    # Get parsing end position
+                    end = m.end()
+
+                # If next symbol is "NaN"
+                elif nextchar == 'N' and string[end:end + 3] == 'NaN':
+                    # Call parse constant function, and skip the symbol
+                    value = parse_constant('NaN')
+                    end += 3
+
+                # If next symbol is "Infinity"
+                elif nextchar == 'I' and string[end:end + 8] == 'Infinity':
+                    # Call parse constant function, and skip the symbol
+                    value = parse_constant('Infinity')
+                    end += 8
+
+                # If next symbol is "-Infinity"
+                elif nextchar == '-' and string[end:end + 9] == '-Infinity':
+                    # Call parse constant function, and skip the symbol
+                    value = parse_constant('-Infinity')
+                    end += 9
+
+                # If the value is top-level
+                elif not stack:
+                    # Raise StopIteration to notify caller
+                    raise StopIteration(end)
+
+                # If the value is in a container
+                else:
+                    # Raise error
+                    raise JSONDecodeError("Expecting value", string, end)
+
+            # While have open container
+            while stack:
+                # Get the innermost container
+                frame = stack[-1]
+
+                # If the container is object
+                if frame[0]:
+                    # Add property item to pairs list
+                    frame[1].append((frame[2], value))
+
+                # If the container is array
+                else:
+                    # Add the value to values list
+                    frame[1].append(value)
+
+                # Get the next character
+                nextchar = string[end:end + 1]
+
+                # If the next character is white space
+                if nextchar in _ws:
+                    # Skip white spaces
+                    end = _w(string, end).end()
+
+                    # Get the next character
+                    nextchar = string[end:end + 1]
+
+                # Skip the next character
+                end += 1
+
+                # If the next character is `,`
+                if nextchar == ',':
+                    # Skip white spaces
+                    end = _w(string, end).end()
+
+                    # If the container is object
+                    if frame[0]:
+                        # If the next character is not `"`
+                        if string[end:end + 1] != '"':
+                            # Raise error
+                            raise JSONDecodeError(
+                                "Expecting property name enclosed in double "
+                                "quotes", string, end)
+
+                        # Decode the next property name, get position of
+                        # its value
+                        frame[2], end = _scan_key(string, end + 1)
+
+                    # Continue with the next value
+                    break
+
+                # If the next character is not the container's ending bracket
+                if nextchar != ('}' if frame[0] else ']'):
+                    # Raise error
+                    raise JSONDecodeError(
+                        "Expecting ',' delimiter", string, end - 1)
+
+                # Pop the container
+                stack.pop()
+
+                # If the container is object
+                if frame[0]:
+                    # Create result object
+                    value = _make_object(frame[1])
+
+                # If the container is array
+                else:
+                    # Use values list as result
+                    value = frame[1]
+
+                # Add the result to the outer container
+
+            # If have no open container
+            else:
+                # Return parsed value, and parsing end position
+                return value, end
+
+    # Create a wrapping function that ends memo's document after each call,
+    # like the one made by "py_make_scanner".
+    def scan_once(string, idx, depth=0):
+        # Scan the JSON value at given position.
+        #
+        # @param string: JSON data.
+        #
+        # @param idx: JSON data's parsing position.
+        #
+        # @param depth: Number of containers enclosing the value, counted
+        # toward "max_depth".
+        #
+        # @return: Parsed value, and parsing end position.
+        try:
+            # Return parsed value, and parsing end position
+            return _scan_once(string, idx, depth)
+        # Before returning
+        finally:
+            # End memo's document
+            end_document()
+
+            # Drop cached numbers
+            number_cache.clear()
+
+            # If string values are interned
+            if value_memo is not None:
+                # End value memo's document
+                value_end_document()
+
+    # Return scanner function
+    return scan_once
+
+
+# Iterative scanner function's factory function. No C version exists.
+make_iterative_scanner = py_make_iterative_scanner
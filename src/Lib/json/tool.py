@@ -8,6 +8,8 @@ Usage::
     }
     $ echo '{ 1.2:3.4}' | python -m json.tool
     Expecting property name enclosed in double quotes: line 1 column 3 (char 2)
+    $ echo '[1, 2' | python -m json.tool --validate
+    Expecting ',' delimiter: line 2 column 1 (char 6)
 
 """
 import argparse
@@ -37,26 +39,51 @@ def main():
     parser.add_argument('infile', nargs='?', type=argparse.FileType(),
                         help='a JSON file to be validated or pretty-printed')
 
-    #
-    parser.add_argument('outfile', nargs='?', type=argparse.FileType('w'),
+    # Opened only after infile is decoded, so that an error or "--validate"
+    # does not truncate it.
+    parser.add_argument('outfile', nargs='?',
                         help='write the output of infile to outfile')
 
     #
     parser.add_argument('--sort-keys', action='store_true', default=False,
                         help='sort the output of dictionaries alphabetically by key')
 
+    #
+    parser.add_argument('--validate', action='store_true', default=False,
+                        help='only check that infile is valid JSON, '
+                             'without building or writing it')
+
     # Parse command arguments
     options = parser.parse_args()
 
     # Get input file. Default is stdin.
     infile = options.infile or sys.stdin
 
-    # Get output file. Default is stdout.
-    outfile = options.outfile or sys.stdout
-
     # Whether sort dict keys
     sort_keys = options.sort_keys
 
+    # If only validate
+    if options.validate:
+        # If output file is given
+        if options.outfile is not None:
+            # Exit with usage error
+            parser.error('outfile can not be given with --validate')
+
+        # With input file context
+        with infile:
+            #
+            try:
+                # Validate JSON data in input file
+                json.validate(infile.read())
+
+            # If ValueError is raised
+            except ValueError as e:
+                # Raise SystemExit to exit
+                raise SystemExit(e)
+
+        # Return
+        return
+
     # With input file context
     with infile:
         #
@@ -78,6 +105,23 @@ def main():
             # Raise SystemExit to exit
             raise SystemExit(e)
 
+    # If output file is not given
+    if options.outfile is None:
+        # Use stdout
+        outfile = sys.stdout
+
+    # If output file is given
+    else:
+        #
+        try:
+            # Open output file, "-" meaning stdout
+            outfile = argparse.FileType('w')(options.outfile)
+
+        # If the file can not be opened
+        except argparse.ArgumentTypeError as e:
+            # Exit with usage error
+            parser.error(str(e))
+
     # With output file context
     with outfile:
         # Encode Python object JSON data with 4-space indentation.